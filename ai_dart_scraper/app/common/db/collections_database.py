@@ -4,14 +4,13 @@ from contextlib import contextmanager
 from typing import Optional
 import random
 
-from sqlalchemy import create_engine
 from sqlalchemy.dialects.mysql import insert
-from sqlalchemy.orm import sessionmaker
 from sqlalchemy.exc import SQLAlchemyError
 import pandas as pd
 
 from app.config.settings import COLLECTIONS_DB_URL
 from app.common.log.log_config import setup_logger
+from app.common.db.engine_registry import engine_registry
 from app.config.settings import FILE_PATHS
 from app.common.core.utils import get_current_datetime, make_dir
 from app.models_init import (
@@ -23,9 +22,14 @@ from app.common.db.companies_database import CompaniesDatabase
 
 
 class CollectionsDatabase:
-    def __init__(self) -> None:
-        self.engine = create_engine(COLLECTIONS_DB_URL, pool_recycle=3600, pool_size=20, max_overflow=0)
-        self.SessionLocal = sessionmaker(bind=self.engine)
+    def __init__(self, companies_db: CompaniesDatabase = None) -> None:
+        """
+        Args:
+            companies_db (CompaniesDatabase, optional): 이미 만든 CompaniesDatabase (없으면 새로 만듭니다)
+        """
+        # 커넥션 풀은 프로세스에서 DB마다 하나만 만들어 공유합니다.
+        self.engine = engine_registry.get_engine(COLLECTIONS_DB_URL)
+        self.SessionLocal = engine_registry.get_sessionmaker(COLLECTIONS_DB_URL)
         file_path = FILE_PATHS["log"] + 'database'
         make_dir(file_path)
         file_path += f'/collections_{get_current_datetime()}.log'
@@ -34,7 +38,8 @@ class CollectionsDatabase:
             file_path
         )
         self.last_queried_id_collectdart = None
-        self._companies_db = CompaniesDatabase()
+        # CompaniesDatabase는 생성 시 기업 목록을 조회하므로 이미 만든 객체가 있으면 그대로 사용합니다.
+        self._companies_db = companies_db or CompaniesDatabase()
         self._company_ids_from_newscrapcompanydartinfo = self._companies_db.company_ids_from_newscrapcompanydartinfo    # [company_id, ...]
 
     @contextmanager
@@ -1,22 +1,22 @@
 import traceback
 from contextlib import contextmanager
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
 from sqlalchemy.exc import SQLAlchemyError
 import pandas as pd
 
 from app.config.settings import COMPANIES_DB_URL
 from app.models_init import NewCompanyInfo, NewScrapCompanyDartInfo, CodeClass
 from app.common.log.log_config import setup_logger
+from app.common.db.engine_registry import engine_registry
 from app.config.settings import FILE_PATHS
 from app.common.core.utils import get_current_datetime, make_dir
 
 
 class CompaniesDatabase:
     def __init__(self) -> None:
-        self.engine = create_engine(COMPANIES_DB_URL, pool_recycle=3600, pool_size=20, max_overflow=0)
-        self.SessionLocal = sessionmaker(bind=self.engine)
+        # 커넥션 풀은 프로세스에서 DB마다 하나만 만들어 공유합니다.
+        self.engine = engine_registry.get_engine(COMPANIES_DB_URL)
+        self.SessionLocal = engine_registry.get_sessionmaker(COMPANIES_DB_URL)
 
         file_path = FILE_PATHS['log'] + 'database'
         make_dir(file_path)
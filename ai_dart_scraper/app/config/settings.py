@@ -25,6 +25,15 @@ companies_database = os.getenv('COMPANIES_DB_DATABASE')
 COLLECTIONS_DB_URL = f'mysql+pymysql://{username}:{password}@{host}:{port}/{collections_database}?charset=utf8mb4'
 COMPANIES_DB_URL = f'mysql+pymysql://{username}:{password}@{host}:{port}/{companies_database}?charset=utf8mb4'
 
+# DB URL별 공유 커넥션 풀 설정 (프로세스에서 URL마다 엔진 하나)
+# 스크래퍼의 DB 저장은 이벤트 루프에서 하나씩 실행되고 조회 API만 FastAPI 스레드에서 동시에 실행되므로 작게 유지합니다. (기존: DB 객체마다 20개)
+DB_ENGINE = {
+    'pool_size': int(os.getenv('DB_ENGINE_POOL_SIZE', 5)),
+    'max_overflow': int(os.getenv('DB_ENGINE_MAX_OVERFLOW', 5)),      # 잠깐 몰릴 때 더 열 수 있는 커넥션 수
+    'pool_timeout': float(os.getenv('DB_ENGINE_POOL_TIMEOUT', 30)),   # 커넥션을 기다리는 최대 시간(초)
+    'pool_recycle': int(os.getenv('DB_ENGINE_POOL_RECYCLE', 3600)),   # 커넥션 재연결 주기(초)
+}
+
 # 파일 경로
 FILE_PATHS = {
     'data': 'app/data/',
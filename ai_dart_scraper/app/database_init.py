@@ -1,5 +1,5 @@
 from app.common.db.collections_database import CollectionsDatabase
 from app.common.db.companies_database import CompaniesDatabase
 
-collections_db = CollectionsDatabase()
 companies_db = CompaniesDatabase()
+collections_db = CollectionsDatabase(companies_db)
@@ -11,6 +11,7 @@ from app.models_init import *
 from app.scrapers_init import *
 from app.database_init import *
 from app.common.db.base import BaseCollections, BaseCompanies
+from app.common.db.engine_registry import engine_registry
 from app.api.dart_info_routers import router as dart_info_router
 from app.api.dart_finance_routers import router as dart_finance_router
 from app.config.settings import FILE_PATHS, SYNOLOGY_CHAT
@@ -52,6 +53,12 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/stats/db_pools")
+async def db_pool_stats():
+    """DB별 커넥션 풀 사용량과 커넥션 대기 시간을 반환하는 함수"""
+    return engine_registry.get_stats()
+
+
 @app.get("/scrape/dart_info")
 async def scrape_dart_info(token: str = Depends(verify_token)):
     """OpenDartReader를 이용해 모든 기업의 기업 정보를 수집하는 함수"""
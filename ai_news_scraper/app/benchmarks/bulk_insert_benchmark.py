@@ -0,0 +1,110 @@
+"""
+NewsDatabase.save_data_bulk 벤치마크.
+기존 방식(기사마다 SELECT 후 bulk_save_objects)과 url_md5 IN 조회 한 번 후
+새 행만 multi-row INSERT 하는 방식(url_md5 충돌만 무시)의 저장 시간을 비교합니다.
+
+실행 (ai_news_scraper 디렉토리에서):
+    python -m app.benchmarks.bulk_insert_benchmark --rows 10000 --dup-ratio 0.5
+    python -m app.benchmarks.bulk_insert_benchmark --db-url "mysql+pymysql://user:pw@host:3306/bench_db"
+
+주의: 벤치마크 DB의 뉴스 테이블을 삭제 후 다시 생성하므로 운영 DB를 사용하면 안 됩니다.
+"""
+import argparse
+import hashlib
+import os
+import tempfile
+import time
+
+from app.config.settings import NEWS_DB_URL
+from app.common.db.base import BaseScraper
+from app.common.db.news_database import NewsDatabase
+from app.models_init import EtcNews
+
+
+def make_news_data(start: int, count: int) -> list:
+    """벤치마크용 뉴스 데이터 객체를 생성하는 함수"""
+    news_data_list = []
+    for i in range(start, start + count):
+        url = f"https://bench.example.com/news/{i}"
+        news_data_list.append(EtcNews(
+            id=i + 1,
+            url=url,
+            url_md5=hashlib.md5(url.encode()).hexdigest(),
+            title=f"벤치마크 기사 {i}",
+            content="본문 " * 200,
+            kind="999999",
+            portal="bench",
+            media="bench",
+            norm_title=f"벤치마크 기사 {i}",
+        ))
+    return news_data_list
+
+
+def legacy_save_data_bulk(news_db: NewsDatabase, news_data_list: list) -> int:
+    """기존 save_data_bulk 방식: 기사마다 SELECT로 중복을 확인하고 bulk_save_objects로 저장"""
+    session = news_db.SessionLocal()
+    try:
+        to_add = []
+        for news_data in news_data_list:
+            existing_data = session.query(EtcNews).filter(EtcNews.url_md5 == news_data.url_md5).first()
+            if not existing_data:
+                to_add.append(news_data)
+        session.bulk_save_objects(to_add)
+        session.commit()
+        return len(to_add)
+    finally:
+        session.close()
+
+
+def prepare_database(news_db: NewsDatabase, existing_count: int) -> None:
+    """뉴스 테이블을 다시 만들고 이미 저장된 기사(중복 대상)를 넣는 함수"""
+    BaseScraper.metadata.drop_all(news_db.engine, tables=[EtcNews.__table__])
+    BaseScraper.metadata.create_all(news_db.engine, tables=[EtcNews.__table__])
+    session = news_db.SessionLocal()
+    try:
+        session.bulk_save_objects(make_news_data(0, existing_count))
+        session.commit()
+    finally:
+        session.close()
+
+
+def run_benchmark(db_url: str, rows: int, dup_ratio: float) -> None:
+    # 설정의 뉴스 DB가 아닌 --db-url(기본값: 임시 sqlite 파일)로 연결합니다.
+    news_db = NewsDatabase(db_url)
+
+    existing_count = int(rows * dup_ratio)
+    print(f"DB: {news_db.engine.url.render_as_string(hide_password=True)}")
+    print(f"ROWS: {rows}, ALREADY IN DB: {existing_count}")
+
+    prepare_database(news_db, existing_count)
+    news_data_list = make_news_data(0, rows)
+    started = time.perf_counter()
+    inserted = legacy_save_data_bulk(news_db, news_data_list)
+    legacy_elapsed = time.perf_counter() - started
+    print(f"LEGACY (SELECT PER ROW + bulk_save_objects): {legacy_elapsed:.3f}s, inserted={inserted}")
+
+    prepare_database(news_db, existing_count)
+    news_data_list = make_news_data(0, rows)
+    started = time.perf_counter()
+    counts = news_db.save_data_bulk(news_data_list, 'bench')
+    bulk_elapsed = time.perf_counter() - started
+    print(f"IN LOOKUP + MULTI-ROW INSERT: {bulk_elapsed:.3f}s, {counts}")
+
+    print(f"SPEEDUP: {legacy_elapsed / bulk_elapsed:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="save_data_bulk benchmark")
+    parser.add_argument('--db-url', default=None, help="벤치마크 DB URL (기본값: 임시 sqlite 파일)")
+    parser.add_argument('--rows', type=int, default=10000)
+    parser.add_argument('--dup-ratio', type=float, default=0.5, help="이미 DB에 있는 기사 비율")
+    args = parser.parse_args()
+
+    if args.db_url == NEWS_DB_URL:
+        raise SystemExit("DO NOT RUN THE BENCHMARK AGAINST THE NEWS DATABASE")
+
+    if args.db_url:
+        run_benchmark(args.db_url, args.rows, args.dup_ratio)
+    else:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            run_benchmark(f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}", args.rows, args.dup_ratio)
@@ -0,0 +1,180 @@
+"""
+날짜 파싱 벤치마크.
+esg_finance/missing 스크래퍼의 기존 preprocess_datetime_* 순차 시도 방식과
+형식을 학습하는 DateParser의 결과가 같은지 확인하고 문자열당 처리 시간을 비교합니다.
+
+실행 (ai_news_scraper 디렉토리에서):
+    python -m app.benchmarks.date_parser_benchmark                          # 내장 샘플
+    python -m app.benchmarks.date_parser_benchmark --portal esg_finance_hub --limit 50000
+    python -m app.benchmarks.date_parser_benchmark --corpus create_dates.tsv   # "매체<TAB>날짜" 한 줄씩
+
+--portal은 뉴스 테이블의 최근 기사에서 (media, create_date)를 읽습니다.
+어떤 코퍼스든 형식마다 다르게 읽는 문자열(PARITY_CASES)을 함께 확인합니다.
+저장된 create_date는 이미 변환된 값이므로, 스크랩 원문 날짜는 --corpus 파일로 넣으세요.
+"""
+import argparse
+import random
+import time
+
+from app.common.core.utils import (
+    preprocess_datetime_iso,
+    preprocess_datetime_compact,
+    preprocess_datetime_compact_with_seperator,
+    preprocess_datetime_rfc2822,
+    preprocess_datetime_rfc3339,
+    preprocess_datetime_standard,
+    preprocess_datetime_standard_without_seconds,
+    preprocess_datetime_korean_without_seconds,
+    preprocess_datetime_period_without_seconds,
+    preprocess_date_period,
+    preprocess_datetime_eng_without_seconds,
+)
+from app.common.core.date_parser import DateParser, ESG_MEDIA_DATE_FORMATS
+
+
+LEGACY_CASCADE = [
+    preprocess_datetime_iso,
+    preprocess_datetime_compact,
+    preprocess_datetime_compact_with_seperator,
+    preprocess_datetime_rfc2822,
+    preprocess_datetime_rfc3339,
+    preprocess_datetime_standard,
+    preprocess_datetime_standard_without_seconds,
+    preprocess_datetime_korean_without_seconds,
+    preprocess_datetime_period_without_seconds,
+    preprocess_date_period,
+    preprocess_datetime_eng_without_seconds,
+]
+
+# 매체별 후처리 후의 create_date 모양 (내장 샘플)
+SAMPLE_SHAPES = {
+    'daily_hankooki': "{Y}-{m}-{d}T{H}:{M}:{S}+09:00",
+    'dt': "{Y}-{m}-{d} {H}:{M}",
+    'metroseoul': "{Y}-{m}-{d} {H}:{M}:{S}",
+    'kjdaily': "{Y}.{m}.{d} {H}:{M}",
+    'the bell': "{Y}-{m}-{d} {H}:{M}:{S}",
+    'naeil': "{Y}년{m}월{d}일 {H}:{M}",
+    'theguardian': "{Y}-{m}-{d}T{H}:{M}:{S}",
+    'bbc': "Fri, {d} Jan {Y} {H}:{M}:{S} GMT",
+    'wowtv': "{Y}.{m}.{d}",
+    'news_mtn': "{Y}{m}{d}{H}{M}{S}",
+    'usatoday': "{h}:{M} a.m. ET Jan. {d}, {Y}",
+}
+
+# 형식마다 다르게 읽는 문자열 (형식을 학습한 뒤에도 기존 순서대로 시도한 결과와 같은지 확인합니다)
+PARITY_CASES = [
+    ('news_mtn', "20241001121212"),                 # compact 학습
+    ('news_mtn', "2024100101212"),                  # iso: 12:12:00, compact: 01:21:02
+    ('news_mtn', "2024100112112"),
+    ('compact_t', "2024101T121212"),                # compact_with_seperator 학습
+    ('compact_t', "20241001T2123"),                 # iso: 21:23:00, compact_with_seperator: 21:02:03
+    ('rfc', "Fri, 01 Jan 2024 12:12:12 GMT"),
+    ('rfc', "Fri, 01 Jan 0024 12:12:12 GMT"),       # rfc2822와 rfc3339가 다른 연도로 읽음
+]
+
+
+def legacy_preprocess_datetime(unprocessed_date: str):
+    """기존 방식: 모든 형식을 차례로 시도"""
+    for preprocess in LEGACY_CASCADE:
+        processed_date = preprocess(unprocessed_date)
+        if processed_date:
+            return processed_date
+    return None
+
+
+def make_sample_corpus(count: int) -> list:
+    """내장 샘플 (매체, 날짜 문자열) 리스트를 만드는 함수"""
+    random.seed(0)
+    corpus = []
+    media_names = list(SAMPLE_SHAPES)
+    for _ in range(count):
+        media_name = random.choice(media_names)
+        corpus.append((media_name, SAMPLE_SHAPES[media_name].format(
+            Y=random.randint(2015, 2024),
+            m=f"{random.randint(1, 12):02d}",
+            d=f"{random.randint(1, 28):02d}",
+            H=f"{random.randint(0, 23):02d}",
+            h=random.randint(1, 12),
+            M=f"{random.randint(0, 59):02d}",
+            S=f"{random.randint(0, 59):02d}",
+        )))
+    return corpus
+
+
+def load_corpus_file(path: str) -> list:
+    """'매체<TAB>날짜' 또는 '날짜' 한 줄씩 적힌 파일을 읽는 함수"""
+    corpus = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.rstrip('\n')
+            if not line:
+                continue
+            media_name, _, date_str = line.rpartition('\t')
+            corpus.append((media_name or None, date_str))
+    return corpus
+
+
+def load_corpus_from_db(portal: str, limit: int) -> list:
+    """뉴스 테이블의 최근 기사에서 (매체, create_date 문자열)을 읽는 함수"""
+    from app.common.db.news_database import NewsDatabase
+
+    news_db = NewsDatabase()
+    model = news_db.get_news_model(portal)
+    if model is None:
+        raise SystemExit(f"NEWS TABLE IS NOT REGISTERED FOR {portal}")
+    session = news_db.SessionLocal()
+    try:
+        rows = session.query(model.media, model.create_date).filter(model.create_date.isnot(None)).order_by(model.id.desc()).limit(limit).all()
+        return [(media_name, str(create_date)) for media_name, create_date in rows]
+    finally:
+        session.close()
+
+
+def run_benchmark(corpus: list, rounds: int) -> None:
+    date_parser = DateParser(ESG_MEDIA_DATE_FORMATS)
+    print(f"CORPUS: {len(corpus)} DATE STRINGS, {len({media_name for media_name, _ in corpus})} MEDIA")
+
+    mismatches = [
+        (media_name, date_str)
+        for media_name, date_str in corpus
+        if legacy_preprocess_datetime(date_str) != date_parser.parse(date_str, key=media_name)
+    ]
+    print(f"MISMATCHES: {len(mismatches)}")
+    for media_name, date_str in mismatches[:10]:
+        print(f"  [{media_name}] {date_str!r}")
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for _, date_str in corpus:
+            legacy_preprocess_datetime(date_str)
+    legacy_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for media_name, date_str in corpus:
+            date_parser.parse(date_str, key=media_name)
+    parser_elapsed = time.perf_counter() - started
+
+    calls = len(corpus) * rounds
+    print(f"LEGACY CASCADE: {legacy_elapsed / calls * 1e6:.2f}us/date")
+    print(f"DATE PARSER: {parser_elapsed / calls * 1e6:.2f}us/date")
+    print(f"SPEEDUP: {legacy_elapsed / parser_elapsed:.1f}x")
+    print(f"DATE PARSER STATS: {date_parser.get_stats()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="date parser benchmark")
+    parser.add_argument('--corpus', default=None, help="'매체<TAB>날짜' 형식의 날짜 문자열 파일")
+    parser.add_argument('--portal', default=None, help="create_date를 읽을 뉴스 테이블의 포털 이름")
+    parser.add_argument('--limit', type=int, default=20000, help="--portal로 읽을 최근 기사 수")
+    parser.add_argument('--samples', type=int, default=20000, help="내장 샘플 수")
+    parser.add_argument('--rounds', type=int, default=3)
+    args = parser.parse_args()
+
+    if args.corpus:
+        corpus = load_corpus_file(args.corpus)
+    elif args.portal:
+        corpus = load_corpus_from_db(args.portal, args.limit)
+    else:
+        corpus = make_sample_corpus(args.samples)
+    run_benchmark(corpus + PARITY_CASES, args.rounds)
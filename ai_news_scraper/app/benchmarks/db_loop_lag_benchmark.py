@@ -0,0 +1,132 @@
+"""
+DB 호출 이벤트 루프 지연(loop lag) 벤치마크.
+여러 스크래퍼가 기사를 가져오면서(asyncio.sleep으로 대신함) 뉴스 저장, 세션 로그 저장 같은 DB 호출을 하는 상황에서
+이벤트 루프가 얼마나 늦게 깨어나는지 측정합니다.
+DB 호출을 이벤트 루프에서 직접 실행하는 기존 방식과 db_executor(DB 스레드 풀)에서 실행하는 방식을 비교합니다.
+
+실행 (ai_news_scraper 디렉토리에서):
+    python -m app.benchmarks.db_loop_lag_benchmark --scrapers 10 --cycles 20 --db-latency 0.05
+    python -m app.benchmarks.db_loop_lag_benchmark --db-url "mysql+pymysql://user:pw@host:3306/bench_db"
+
+--db-latency는 쿼리마다 더하는 네트워크 왕복 시간(초)입니다. 임시 sqlite 파일은 같은 서버의 MySQL보다 빠르므로
+원격 DB의 왕복 시간을 흉내 내기 위해 사용합니다. (실제 DB를 사용하면 0으로 두어도 됩니다)
+주의: 벤치마크 DB의 뉴스 테이블을 삭제 후 다시 생성하므로 운영 DB를 사용하면 안 됩니다.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.config.settings import NEWS_DB_URL
+from app.common.db.base import BaseScraper
+from app.common.db.db_executor import DatabaseExecutor
+from app.common.db.news_database import NewsDatabase
+from app.models_init import EtcNews
+from app.benchmarks.bulk_insert_benchmark import make_news_data
+
+
+async def measure_loop_lag(stop: asyncio.Event, interval: float, lags: list) -> None:
+    """interval초마다 깨어나서 예정보다 늦게 깨어난 시간(loop lag)을 기록하는 작업"""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        lags.append(max(0.0, loop.time() - expected))
+
+
+def save_batch(news_db: NewsDatabase, news_data_list: list, db_latency: float) -> dict:
+    """뉴스 데이터를 저장하는 동기 DB 호출 (db_latency만큼 왕복 시간을 더합니다)"""
+    if db_latency:
+        time.sleep(db_latency)
+    return news_db.save_data_bulk(news_data_list, 'bench')
+
+
+async def scraper(news_db: NewsDatabase, executor, index: int, args) -> None:
+    """기사 batch_size개를 가져온 뒤 저장하는 사이클을 반복하는 스크래퍼"""
+    for cycle in range(args.cycles):
+        # 기사 요청 (네트워크 대기)
+        await asyncio.sleep(args.fetch_time)
+        start = (index * args.cycles + cycle) * args.batch_size
+        news_data_list = make_news_data(start, args.batch_size)
+        if executor is None:
+            save_batch(news_db, news_data_list, args.db_latency)
+        else:
+            await executor.run(save_batch, news_db, news_data_list, args.db_latency)
+
+
+async def run_mode(news_db: NewsDatabase, executor, args) -> dict:
+    """스크래퍼들을 동시에 실행하면서 loop lag를 측정하는 함수"""
+    BaseScraper.metadata.drop_all(news_db.engine, tables=[EtcNews.__table__])
+    BaseScraper.metadata.create_all(news_db.engine, tables=[EtcNews.__table__])
+
+    stop = asyncio.Event()
+    lags = []
+    monitor = asyncio.create_task(measure_loop_lag(stop, args.interval, lags))
+    started = time.perf_counter()
+    await asyncio.gather(*(scraper(news_db, executor, i, args) for i in range(args.scrapers)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await monitor
+
+    lags.sort()
+    return {
+        'elapsed': elapsed,
+        'lag_mean_ms': statistics.mean(lags) * 1000 if lags else 0.0,
+        'lag_p99_ms': lags[int(len(lags) * 0.99) - 1] * 1000 if lags else 0.0,
+        'lag_max_ms': lags[-1] * 1000 if lags else 0.0,
+    }
+
+
+def print_result(name: str, result: dict) -> None:
+    print(
+        f"{name}: elapsed={result['elapsed']:.2f}s, "
+        f"loop lag mean={result['lag_mean_ms']:.1f}ms, p99={result['lag_p99_ms']:.1f}ms, max={result['lag_max_ms']:.1f}ms"
+    )
+
+
+def run_benchmark(db_url: str, args) -> None:
+    news_db = NewsDatabase()
+    news_db.engine = create_engine(db_url)
+    news_db.SessionLocal = sessionmaker(bind=news_db.engine)
+    print(f"DB: {news_db.engine.url.render_as_string(hide_password=True)}")
+    print(f"SCRAPERS: {args.scrapers}, CYCLES: {args.cycles}, BATCH SIZE: {args.batch_size}, DB LATENCY: {args.db_latency}s")
+
+    blocking = asyncio.run(run_mode(news_db, None, args))
+    print_result("BLOCKING (DB CALL ON EVENT LOOP)", blocking)
+
+    executor = DatabaseExecutor(max_workers=args.db_workers)
+    try:
+        threaded = asyncio.run(run_mode(news_db, executor, args))
+    finally:
+        executor.shutdown()
+    print_result(f"DB_EXECUTOR ({args.db_workers} THREADS)", threaded)
+
+    if threaded['lag_p99_ms']:
+        print(f"P99 LOOP LAG REDUCTION: {blocking['lag_p99_ms'] / threaded['lag_p99_ms']:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="DB call event loop lag benchmark")
+    parser.add_argument('--db-url', default=None, help="벤치마크 DB URL (기본값: 임시 sqlite 파일)")
+    parser.add_argument('--scrapers', type=int, default=10, help="동시에 실행할 스크래퍼 수")
+    parser.add_argument('--cycles', type=int, default=20, help="스크래퍼별 저장 횟수")
+    parser.add_argument('--batch-size', type=int, default=20, help="저장마다 넣을 기사 수")
+    parser.add_argument('--fetch-time', type=float, default=0.05, help="저장 사이의 기사 요청 시간(초)")
+    parser.add_argument('--db-latency', type=float, default=0.02, help="쿼리마다 더할 왕복 시간(초)")
+    parser.add_argument('--db-workers', type=int, default=1, help="DB 스레드 수 (sqlite는 1)")
+    parser.add_argument('--interval', type=float, default=0.005, help="loop lag 측정 주기(초)")
+    args = parser.parse_args()
+
+    if args.db_url == NEWS_DB_URL:
+        raise SystemExit("DO NOT RUN THE BENCHMARK AGAINST THE NEWS DATABASE")
+
+    if args.db_url:
+        run_benchmark(args.db_url, args)
+    else:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            run_benchmark(f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}", args)
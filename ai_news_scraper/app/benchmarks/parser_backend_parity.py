@@ -0,0 +1,109 @@
+"""
+파서 백엔드 동일성 검사 및 벤치마크.
+저장해 둔 기사 HTML 파일에 포털의 파싱 규칙을 적용하여
+각 파서 백엔드(lxml, lxml_strainer, selectolax)의 추출 결과가 기준(html.parser)과 같은지 확인하고
+파싱+추출 시간을 비교합니다. 결과가 모두 같은 포털만 PARSER_BACKEND_PORTALS로 하나씩 전환하세요.
+
+실행 (ai_news_scraper 디렉토리에서):
+    python -m app.benchmarks.parser_backend_parity --pages app/data/pages/naver --portal naver
+    python -m app.benchmarks.parser_backend_parity --pages app/data/pages/daum --rules daum_rules.json
+
+--rules 파일 형식: {"요소": ["bs", {"selector": "...", ...}], ...} (scrap_manager 파싱 규칙과 같은 구조)
+"""
+import argparse
+import glob
+import json
+import os
+import time
+
+from app.common.core.news_document import NewsDocument
+from app.common.core.parsing_rules import CompiledRuleSet, PARSER_BACKENDS, get_rule_key
+
+
+def load_rules_from_db(portal: str) -> dict:
+    """scrap_manager 테이블에서 포털의 bs 파싱 규칙을 불러오는 함수"""
+    from app.common.db.scraper_manager_database import ScraperManagerDatabase
+    from app.models_init import ScrapManager
+
+    session = ScraperManagerDatabase().SessionLocal()
+    try:
+        parsing_rules = session.query(ScrapManager).filter(ScrapManager.portal == portal).all()
+        return {
+            rule.parsing_target_name: (
+                rule.parsing_method,
+                json.loads(rule.parsing_rule) if isinstance(rule.parsing_rule, str) else rule.parsing_rule,
+            )
+            for rule in parsing_rules
+        }
+    finally:
+        session.close()
+
+
+def load_pages(pages_dir: str) -> list:
+    """저장해 둔 기사 HTML 파일을 읽는 함수"""
+    pages = []
+    for path in sorted(glob.glob(os.path.join(pages_dir, '*.htm*'))):
+        with open(path, 'rb') as f:
+            pages.append((path, f.read()))
+    return pages
+
+
+def extract_all(rule_set: CompiledRuleSet, pages: list, parser_backend: str, media_name: str) -> tuple:
+    """모든 페이지에서 bs 규칙 결과를 추출하고 걸린 시간을 반환하는 함수 (디코딩 시간은 제외)"""
+    documents = [NewsDocument(path, content, media_name=media_name) for path, content in pages]
+    for document in documents:
+        document.text
+    started = time.perf_counter()
+    results = [rule_set.extract(document, parser_backend=parser_backend) for document in documents]
+    return results, time.perf_counter() - started
+
+
+def run_parity(pages_dir: str, parsing_rules_dict: dict, media_name: str = None) -> bool:
+    # 파서 백엔드와 무관한 trafilatura 규칙은 제외합니다.
+    bs_rules_dict = {name: rule for name, rule in parsing_rules_dict.items() if rule[0] == 'bs'}
+    rule_set = CompiledRuleSet(get_rule_key(bs_rules_dict), bs_rules_dict)
+    pages = load_pages(pages_dir)
+    print(f"PAGES: {len(pages)}, BS RULES: {len(bs_rules_dict)}")
+    if not pages or not bs_rules_dict:
+        return False
+
+    baseline, baseline_elapsed = extract_all(rule_set, pages, 'html.parser', media_name)
+    print(f"html.parser: {baseline_elapsed:.3f}s (baseline)")
+
+    all_matched = True
+    for parser_backend in PARSER_BACKENDS[1:]:
+        resolved = rule_set.resolve_backend(parser_backend)
+        if resolved == 'html.parser':
+            print(f"{parser_backend}: NOT AVAILABLE FOR THESE RULES (FALLS BACK TO html.parser)")
+            continue
+        results, elapsed = extract_all(rule_set, pages, parser_backend, media_name)
+        mismatches = []
+        for (path, _), expected, actual in zip(pages, baseline, results):
+            for name, value in expected['data'].items():
+                if actual['data'].get(name) != value:
+                    mismatches.append((os.path.basename(path), name, value, actual['data'].get(name)))
+        label = parser_backend if resolved == parser_backend else f"{parser_backend} (AS {resolved})"
+        print(f"{label}: {elapsed:.3f}s, SPEEDUP {baseline_elapsed / elapsed:.1f}x, MISMATCHES: {len(mismatches)}")
+        for page, name, expected_value, actual_value in mismatches[:10]:
+            print(f"  {page} [{name}] EXPECTED {expected_value!r:.80} GOT {actual_value!r:.80}")
+        all_matched = all_matched and not mismatches
+    return all_matched
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="parser backend parity check")
+    parser.add_argument('--pages', required=True, help="기사 HTML 파일(*.html) 디렉토리")
+    parser.add_argument('--portal', default=None, help="scrap_manager에서 파싱 규칙을 불러올 포털 이름")
+    parser.add_argument('--rules', default=None, help="파싱 규칙 JSON 파일 (--portal 대신 사용)")
+    parser.add_argument('--media', default=None, help="매체 이름 (디코딩 규칙에 사용)")
+    args = parser.parse_args()
+
+    if args.rules:
+        with open(args.rules, encoding='utf-8') as f:
+            rules = {name: tuple(rule) for name, rule in json.load(f).items()}
+    elif args.portal:
+        rules = load_rules_from_db(args.portal)
+    else:
+        raise SystemExit("--portal OR --rules IS REQUIRED")
+
+    raise SystemExit(0 if run_parity(args.pages, rules, args.media) else 1)
@@ -0,0 +1,116 @@
+"""
+텍스트 정규화 벤치마크.
+utils.py의 기존 정규화 함수(normal_text, truncate_content, process_content, remove_emojis_and_special_chars)와
+text_normalization.normalize_batch의 결과가 같은지 확인하고 기사당 처리 시간을 비교합니다.
+
+실행 (ai_news_scraper 디렉토리에서):
+    python -m app.benchmarks.text_normalization_benchmark                          # 내장 샘플
+    python -m app.benchmarks.text_normalization_benchmark --portal naver --limit 5000
+    python -m app.benchmarks.text_normalization_benchmark --portal esg_finance_hub --no-process
+"""
+import argparse
+import random
+import time
+
+from app.common.core.utils import normal_text, truncate_content, process_content, remove_emojis_and_special_chars
+from app.common.core.text_normalization import normalize_batch
+
+
+SAMPLE_TITLES = [
+    "삼성전자, 3분기 영업이익 10조 돌파",
+    "韓銀 기준금리 동결…\"物價 안정 우선\"",
+    "ESG 경영 강화하는 金融권 📈",
+    "[단독] 스타트업 투자 혹한기, 政府 지원 확대",
+    "Climate tech 펀드 1000억 조성",
+]
+SAMPLE_SENTENCES = [
+    "정부는 올해 하반기 경제정책방향을 발표했다.",
+    "  관계자는 \"시장 상황을 지켜보고 있다\"고 말했다.",
+    "탄소중립 목표 달성을 위한 투자가 늘고 있다 🌱",
+    "&nbsp;자세한 내용은 홈페이지에서 확인할 수 있다.",
+    "홍길동 기자 hong@example.co.kr",
+    "ⓒ 뉴스 무단전재 및 재배포 금지",
+    "",
+]
+
+
+def legacy_normalize(title: str, content: str, process: bool) -> dict:
+    """기존 방식: utils.py 함수를 차례로 적용"""
+    norm_title = normal_text(title)
+    content = truncate_content(content)
+    if process:
+        content = process_content(content)
+    content = remove_emojis_and_special_chars(content)
+    return {'norm_title': norm_title, 'content': content}
+
+
+def make_sample_articles(count: int) -> list:
+    """내장 샘플 (제목, 본문) 리스트를 만드는 함수"""
+    random.seed(0)
+    articles = []
+    for _ in range(count):
+        lines = [random.choice(SAMPLE_SENTENCES) for _ in range(random.randint(10, 60))]
+        articles.append((random.choice(SAMPLE_TITLES), '\n'.join(lines)))
+    return articles
+
+
+def load_articles_from_db(portal: str, limit: int) -> list:
+    """뉴스 테이블의 최근 기사에서 (제목, 본문)을 읽는 함수"""
+    from app.common.db.news_database import NewsDatabase
+
+    news_db = NewsDatabase()
+    model = news_db.get_news_model(portal)
+    if model is None:
+        raise SystemExit(f"NEWS TABLE IS NOT REGISTERED FOR {portal}")
+    session = news_db.SessionLocal()
+    try:
+        rows = session.query(model.title, model.content).filter(model.title.isnot(None), model.content.isnot(None)).order_by(model.id.desc()).limit(limit).all()
+        return [(title, content) for title, content in rows]
+    finally:
+        session.close()
+
+
+def run_benchmark(articles: list, rounds: int, process: bool) -> None:
+    print(f"CORPUS: {len(articles)} ARTICLES, {sum(len(content) for _, content in articles)} CHARS")
+
+    normalized = normalize_batch(articles, process)
+    mismatches = [
+        title
+        for (title, content), result in zip(articles, normalized)
+        if legacy_normalize(title, content, process) != result
+    ]
+    print(f"MISMATCHES: {len(mismatches)}")
+    for title in mismatches[:10]:
+        print(f"  {title!r}")
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for title, content in articles:
+            legacy_normalize(title, content, process)
+    legacy_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        normalize_batch(articles, process)
+    batch_elapsed = time.perf_counter() - started
+
+    calls = len(articles) * rounds
+    print(f"LEGACY FUNCTIONS: {legacy_elapsed / calls * 1e6:.1f}us/article")
+    print(f"NORMALIZE BATCH: {batch_elapsed / calls * 1e6:.1f}us/article")
+    print(f"SPEEDUP: {legacy_elapsed / batch_elapsed:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="text normalization benchmark")
+    parser.add_argument('--portal', default=None, help="제목/본문을 읽을 뉴스 테이블의 포털 이름")
+    parser.add_argument('--limit', type=int, default=5000, help="--portal로 읽을 최근 기사 수")
+    parser.add_argument('--samples', type=int, default=5000, help="내장 샘플 수")
+    parser.add_argument('--rounds', type=int, default=3)
+    parser.add_argument('--no-process', dest='process', action='store_false', help="process_content를 적용하지 않는 스크래퍼(esg_finance) 기준으로 비교")
+    args = parser.parse_args()
+
+    if args.portal:
+        articles = load_articles_from_db(args.portal, args.limit)
+    else:
+        articles = make_sample_articles(args.samples)
+    run_benchmark(articles, args.rounds, args.process)
@@ -1,24 +1,50 @@
 import abc
 import datetime
-from typing import Generator, Optional
+from typing import List, NamedTuple, Optional
 import traceback
-import json
 import asyncio
-from collections import deque
+import contextvars
 import hashlib
 
 import aiohttp
-import requests
-from bs4 import BeautifulSoup
-from trafilatura import fetch_url, bare_extraction
 
 from app.common.log.log_config import setup_logger
 from app.common.db.news_database import NewsDatabase
 from app.common.db.scraper_manager_database import ScraperManagerDatabase
-from app.models_init import ScrapSessionLog, ScrapErrorLog, ScrapManager
+from app.common.db.db_executor import db_executor
+from app.common.db.engine_registry import engine_registry
+from app.models_init import ScrapSessionLog, ScrapErrorLog
 from app.config import settings
 from app.common.messages import Messages
-from app.common.core.utils import load_yaml, remove_emojis_and_special_chars
+from app.common.core.utils import load_yaml
+from app.common.core.http_client import http_client
+from app.common.core.news_document import NewsDocument, DocumentFetchError
+from app.common.core.extraction import select_element, extract_fields, normalize_fields, normalize_fields_batch, parse_feed, extract_feed_entries
+from app.common.core.extraction_executor import extraction_executor
+from app.common.core.parsing_rules import get_rule_set
+from app.common.core.parsing_rule_cache import parsing_rule_cache
+from app.common.core.concurrency_limiter import concurrency_limiter
+from app.common.core.host_rate_limiter import host_rate_limiter
+from app.common.core.poll_scheduler import PollScheduler
+from app.common.core.listing_watermark import listing_watermarks
+from app.common.core.listing_cache import listing_cache
+from app.common.core.sitemap import sitemap_source
+from app.common.core.url_index import url_index
+from app.common.core.news_writer import NewsWriter
+
+
+# 피드 우선 수집에서 기사 페이지 없이 뉴스 데이터를 만들 수 있는 필수 필드
+FEED_REQUIRED_FIELDS = ('title', 'content', 'create_date')
+# 사이트맵 날짜 워터마크를 저장하는 scrap_watermark 카테고리
+SITEMAP_WATERMARK_CATEGORY = 'sitemap'
+
+
+class ListingResponse(NamedTuple):
+    """게시판/피드 응답"""
+    status: int
+    content: bytes
+    charset: Optional[str]
+    not_modified: bool = False  # 304 응답이어서 저장해 둔 본문을 사용했는지 여부
 
 
 class NewsScraper(abc.ABC):
@@ -44,17 +70,32 @@ class NewsScraper(abc.ABC):
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36'
             }
+        # DB 커넥션 풀은 모든 스크래퍼가 공유합니다. (engine_registry)
         self.news_db = NewsDatabase()
         self.scraper_manager_db = ScraperManagerDatabase()
-        self.session = self.scraper_manager_db.SessionLocal()
-        self.news_data_list = []    # 뉴스 데이터 리스트
+        # 스크랩한 뉴스 데이터는 쓰기 큐에 넣고, 모아서 저장합니다.
+        self.news_writer = NewsWriter(self.scraper_name, self.save_news_batch, self.apply_save_counts, self.process_save_error)
 
         self.interval_time_sleep = 600   # 10분(600초)
         self.retry_delay = 5    # 5초
+        self.article_concurrency = settings.ARTICLE_WORKERS['scraper_concurrency']  # 동시에 스크랩할 기사 수
+        self.date_parser = None     # 날짜 형식을 학습하는 날짜 파서 (DateParser를 사용하는 스크래퍼만)
+        self._poll_scheduler = None  # 카테고리별 게시판 확인 주기 (처음 사용할 때 interval_time_sleep 기준으로 생성)
+        self.feed_urls = []     # 피드 우선 수집에 사용할 피드 URL (URLs의 'feed_urls', 없으면 게시판으로 수집)
+        self.feed_media = None  # 피드 엔트리의 media 값 (None이면 피드 제목)
+        self.feed_page_fetches = 0  # 피드에 없는 필드 때문에 기사 페이지를 가져온 수 (사이클마다 초기화)
+        self.sitemap_urls = []  # 게시판 대신 새 기사 URL을 찾을 사이트맵 URL (URLs의 'sitemap_urls')
+        self._pending_sitemap_date = None   # 기사를 저장 대기열에 넣은 뒤 옮길 사이트맵 워터마크 날짜
+        # 기사 HTML 파서 백엔드 (포털별 설정 > 기본 설정)
+        self.parser_backend = settings.PARSER_BACKEND['portals'].get(self.scraper_name, settings.PARSER_BACKEND['default'])
 
-        self.scraped_md5s = deque(maxlen=10000)  # 최근 스크래핑한 URL MD5 저장
+        # 스크래핑한 URL MD5는 모든 스크래퍼가 공유하는 url_index(뉴스 테이블별)에서 확인합니다.
+        self.news_model = self.news_db.get_news_model(self.scraper_name)
+        self.scraped_md5s = set()  # 뉴스 테이블이 등록되지 않은 스크래퍼용
 
-        self.is_duplicated = False  # 중복 여부
+        # 기사별 에러 로그 상태 (기사를 동시에 스크랩하므로 작업(컨텍스트)마다 분리합니다)
+        self._article_state = contextvars.ContextVar(f'{self.scraper_name}_article_state', default=None)
+        self._default_article_state = self._new_article_state("")
         # 세션 로그
         self.session_log = {
             "remarks": self.scraper_name,
@@ -63,14 +104,8 @@ class NewsScraper(abc.ABC):
 
         # 에러 로그
         self.error_logs = []
-        self.is_error = False
-        self.error_log = {
-            "error_message": "",
-            "error_time": None,
-            "url": None,
-        }
         self.initialize_error_log("")
-        self.parsing_rules_dict = self.get_parsing_rules_dict(self.scraper_name)
+        self.parsing_rules_portal = self.scraper_name   # 파싱 규칙을 가져올 scrap_manager 포털 이름
         category_data = load_yaml(settings.FILE_PATHS.get('category'))
         self.category_dict = category_data.get('category_dict')
         self.categories = category_data.get('categories').get(self.scraper_name)
@@ -79,19 +114,80 @@ class NewsScraper(abc.ABC):
             self.process_err_log_msg(err_message, "load_yaml")
             self.category_dict = {}
 
+    @staticmethod
+    def _new_article_state(news_url: str) -> dict:
+        """기사 하나의 에러 로그 상태를 생성하는 함수"""
+        return {
+            'error_log': {
+                'session_log_id': None,
+                'error_message': "",
+                'error_time': None,
+                'url': news_url,
+            },
+            'is_error': False,  # 에러 여부
+            'is_duplicated': False,  # 중복 여부
+        }
+
+    def _get_article_state(self) -> dict:
+        """현재 작업(컨텍스트)의 기사 상태를 반환하는 함수"""
+        state = self._article_state.get()
+        return state if state is not None else self._default_article_state
+
+    @property
+    def error_log(self) -> dict:
+        return self._get_article_state()['error_log']
+
+    @error_log.setter
+    def error_log(self, value: dict) -> None:
+        self._get_article_state()['error_log'] = value
+
+    @property
+    def is_error(self) -> bool:
+        return self._get_article_state()['is_error']
+
+    @is_error.setter
+    def is_error(self, value: bool) -> None:
+        self._get_article_state()['is_error'] = value
+
+    @property
+    def is_duplicated(self) -> bool:
+        return self._get_article_state()['is_duplicated']
+
+    @is_duplicated.setter
+    def is_duplicated(self, value: bool) -> None:
+        self._get_article_state()['is_duplicated'] = value
+
     # URL의 MD5 해시를 생성하는 함수
     def generate_md5(self, url: str) -> str:
         return hashlib.md5(url.encode()).hexdigest()
 
-    # 스크래핑 전 URL MD5 확인
-    def is_already_scraped(self, url: str) -> bool:
-        url_md5 = self.generate_md5(url)
-        return url_md5 in self.scraped_md5s
+    # 스크래핑 전 URL MD5 확인 (네트워크 요청 전에 확인합니다)
+    async def is_already_scraped(self, url: str) -> bool:
+        return await self.is_md5_scraped(self.generate_md5(url))
+
+    # URL MD5로 스크래핑 여부 확인
+    async def is_md5_scraped(self, url_md5: str) -> bool:
+        return url_md5 in await self.get_scraped_md5s([url_md5])
+
+    # 여러 URL MD5의 스크래핑 여부를 한 번에 확인 (메모리에 없는 MD5는 DB 스레드에서 IN 조회 한 번)
+    async def get_scraped_md5s(self, url_md5s) -> set:
+        if self.news_model is None:
+            return set(url_md5s) & self.scraped_md5s
+        return await url_index.get_scraped(self.news_model, url_md5s)
+
+    # 메모리에서만 URL MD5 확인 (get_scraped_md5s로 확인한 MD5와 이번 사이클에 스크랩한 MD5)
+    def is_md5_cached(self, url_md5: str) -> bool:
+        if self.news_model is None:
+            return url_md5 in self.scraped_md5s
+        return url_index.contains_cached(self.news_model, url_md5)
 
     # 스크래핑 후 URL MD5 저장
     def mark_as_scraped(self, url: str):
         url_md5 = self.generate_md5(url)
-        self.scraped_md5s.append(url_md5)
+        if self.news_model is None:
+            self.scraped_md5s.add(url_md5)
+        else:
+            url_index.add(self.news_model, url_md5)
 
     # 인포, 성공, 경고 메세지 > 로그 메세지 로직
     def process_info_log_msg(self, message: str, type: str="info") -> None:
@@ -126,31 +222,37 @@ class NewsScraper(abc.ABC):
 
     # 파싱 규칙 딕셔너리 가져오기
     def get_parsing_rules_dict(self, scraper_name: str = None) -> dict:
-        parsing_rules_dict = {}
-        try:
-            parsing_rules = self.session.query(ScrapManager).filter(ScrapManager.portal == scraper_name).all()
-            if not parsing_rules:
-                err_message = f"PARSING RULES IS EMPTY FOR {scraper_name}"
-                self.process_err_log_msg(err_message, "get_parsing_rules_dict")
-                return None
-
-            for parsing_rule in parsing_rules:
-                parsing_rule_dict = json.loads(parsing_rule.parsing_rule) if isinstance(parsing_rule.parsing_rule, str) else parsing_rule.parsing_rule
-
-                parsing_rules_dict[parsing_rule.parsing_target_name] = (
-                    parsing_rule.parsing_method,
-                    parsing_rule_dict,
-                )
-            info_message = f"PARSING RULES SUCCESSFULLY LOADED FOR {scraper_name}"
-            self.process_info_log_msg(info_message, "success")
-            print(info_message)
-            return parsing_rules_dict
+        """포털의 파싱 규칙 딕셔너리를 반환하는 함수
+        모든 스크래퍼가 공유하는 parsing_rule_cache에서 가져오므로 조회는 메모리에서 끝나고,
+        scrap_manager에서 수정한 규칙은 버전 확인 주기(settings.PARSING_RULE_CACHE) 안에 반영됩니다.
+        Args:
+            scraper_name (str): scrap_manager의 포털 이름
+        Returns:
+            dict: 파싱 규칙 딕셔너리 (규칙이 없으면 None)
+        """
+        return parsing_rule_cache.get(scraper_name) or None
 
-        except Exception as e:
-            stack_trace = traceback.format_exc()
-            err_message = f"THERE WAS AN ERROR WHILE TRANSFORMING PARSING RULES TO DICTIONARY FOR {scraper_name}"
-            self.process_err_log_msg(err_message, "get_parsing_rules_dict", stack_trace, e)
-            return None
+    @property
+    def parsing_rules_dict(self) -> dict:
+        """현재 파싱 규칙 포털(parsing_rules_portal)의 최신 파싱 규칙 딕셔너리"""
+        if not self.parsing_rules_portal:
+            return {}
+        return self.get_parsing_rules_dict(self.parsing_rules_portal) or {}
+
+    @property
+    def parsing_rules_portals(self) -> list:
+        """기사를 스크랩하기 전에 불러올 파싱 규칙 포털 리스트 (여러 포털의 규칙을 사용하는 스크래퍼는 재정의)"""
+        return [self.parsing_rules_portal] if self.parsing_rules_portal else []
+
+    # 파싱 규칙 미리 불러오기
+    async def warm_parsing_rules(self, *portals: str) -> None:
+        """캐시에 없는 파싱 규칙을 DB 스레드에서 불러오는 함수 (이벤트 루프에서 DB를 조회하지 않도록 규칙을 사용하기 전에 호출)
+        Args:
+            *portals (str): scrap_manager의 포털 이름. 없으면 parsing_rules_portals.
+        """
+        for portal in portals or self.parsing_rules_portals:
+            if portal:
+                await parsing_rule_cache.warm(portal)
 
     # 세션 로그 초기화
     def initialize_session_log(self) -> None:
@@ -161,7 +263,13 @@ class NewsScraper(abc.ABC):
         self.session_log['success_count'] = 0
         self.session_log['fail_count'] = 0
         self.session_log['dup_count'] = 0
+        # 기사 작업 밖(게시판, 피드, 사이트맵, 저장)의 에러 로그 상태도 사이클마다 새로 만듭니다.
+        self._default_article_state = self._new_article_state("")
         self.is_error = False  # 에러 여부 초기화
+        # 이번 사이클에 내려받은 게시판 본문 바이트와 확인한/바뀐 게시판 수
+        self.cycle_listing_bytes = 0
+        self.cycle_listings = 0
+        self.cycle_changed_listings = 0
 
         info_message = "SESSION LOG INITIALIZED"
         self.process_info_log_msg(info_message)
@@ -174,13 +282,8 @@ class NewsScraper(abc.ABC):
         Returns:
             error_log (dict): 에러 로그
         """
-        # 에러 로그 개별 초기화 로직
-        self.error_log['session_log_id'] = None
-        self.error_log['error_message'] = ""
-        self.error_log['error_time'] = None
-        self.error_log['url'] = news_url
-        self.is_error = False  # 에러 여부 초기화
-        self.is_duplicated = False  # 중복 여부 초기화
+        # 에러 로그 개별 초기화 로직 (현재 작업의 기사 상태만 새로 만듭니다)
+        self._article_state.set(self._new_article_state(news_url))
 
         info_message = f"ERROR LOG INITIALIZED FOR URL: {news_url}"
         self.process_info_log_msg(info_message)
@@ -211,24 +314,7 @@ class NewsScraper(abc.ABC):
             str 또는 list: 추출된 데이터.
         """
         try:
-            if selector:
-                element = soup.select_one(selector) if not find_all else soup.select(selector)
-            elif find and tag:
-                element = soup.find(tag, find_attributes) if not find_all else soup.find_all(tag, find_attributes)
-            else:
-                return default
-
-            if element:
-                if find_all:
-                    return [el.get(attribute_name, default) if attribute_name else el.get_text().strip() for el in element]
-                else:
-                    if attribute_name:
-                        return element.get(attribute_name, default)
-                    else:
-                        return element.get_text().strip()
-            else:
-                return default
-
+            return select_element(soup, selector, attribute_name, default, find, tag, find_attributes, find_all)
         except Exception as e:
             # 예외 발생 시 스택 트레이스 출력
             stack_trace = traceback.format_exc()
@@ -270,12 +356,22 @@ class NewsScraper(abc.ABC):
         if not parsing_rules_dict:
             parsing_rules_dict = self.parsing_rules_dict
 
+        # 컴파일된 파싱 규칙(포털별로 한 번만 컴파일)을 사용합니다.
+        fields_by_name = get_rule_set(parsing_rules_dict).fields_by_name
         extracted_data = {}
         for element in elements:
-            if parsing_rules_dict.get(element):
-                # 마지막 규칙을 사용하여 해당 요소를 추출합니다.
-                parsing_rule = parsing_rules_dict.get(element)[-1]
-                extracted_data[element] = self.extract_element(soup, parsing_rule)
+            field = fields_by_name.get(element)
+            if field is not None:
+                try:
+                    extracted_data[element] = field.extract(soup)
+                except Exception as e:
+                    stack_trace = traceback.format_exc()
+                    err_message = f"THERE WAS AN ERROR WHILE EXTRACTING DATA."
+                    self.process_err_log_msg(err_message, "safe_extract", stack_trace, e)
+
+                    warning_message = f"EXTRACTED DATA IS EMPTY. RETURNING DEFAULT VALUE: {field.default}. CHECK IF THE PARSING RULES ARE CORRECT."
+                    self.process_info_log_msg(warning_message, "warning")
+                    extracted_data[element] = field.default
             else:
                 err_message = f"PARSING RULES NOT FOUND FOR {element}"
                 self.process_err_log_msg(err_message, "extract_news_details")
@@ -283,11 +379,13 @@ class NewsScraper(abc.ABC):
         return extracted_data
 
     # 스크랩한 데이터를 데이터베이스에 저장하는 함수
-    def check_error(self, news_data: dict, news_url: str) -> None:
+    def check_error(self, news_data: dict, news_url: str) -> bool:
         """스크랩한 데이터를 데이터베이스에 저장하는 함수
         Args:
             news_data (dict): 뉴스 데이터
             news_url (str): 뉴스 기사 URL
+        Returns:
+            bool: 저장할 뉴스 데이터인지 여부
         """
         # news_data가 None이 아닐 경우에만 저장
         if not news_data:
@@ -295,8 +393,6 @@ class NewsScraper(abc.ABC):
             err_message = f"CANNOT SCRAP DATA FOR {news_url}"
             self.process_err_log_msg(err_message, "check_error")
         else:
-            news_data.content = remove_emojis_and_special_chars(news_data.content)
-            self.news_data_list.append(news_data)
             self.mark_as_scraped(news_url)
             success_message = f"NEWS DATA SUCCESSFULLY SCRAPED FOR {news_url}"
             self.process_info_log_msg(success_message, "success")
@@ -309,6 +405,83 @@ class NewsScraper(abc.ABC):
                 self.session_log['fail_count'] += 1
                 self.error_log['error_time'] = self.get_current_time()
                 self.error_logs.append(ScrapErrorLog(**self.error_log))
+        return bool(news_data)
+
+    # 기사 목록을 동시에 스크랩하는 함수
+    async def scrape_articles(self, items: list, scrape_func, get_url=None) -> set:
+        """기사 목록을 동시에 스크랩하는 함수
+        스크래퍼별 동시 실행 수(article_concurrency)와 프로세스 전체/호스트별 동시 실행 수(concurrency_limiter, host_rate_limiter)를 지키면서
+        기사마다 별도의 작업으로 실행합니다. 기사별 에러 로그 상태는 작업마다 분리되므로 check_error와 세션 로그 카운트는 순차 실행과 같습니다.
+        Args:
+            items (list): 뉴스 URL 또는 피드 엔트리 리스트
+            scrape_func (callable): 항목 하나를 받아 뉴스 데이터를 반환하는 코루틴 함수
+            get_url (callable, optional): 항목에서 뉴스 URL을 꺼내는 함수. Defaults to 항목 자체.
+        Returns:
+            set: 이미 스크랩한 기사가 아니어서 스크랩을 시도한 URL MD5 집합 (저장 성공 여부와 관계없음, record_poll이 새 기사 비율로 게시판 확인 주기를 정할 때 사용)
+        """
+        get_url = get_url or (lambda item: item)
+        semaphore = asyncio.Semaphore(max(1, self.article_concurrency))
+        in_progress = set()   # 스크랩 중인 URL MD5 (같은 사이클에 중복된 URL을 한 번만 스크랩)
+        new_md5s = set()
+        # 기사마다 DB를 조회하지 않도록 목록 전체의 스크랩 여부를 한 번에 확인합니다. (DB에 있는 MD5는 메모리 인덱스에 추가됨)
+        await self.get_scraped_md5s([self.generate_md5(get_url(item)) for item in items])
+        # 기사 작업에서 캐시에 없는 파싱 규칙을 조회하지 않도록 미리 불러옵니다. (이미 불러왔으면 메모리에서 끝남)
+        await self.warm_parsing_rules()
+
+        async def worker(item):
+            async with semaphore:
+                news_url = get_url(item)
+                if await self.scrape_article(news_url, scrape_func, item, in_progress):
+                    new_md5s.add(self.generate_md5(news_url))
+
+        await asyncio.gather(*(worker(item) for item in items))
+        return new_md5s
+
+    async def scrape_article(self, news_url: str, scrape_func, item, in_progress: set) -> bool:
+        """기사 하나를 스크랩하고 결과를 세션 로그에 반영하는 함수
+        Args:
+            news_url (str): 뉴스 기사 URL
+            scrape_func (callable): 항목 하나를 받아 뉴스 데이터를 반환하는 코루틴 함수
+            item: scrape_func에 넘길 항목 (뉴스 URL 또는 피드 엔트리)
+            in_progress (set): 스크랩 중인 URL MD5 집합
+        Returns:
+            bool: 중복이 아니어서 스크랩을 시도했는지 여부
+        """
+        news_data = None
+        url_md5 = self.generate_md5(news_url)
+
+        # 에러 로그 개별 초기화
+        self.initialize_error_log(news_url)
+
+        self.session_log['total_records_processed'] += 1
+        # scrape_articles가 목록 전체를 미리 확인했으므로 메모리에서만 확인합니다.
+        if self.is_md5_cached(url_md5) or url_md5 in in_progress:
+            self.is_duplicated = True
+            err_message = f"NEWS ALREADY EXISTS IN DATABASE: {news_url}"
+            self.process_err_log_msg(err_message, "scrape_news", "", "")
+            self.check_error(news_data, news_url)
+            return False
+
+        # 스크랩 중 표시는 표시를 추가한 이 작업만 지웁니다. (같은 URL의 다른 항목은 중복으로 처리)
+        in_progress.add(url_md5)
+        try:
+            try:
+                # 요청 간격은 호스트별 속도 조절기(host_rate_limiter)가 조절합니다.
+                async with concurrency_limiter.slot(news_url):
+                    news_data = await scrape_func(item)
+            except Exception as e:
+                stack_trace = traceback.format_exc()
+                err_message = f"THERE WAS AN ERROR WHILE SCRAPING NEWS: {news_url}"
+                self.process_err_log_msg(err_message, "scrape_article", stack_trace, e)
+                news_data = None
+
+            # 뉴스 데이터에 에러가 있으면, 에러 로그를 append하고, 그렇지 않으면 뉴스 데이터를 쓰기 큐에 넣음
+            # (쓰기 큐가 가득 차면 저장이 따라잡을 때까지 기다립니다)
+            if self.check_error(news_data, news_url):
+                await self.news_writer.put(news_data)
+        finally:
+            in_progress.discard(url_md5)
+        return True
 
     # 스크랩한 데이터 리스트를 데이터베이스에 저장하는 함수
     def save_news_data_bulk(self, news_data_list: list) -> None:
@@ -317,22 +490,107 @@ class NewsScraper(abc.ABC):
             news_data_list (list): 뉴스 데이터 리스트
         """
         try:
-            self.news_db.save_data_bulk(news_data_list, self.scraper_name)
-            self.session_log['success_count'] += len(news_data_list)
-            success_message = f"{len(news_data_list)} NEWS DATA SAVED FOR {self.scraper_name}"
-            self.process_info_log_msg(success_message, "success")
+            self.apply_save_counts(self.news_db.save_data_bulk(news_data_list, self.scraper_name))
         except Exception as e:
-            stack_trace = traceback.format_exc()
-            err_message = f"THERE WAS AN ERROR WHILE SAVING NEWS DATA FOR {self.scraper_name}"
-            self.process_err_log_msg(err_message, "save_news_data_bulk", stack_trace, e)
+            self.process_save_error(e, news_data_list)
+
+    # 뉴스 데이터 리스트를 DB 스레드에서 저장하고 저장 결과를 반환하는 함수 (쓰기 큐가 사용합니다)
+    async def save_news_batch(self, news_data_list: list) -> dict:
+        """뉴스 데이터 리스트를 DB 스레드에서 저장하고 저장 결과를 반환하는 함수
+        Args:
+            news_data_list (list): 뉴스 데이터 리스트
+        Returns:
+            dict: {'inserted': 저장된 수, 'duplicates': 이미 존재하여 무시된 수, 'failed': 저장에 실패한 수}
+        """
+        return await self.news_db.save_data_bulk_async(news_data_list, self.scraper_name)
+
+    # 저장 결과를 세션 로그에 반영하는 함수
+    def apply_save_counts(self, counts: dict, news_data_list: list = None) -> None:
+        """저장 결과를 세션 로그에 반영하는 함수
+        Args:
+            counts (dict): save_news_batch의 저장 결과
+            news_data_list (list, optional): 저장한 뉴스 데이터 리스트
+        """
+        # 이미 DB에 있던 기사는 중복, 저장하지 못한 기사는 실패로 셉니다.
+        self.session_log['success_count'] += counts['inserted']
+        self.session_log['dup_count'] += counts['duplicates']
+        self.session_log['fail_count'] += counts['failed']
+        success_message = f"{counts['inserted']} NEWS DATA SAVED FOR {self.scraper_name} ({counts['duplicates']} DUPLICATES, {counts['failed']} FAILED)"
+        self.process_info_log_msg(success_message, "success")
+
+    # 저장 중 발생한 에러를 기록하는 함수
+    def process_save_error(self, exception: Exception, news_data_list: list = None) -> None:
+        """저장 중 발생한 에러를 기록하는 함수
+        Args:
+            exception (Exception): 저장 중 발생한 예외
+            news_data_list (list, optional): 저장하지 못한 뉴스 데이터 리스트
+        """
+        news_data_list = news_data_list or []
+        stack_trace = ''.join(traceback.format_exception(type(exception), exception, exception.__traceback__))
+        err_message = f"THERE WAS AN ERROR WHILE SAVING {len(news_data_list)} NEWS DATA FOR {self.scraper_name}"
+        log_message = Messages.error_message(err_message, "save_news_data_bulk", stack_trace, exception)
+        self.logger.error(log_message)
+        # 쓰기 큐의 저장 작업은 기사별 상태가 없는 컨텍스트에서 실행되므로, 기사 상태(error_log)를 거치지 않고 기사마다 에러 로그를 남깁니다.
+        self.session_log['fail_count'] += len(news_data_list)
+        error_time = self.get_current_time()
+        for news_data in news_data_list:
+            self.error_logs.append(ScrapErrorLog(
+                session_log_id=None,
+                error_message=log_message,
+                error_time=error_time,
+                url=getattr(news_data, 'url', ""),
+                ))
+
+    # 쓰기 큐에 넣은 뉴스 데이터를 모두 저장하는 함수
+    async def flush_news_data(self) -> None:
+        """쓰기 큐에 넣은 뉴스 데이터를 모두 저장할 때까지 기다리는 함수
+        사이클을 마치기 전(finalize_session_log 전)에 호출하면 이번 사이클의 저장 결과가 모두 세션 로그에 반영됩니다.
+        """
+        await self.news_writer.flush()
 
     # 최종 세션 로그 저장 함수
-    def finalize_session_log(self) -> None:
-        """최종 세션 로그 저장 함수"""
+    async def finalize_session_log(self) -> None:
+        """최종 세션 로그 저장 함수 (세션/에러 로그는 DB 스레드에서 저장합니다)"""
         self.session_log['end_time'] = self.get_current_time()
+
+        # 공유 HTTP 클라이언트의 커넥션 재사용 통계와 추출 작업 통계
+        info_message = f"HTTP CLIENT STATS: {http_client.get_stats()}"
+        self.process_info_log_msg(info_message)
+        info_message = f"EXTRACTION EXECUTOR STATS: {extraction_executor.get_stats()}"
+        self.process_info_log_msg(info_message)
+        info_message = f"ARTICLE CONCURRENCY STATS: {concurrency_limiter.get_stats()}"
+        self.process_info_log_msg(info_message)
+        info_message = f"HOST RATE LIMITER STATS: {host_rate_limiter.get_stats()}"
+        self.process_info_log_msg(info_message)
+        info_message = f"POLL SCHEDULE: {self.poll_scheduler.get_stats()}"
+        self.process_info_log_msg(info_message)
+        info_message = f"NEWS WRITER STATS: {self.news_writer.get_stats()}"
+        self.process_info_log_msg(info_message)
+        info_message = f"DB EXECUTOR STATS: {db_executor.get_stats()}"
+        self.process_info_log_msg(info_message)
+        info_message = f"DB POOL STATS: {engine_registry.get_stats()}"
+        self.process_info_log_msg(info_message)
+        if self.cycle_listings:
+            listing_cache.record_cycle(self.cycle_listing_bytes, changed=self.cycle_changed_listings > 0)
+            info_message = f"LISTING BYTES THIS CYCLE: {self.cycle_listing_bytes} ({self.cycle_changed_listings}/{self.cycle_listings} LISTINGS CHANGED)"
+            self.process_info_log_msg(info_message)
+        info_message = f"LISTING CACHE STATS: {listing_cache.get_stats()}"
+        self.process_info_log_msg(info_message)
+        if self.sitemap_urls:
+            info_message = f"SITEMAP STATS: {sitemap_source.get_stats()}"
+            self.process_info_log_msg(info_message)
+        info_message = f"LISTING WATERMARK STATS: {listing_watermarks.get_stats()}"
+        self.process_info_log_msg(info_message)
+        info_message = f"URL INDEX STATS: {url_index.get_stats()}"
+        self.process_info_log_msg(info_message)
+        info_message = f"PARSING RULE CACHE STATS: {parsing_rule_cache.get_stats()}"
+        self.process_info_log_msg(info_message)
+        if self.date_parser is not None:
+            info_message = f"DATE PARSER STATS: {self.date_parser.get_stats()}"
+            self.process_info_log_msg(info_message)
         try:
             # 세션 로그 저장
-            session_log_id = self.scraper_manager_db.save_scrap_session_log(ScrapSessionLog(**self.session_log))
+            session_log_id = await self.scraper_manager_db.save_scrap_session_log_async(ScrapSessionLog(**self.session_log))
             success_message = f"SESSION LOG SAVED WITH ID: {session_log_id}"
             self.process_info_log_msg(success_message, "success")
 
@@ -342,7 +600,7 @@ class NewsScraper(abc.ABC):
                     error_log.session_log_id = session_log_id
 
                 # 에러 로그 저장
-                self.scraper_manager_db.save_scrap_error_logs(self.error_logs)
+                await self.scraper_manager_db.save_scrap_error_logs_async(self.error_logs)
                 success_message = f"ERROR LOGS SAVED FOR SESSION LOG ID: {session_log_id}"
                 self.process_info_log_msg(success_message, "success")
                 self.error_logs = []    # 에러 로그 리스트 초기화
@@ -353,10 +611,12 @@ class NewsScraper(abc.ABC):
             self.logger.error(log_message)
 
     # 재시도를 위한 비동기 함수 정의
-    async def fetch_url_with_retry(self, session: aiohttp.ClientSession, url: str, retries: int = 3) -> str:
+    async def fetch_url_with_retry(self, session: Optional[aiohttp.ClientSession], url: str, retries: int = 3) -> str:
         for attempt in range(retries):
             try:
-                async with session.get(url) as response:
+                # 세션을 넘기지 않으면 호스트별 속도 조절을 거치는 공유 HTTP 클라이언트를 사용합니다.
+                request = session.get(url) if session is not None else http_client.request(url)
+                async with request as response:
                     if response.status == 200:
                         return await response.text()
                     else:
@@ -367,35 +627,528 @@ class NewsScraper(abc.ABC):
                 else:
                     raise e
 
-    async def scrape_each_news_with_bs(self, news_url, elements, parsing_rules_dict=None):
+    # 게시판/피드 페이지를 비동기로 가져오는 함수
+    async def fetch_listing_response(self, url: str, headers: dict = None, params: dict = None, conditional: bool = True) -> Optional[ListingResponse]:
+        """게시판(목록) 페이지나 피드를 공유 HTTP 세션으로 가져오는 함수
+        conditional이면 지난 응답의 ETag/Last-Modified로 조건부 요청을 보내고, 304 응답이면 저장해 둔 본문을 상태 200으로 반환합니다.
+        Args:
+            url (str): 게시판/피드 URL
+            headers (dict, optional): 요청 헤더. Defaults to self.headers.
+            params (dict, optional): 쿼리 파라미터
+            conditional (bool, optional): 조건부 요청 여부. 검색 결과처럼 매번 다른 URL은 False. Defaults to True.
+        Returns:
+            ListingResponse: 응답 상태, 본문 바이트, charset, 304 여부. 요청 실패 시 None
+        """
+        key = listing_cache.get_key(url, params)
+        request_headers = headers or self.headers
+        if conditional:
+            request_headers = {**request_headers, **listing_cache.conditional_headers(key)}
+        try:
+            async with http_client.request(url, headers=request_headers, params=params) as response:
+                if conditional and response.status == 304:
+                    entry = listing_cache.get_not_modified(key)
+                    if entry is not None:
+                        return ListingResponse(200, entry.content, entry.charset, True)
+                content = await response.read()
+                self.cycle_listing_bytes += len(content)
+                if conditional and response.status == 200:
+                    listing_cache.store(key, response.headers, content, response.charset)
+                return ListingResponse(response.status, content, response.charset)
+        except Exception as e:
+            stack_trace = traceback.format_exc()
+            err_message = f"THERE WAS AN ERROR WHILE FETCHING LISTING: {url}"
+            self.process_err_log_msg(err_message, "fetch_listing_response", stack_trace, e)
+            return None
+
+    async def fetch_listing_content(self, url: str, headers: dict = None, params: dict = None) -> Optional[bytes]:
+        """게시판/피드 본문을 바이트로 가져오는 함수 (응답 상태가 200이 아니면 None)"""
+        response = await self.fetch_listing_response(url, headers=headers, params=params)
+        if response is None:
+            return None
+        if response.status != 200:
+            err_message = f"RESPONSE STATUS: {response.status} FOR LISTING URL: {url}"
+            self.process_err_log_msg(err_message, "fetch_listing_content", "", "")
+            return None
+        return response.content
+
+    async def fetch_listing(self, url: str, headers: dict = None, params: dict = None, encoding: str = None) -> Optional[str]:
+        """게시판 페이지를 문자열로 가져오는 함수
+        Args:
+            url (str): 게시판 URL
+            headers (dict, optional): 요청 헤더
+            params (dict, optional): 쿼리 파라미터
+            encoding (str, optional): 디코딩할 인코딩. 지정하지 않으면 응답 헤더의 charset, utf-8 순서로 사용합니다.
+        Returns:
+            str: 게시판 HTML. 실패 시 None
+        """
+        response = await self.fetch_listing_response(url, headers=headers, params=params)
+        if response is None:
+            return None
+        if response.status != 200:
+            err_message = f"RESPONSE STATUS: {response.status} FOR LISTING URL: {url}"
+            self.process_err_log_msg(err_message, "fetch_listing", "", "")
+            return None
+        return response.content.decode(encoding or response.charset or 'utf-8', 'ignore')
+
+    async def fetch_feed(self, url: str, headers: dict = None) -> Optional[list]:
+        """RSS/Atom 피드를 가져와 파싱하는 함수
+        Args:
+            url (str): 피드 URL
+            headers (dict, optional): 요청 헤더
+        Returns:
+            list: 피드 엔트리 리스트. 실패 시 None
+        """
+        content = await self.fetch_listing_content(url, headers=headers)
+        if content is None:
+            return None
+        # 피드 파싱은 이벤트 루프를 막지 않도록 추출 프로세스 풀에서 실행합니다.
+        result = await extraction_executor.run(parse_feed, content)
+        return result['entries']
+
+    async def fetch_feed_entries(self, url: str, headers: dict = None) -> Optional[dict]:
+        """피드를 가져와 추출 프로세스 풀에서 엔트리마다 뉴스 필드를 추출하는 함수
+        Args:
+            url (str): 피드 URL
+            headers (dict, optional): 요청 헤더
+        Returns:
+            dict: {'media': 피드 제목, 'entries': 뉴스 필드 dict 리스트}. 실패 시 None
+        """
+        content = await self.fetch_listing_content(url, headers=headers)
+        if content is None:
+            return None
+        return await extraction_executor.run(extract_feed_entries, content)
+
+    async def get_feed_entries(self) -> Optional[list]:
+        """self.feed_urls의 피드를 동시에 가져와 엔트리를 합치는 함수 (여러 피드에 올라온 기사는 한 번만)
+        Returns:
+            list: 뉴스 필드 dict 리스트 (최신 순). 가져온 엔트리가 없으면 None
+        """
+        if not self.feed_urls:
+            return None
+        results = await asyncio.gather(
+            *(self.fetch_feed_entries(feed_url) for feed_url in self.feed_urls),
+            return_exceptions=True,
+            )
+        entries = []
+        seen_urls = set()
+        for feed_url, result in zip(self.feed_urls, results):
+            if isinstance(result, Exception):
+                err_message = f"THERE WAS AN ERROR WHILE GETTING FEED ENTRIES FROM {feed_url}"
+                self.process_err_log_msg(err_message, "get_feed_entries", "", result)
+                continue
+            if result is None:
+                continue
+            for entry in result['entries']:
+                if entry['url'] in seen_urls:
+                    continue
+                seen_urls.add(entry['url'])
+                entry['media'] = self.feed_media or result['media']
+                entries.append(entry)
+
+        if not entries:
+            err_message = f"NO FEED ENTRIES WERE FOUND FROM {self.feed_urls}"
+            self.process_err_log_msg(err_message, "get_feed_entries", None, None)
+            return None
+        if len(self.feed_urls) > 1:
+            # 여러 피드를 합치면 워터마크가 최신 순으로 확인할 수 있도록 날짜순으로 정렬합니다.
+            entries.sort(key=lambda entry: entry['create_date'] or '', reverse=True)
+        return entries
+
+    async def scrape_each_feed_entry(self, feed_entry: dict) -> Optional[object]:
+        """피드 필드로 뉴스 데이터를 바로 만드는 함수 (피드에 없는 필수 필드가 있을 때만 기사 페이지를 가져옵니다)
+        Args:
+            feed_entry (dict): get_feed_entries가 반환한 뉴스 필드 dict
+        Returns:
+            뉴스 테이블 모델 객체. 필수 필드가 없으면 None
+        """
+        news_url = feed_entry['url']
+        info_message = f"SCRAPING STARTED FOR {news_url}"
+        self.process_info_log_msg(info_message, type="info")
+
+        fields = dict(feed_entry)
+        create_date = fields.get('create_date')     # 피드 날짜는 extract_feed_entries에서 이미 변환됩니다.
+        if any(not fields.get(field) for field in FEED_REQUIRED_FIELDS):
+            self.feed_page_fetches += 1
+            page_data = await self.scrape_each_news_with_document(news_url) or {}
+            for key, value in page_data.items():
+                if value and not fields.get(key):
+                    fields[key] = value
+            if not create_date and fields.get('create_date'):
+                create_date = self.preprocess_datetime(fields['create_date'])
+
+        title = fields.get('title')
+        content = fields.get('content')
+        # title이나 content, create_date가 없으면 다음 데이터로 넘어갑니다.
+        if any([not title, not content, not create_date]):
+            none_elements = [element for element in [title, content, create_date] if not element]
+            err_message = f"{none_elements} IS EMPTY FOR URL: {news_url}"
+            self.process_err_log_msg(err_message, "scrape_each_feed_entry", "", "")
+            return None
+
+        kinds = self.category_dict.get(self.scraper_name) or {}
+        kind_id = kinds.get(fields.get('kind')) or kinds.get("etc")
+        # 제목 정규화와 본문 정제는 추출 프로세스 풀에서 실행합니다.
+        normalized = await self.normalize_news_text(title, content)
+
+        return self.news_model(
+            url=news_url,
+            url_md5=self.generate_md5(news_url),
+            title=title,
+            content=normalized['content'],
+            create_date=create_date,
+            image_url=fields.get('image_url'),
+            portal=self.scraper_name,
+            media=fields.get('media'),
+            kind=kind_id,
+            norm_title=normalized['norm_title'],
+            )
+
+    async def scrape_feed_or_board(self) -> tuple:
+        """피드 우선 수집 함수
+        feed_urls가 있으면 피드 엔트리로 바로 뉴스 데이터를 만들고, 피드가 없거나 가져오지 못하면 사이트맵 또는 게시판(discover_news_urls)의 기사를 스크랩합니다.
+        Returns:
+            tuple: (피드/게시판 URL 리스트 (둘 다 실패하면 None), scrape_articles가 반환한 처음 보는 URL MD5 집합)
+        """
+        feed_entries = await self.get_feed_entries() if self.feed_urls else None
+        if feed_entries:
+            self.feed_page_fetches = 0
+            get_url = lambda entry: entry['url']
+            new_md5s = await self.scrape_articles(
+                await self.cut_at_watermark(None, feed_entries, get_url=get_url),
+                self.scrape_each_feed_entry,
+                get_url=get_url,
+                )
+            info_message = f"FEED INGESTION: {len(feed_entries)} ENTRIES, {self.feed_page_fetches} ARTICLE PAGES FETCHED FOR MISSING FIELDS"
+            self.process_info_log_msg(info_message)
+            return [entry['url'] for entry in feed_entries], new_md5s
+
+        news_urls = await self.discover_news_urls()
+        if not isinstance(news_urls, list):
+            return None, set()
+        # 워터마크(이미 확인한 구간) 전까지의 뉴스 URL에 대해 세부 정보를 동시에 스크랩
+        new_md5s = await self.scrape_articles(await self.cut_at_watermark(None, news_urls), self.scrape_each_news)
+        # 사이트맵에서 찾은 기사를 모두 저장 대기열에 넣은 뒤에 사이트맵 워터마크를 옮깁니다.
+        self.advance_sitemap_watermark()
+        return news_urls, new_md5s
+
+    async def get_sitemap_news_urls(self, since: datetime.datetime = None, until: datetime.datetime = None, advance: bool = True, max_urls: int = None) -> Optional[list]:
+        """사이트맵에서 since 이후에 올라온 기사 URL을 찾는 함수
+        Args:
+            since (datetime.datetime, optional): 이 날짜 이후의 기사만 찾습니다. Defaults to 사이트맵 워터마크 - overlap_minutes (워터마크가 없으면 lookback_hours 전).
+            until (datetime.datetime, optional): 이 날짜까지의 기사만 찾습니다.
+            advance (bool, optional): 반환한 가장 최신 날짜를 사이트맵 워터마크로 갱신할지 여부 (기사를 저장 대기열에 넣은 뒤 advance_sitemap_watermark에서 갱신). Defaults to True.
+            max_urls (int, optional): 반환할 최대 URL 수 (많으면 오래된 순으로 선택하고 나머지는 다음 확인에서 찾음). Defaults to settings.SITEMAP['max_urls'].
+        Returns:
+            list: 뉴스 URL 리스트 (최신 순). 사이트맵을 하나도 가져오지 못하면 None
+        """
+        watermark = None
+        if since is None:
+            await listing_watermarks.load(self.scraper_name)
+            watermark = listing_watermarks.get_date(self.scraper_name, SITEMAP_WATERMARK_CATEGORY)
+            if watermark is not None:
+                since = watermark - datetime.timedelta(minutes=settings.SITEMAP['overlap_minutes'])
+            else:
+                since = datetime.datetime.now() - datetime.timedelta(hours=settings.SITEMAP['lookback_hours'])
+
+        result = await sitemap_source.discover(self.sitemap_urls, since, until, headers=self.headers, max_urls=max_urls, resume_after=watermark)
+        for sitemap_url, error in result['errors']:
+            err_message = f"THERE WAS AN ERROR WHILE READING SITEMAP: {sitemap_url}"
+            self.process_err_log_msg(err_message, "get_sitemap_news_urls", "", error)
+        if not result['fetched']:
+            return None
+
+        if advance:
+            self._pending_sitemap_date = result['newest']
+        info_message = f"SITEMAP DISCOVERY FOR {self.scraper_name}: {len(result['entries'])} URLS SINCE {since:%Y-%m-%d %H:%M:%S}"
+        if result['truncated']:
+            info_message += f" (TRUNCATED, CONTINUING FROM {result['newest']:%Y-%m-%d %H:%M:%S} NEXT CYCLE)"
+        self.process_info_log_msg(info_message)
+        return [entry.loc for entry in result['entries']]
+
+    def advance_sitemap_watermark(self) -> None:
+        """get_sitemap_news_urls가 반환한 기사를 저장 대기열에 넣은 뒤 사이트맵 워터마크를 갱신하는 함수"""
+        newest_date, self._pending_sitemap_date = self._pending_sitemap_date, None
+        if newest_date is not None:
+            listing_watermarks.set_date(self.scraper_name, SITEMAP_WATERMARK_CATEGORY, newest_date)
+
+    async def discover_news_urls(self) -> Optional[list]:
+        """새 기사 URL을 찾는 함수 (sitemap_urls가 있으면 사이트맵, 없거나 가져오지 못하면 게시판(get_news_urls))"""
+        if self.sitemap_urls:
+            news_urls = await self.get_sitemap_news_urls()
+            if news_urls is not None:
+                return news_urls
+        return await self.get_news_urls()
+
+    async def backfill_from_sitemap(self, since: datetime.datetime, until: datetime.datetime = None, batch_size: int = 100) -> int:
+        """사이트맵으로 since ~ until 사이에 빠진 기사를 스크랩하는 함수 (사이트맵 워터마크는 바꾸지 않습니다)
+        Args:
+            since (datetime.datetime): 시작 날짜
+            until (datetime.datetime, optional): 끝 날짜
+            batch_size (int, optional): 한 번에 스크랩할 기사 수. Defaults to 100.
+        Returns:
+            int: 사이트맵에서 찾은 URL 수
+        """
+        self.initialize_session_log()
+        news_urls = await self.get_sitemap_news_urls(since, until, advance=False, max_urls=settings.SITEMAP['backfill_max_urls']) or []
+        for start in range(0, len(news_urls), batch_size):
+            await self.scrape_articles(news_urls[start:start + batch_size], self.scrape_each_news)
+        await self.flush_news_data()
+        await self.finalize_session_log()
+        return len(news_urls)
+
+    async def get_news_urls_by_category(self, categories: list) -> dict:
+        """모든 카테고리의 게시판을 동시에 가져오는 함수
+        Args:
+            categories (list): 카테고리 리스트
+        Returns:
+            dict: {카테고리: 뉴스 URL 리스트 (실패 시 None)}
+        """
+        results = await asyncio.gather(
+            *(self.get_news_urls(category) for category in categories),
+            return_exceptions=True,
+            )
+        category_news_urls = {}
+        for category, result in zip(categories, results):
+            if isinstance(result, Exception):
+                err_message = f"THERE WAS AN ERROR WHILE GETTING NEWS URLS FOR CATEGORY: {category}"
+                self.process_err_log_msg(err_message, "get_news_urls_by_category", "", result)
+                result = None
+            category_news_urls[category] = result
+        return category_news_urls
+
+    @property
+    def poll_scheduler(self) -> PollScheduler:
+        """카테고리별 게시판 확인 주기 조절기 (서브클래스가 정한 interval_time_sleep을 기본 주기로 사용)"""
+        if self._poll_scheduler is None:
+            self._poll_scheduler = PollScheduler(self.scraper_name, self.interval_time_sleep)
+        return self._poll_scheduler
+
+    def get_due_categories(self) -> list:
+        """이번 사이클에 게시판을 확인할 카테고리 리스트를 반환하는 함수"""
+        return self.poll_scheduler.due_categories(self.categories or [])
+
+    def record_poll(self, category, news_urls: list, new_md5s: set) -> None:
+        """게시판 확인 결과(가져온 URL 중 처음 보는 URL 수)로 카테고리의 확인 주기를 조절하는 함수
+        Args:
+            category (str): 카테고리 (카테고리가 없는 스크래퍼는 None)
+            news_urls (list): 게시판에서 가져온 뉴스 URL 리스트 (가져오지 못했으면 None)
+            new_md5s (set): scrape_articles가 반환한 처음 보는 URL MD5 집합
+        """
+        if not isinstance(news_urls, list):
+            self.poll_scheduler.record_failure(category)
+            return
+        url_md5s = {self.generate_md5(news_url) for news_url in news_urls}
+        interval = self.poll_scheduler.record(category, len(url_md5s), len(url_md5s & new_md5s))
+        info_message = f"NEXT POLL INTERVAL FOR {self.scraper_name}/{category}: {interval:.0f}s"
+        self.process_info_log_msg(info_message)
+
+    async def cut_at_watermark(self, category, items: list, get_url=None) -> list:
+        """게시판 항목(최신 순)에서 이미 확인한 구간(워터마크) 전까지만 반환하는 함수
+        링크 목록이 지난 확인과 같고(304 응답 포함) 모두 스크랩한 게시판은 빈 리스트를 반환합니다.
+        Args:
+            category (str): 카테고리 (카테고리가 없는 스크래퍼는 None)
+            items (list): 뉴스 URL 또는 피드 엔트리 리스트
+            get_url (callable, optional): 항목에서 뉴스 URL을 꺼내는 함수. Defaults to 항목 자체.
+        Returns:
+            list: 스크랩할 항목 리스트
+        """
+        get_url = get_url or (lambda item: item)
+        news_urls = [get_url(item) for item in items]
+        url_md5s = [self.generate_md5(news_url) for news_url in news_urls]
+        self.cycle_listings += 1
+        # 게시판의 스크랩 여부는 한 번에 확인합니다. (메모리에 없는 MD5는 DB 스레드에서 IN 조회 한 번)
+        scraped_md5s = await self.get_scraped_md5s(url_md5s)
+        # 링크 목록이 지난 확인과 같고 모두 스크랩했으면(304 응답 포함) 이 게시판은 건너뜁니다.
+        if listing_cache.links_unchanged(self.scraper_name, category, news_urls) and all(url_md5 in scraped_md5s for url_md5 in url_md5s):
+            listing_cache.record_unchanged_links()
+            info_message = f"LISTING UNCHANGED FOR {self.scraper_name}/{category}: SKIPPING {len(items)} ITEMS"
+            self.process_info_log_msg(info_message)
+            return []
+        self.cycle_changed_listings += 1
+        # 포털의 워터마크는 처음 사용할 때 DB 스레드에서 불러옵니다. (실패하면 다음 게시판에서 다시 불러옴)
+        await listing_watermarks.load(self.scraper_name)
+        stop = listing_watermarks.cut(self.scraper_name, category, url_md5s, scraped_md5s.__contains__)
+        if stop < len(items):
+            info_message = f"LISTING STOPPED AT WATERMARK FOR {self.scraper_name}/{category}: {stop}/{len(items)} ITEMS KEPT"
+            self.process_info_log_msg(info_message)
+        return items[:stop]
+
+    def update_watermark(self, category, news_urls: list) -> None:
+        """스크랩을 마친 게시판의 상단 기사로 워터마크를 갱신하는 함수
+        Args:
+            category (str): 카테고리 (카테고리가 없는 스크래퍼는 None)
+            news_urls (list): 게시판에서 가져온 뉴스 URL 리스트 (가져오지 못했으면 None)
+        """
+        if not isinstance(news_urls, list):
+            return
+        listing_watermarks.update(self.scraper_name, category, news_urls, [self.generate_md5(news_url) for news_url in news_urls])
+
+    async def collect_news_items(self, category_news_urls: dict) -> list:
+        """카테고리별 게시판 URL을 워터마크 전까지 자르고, 여러 카테고리에 올라온 URL은 처음 카테고리에서 한 번만 스크랩하도록 모으는 함수
+        Args:
+            category_news_urls (dict): {카테고리: 뉴스 URL 리스트 (실패 시 None)}
+        Returns:
+            list: (뉴스 URL, 카테고리) 리스트
+        """
+        news_items = []
+        seen_md5s = set()
+        for category, news_urls in category_news_urls.items():
+            if not isinstance(news_urls, list):
+                err_message = "GET_NEWS_URLS DOES NOT RETURN A LIST. CHECK THE 'news_board_url' OR THE RETURN VALUE OF FUNCTION 'get_news_urls'"
+                self.process_err_log_msg(err_message, "scrape_news", "", "")
+                continue
+            for news_url in await self.cut_at_watermark(category, news_urls):
+                url_md5 = self.generate_md5(news_url)
+                if url_md5 in seen_md5s:
+                    continue
+                seen_md5s.add(url_md5)
+                news_items.append((news_url, category))
+        return news_items
+
+    async def wait_for_next_poll(self) -> None:
+        """가장 먼저 확인할 카테고리의 확인 시각까지 기다리는 함수 (고정된 interval_time_sleep 대기 대신 사용)"""
+        await asyncio.sleep(self.poll_scheduler.seconds_until_next_poll())
+
+    # 기사 문서를 한 번만 가져오는 함수
+    async def fetch_news_document(self, news_url: str, media_name: str = None) -> Optional[NewsDocument]:
+        """기사 HTML을 한 번만 내려받아 문서 객체로 반환하는 함수
+        Args:
+            news_url (str): 뉴스 기사 URL
+            media_name (str, optional): 매체 이름. Defaults to self.media_name.
+        Returns:
+            NewsDocument: 기사 문서 객체. 실패 시 None
+        """
+        if media_name is None:
+            media_name = self.media_name
         try:
             info_message = f"SCRAPING STARTED FOR {news_url}"
             self.process_info_log_msg(info_message, type="info")
+            return await NewsDocument.fetch(news_url, headers=self.headers, media_name=media_name)
+        except DocumentFetchError as e:
+            self.process_err_log_msg(str(e), "fetch_news_document", "", "")
+            return None
+        except Exception as e:
+            stack_trace = traceback.format_exc()
+            err_message = f"THERE WAS AN ERROR WHILE FETCHING: {news_url}"
+            self.process_err_log_msg(err_message, "fetch_news_document", stack_trace, e)
+            return None
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(news_url, headers=self.headers) as response:
-                    if response.status == 200:
-                        try:
-                            text = await response.text()
-                        except UnicodeDecodeError:
-                            info_message = f"ENCODING ERROR FOR {news_url}"
-                            self.process_info_log_msg(info_message, type="info")
-                            text = await response.read()
-                            if self.media_name in ["dt", "wsobi", "munhwa", "dailypharm", "boannews"]:
-                                text = text.decode('euc-kr', 'ignore')
-                            elif self.media_name in ["digitalchosun", "news1", "seoul", "newsworks", "businessnews_chosun"]:
-                                text = text.decode('utf-8', 'ignore')
-                        soup = BeautifulSoup(text, 'html.parser')
-                    else:
-                        err_message = f"RESPONSE STATUS: {response.status} {response.reason} FOR URL: {news_url}"
-                        self.process_err_log_msg(err_message, "scrape_each_news", "", "")
-                        return None
+    # 파싱 방법(bs, trafilatura)별로 요소를 나누는 함수
+    def split_elements_by_method(self, parsing_rules_dict: dict = None) -> tuple:
+        """파싱 방법별로 추출할 요소를 나누는 함수
+        Args:
+            parsing_rules_dict (dict, optional): 파싱 규칙 딕셔너리
+        Returns:
+            tuple: (bs로 추출할 요소 리스트, trafilatura로 추출할 요소 리스트)
+        """
+        if not parsing_rules_dict:
+            parsing_rules_dict = self.parsing_rules_dict
+
+        elements_for_bs = []
+        elements_for_trafilatura = []
+        for element, (method, _) in parsing_rules_dict.items():
+            if method == "bs":
+                elements_for_bs.append(element)
+            elif method == "trafilatura":
+                elements_for_trafilatura.append(element)
+        return elements_for_bs, elements_for_trafilatura
+
+    def extract_news_details_with_trafilatura(self, document: NewsDocument, elements: list, parsing_rules_dict: dict = None, with_metadata: bool = True) -> dict:
+        """trafilatura 추출 결과에서 뉴스 상세 정보를 가져오는 함수
+        Args:
+            document (NewsDocument): 기사 문서 객체
+            elements (list): 추출할 요소 리스트
+            parsing_rules_dict (dict): 파싱 규칙 딕셔너리
+            with_metadata (bool): 메타데이터 추출 여부
+        Returns:
+            dict: 뉴스 상세 정보
+        """
+        if not parsing_rules_dict:
+            parsing_rules_dict = self.parsing_rules_dict
+
+        # 추출 결과는 문서당 한 번만 생성하고 모든 요소에서 재사용합니다.
+        trafilatura_result = document.get_trafilatura_result(with_metadata=with_metadata)
+        fields_by_name = get_rule_set(parsing_rules_dict).fields_by_name
+        extracted_data = {}
+        for element in elements:
+            field = fields_by_name.get(element)
+            extracted_data[element] = field.extract(trafilatura_result) if field is not None else None
+        return extracted_data
 
-            extracted_data = self.extract_news_details(
-                soup, elements, parsing_rules_dict=parsing_rules_dict
+    async def scrape_each_news_with_document(self, news_url: str, parsing_rules_dict: dict = None, with_metadata: bool = True, media_name: str = None, document: NewsDocument = None) -> Optional[dict]:
+        """기사를 한 번만 내려받아 bs, trafilatura 파싱 규칙을 모두 적용하는 함수
+        Args:
+            news_url (str): 뉴스 기사 URL
+            parsing_rules_dict (dict, optional): 파싱 규칙 딕셔너리
+            with_metadata (bool): trafilatura 메타데이터 추출 여부
+            media_name (str, optional): 매체 이름
+            document (NewsDocument, optional): 이미 내려받은 기사 문서. 없으면 새로 내려받습니다.
+        Returns:
+            dict: 추출된 뉴스 상세 정보. 실패 시 None
+        """
+        if not parsing_rules_dict:
+            # 캐시에 없는 규칙을 빈 규칙으로 받아 스크랩 실패가 되지 않도록 먼저 불러옵니다.
+            await self.warm_parsing_rules()
+            parsing_rules_dict = self.parsing_rules_dict
+
+        if document is None:
+            document = await self.fetch_news_document(news_url, media_name=media_name)
+        if document is None:
+            return None
+
+        try:
+            # 파싱과 추출은 프로세스 풀에서 실행하고, 결과는 일반 dict로 돌려받습니다.
+            # 컴파일된 규칙은 규칙 딕셔너리로 피클되어 워커 프로세스에서 규칙별로 한 번만 컴파일됩니다.
+            result = await extraction_executor.run(
+                extract_fields,
+                document.url,
+                document.content,
+                document.charset,
+                document.media_name,
+                get_rule_set(parsing_rules_dict),
+                with_metadata,
+                self.parser_backend,
                 )
-            return extracted_data
+        except Exception as e:
+            stack_trace = traceback.format_exc()
+            err_message = f"THERE WAS AN ERROR WHILE SCRAPING: {news_url}"
+            self.process_err_log_msg(err_message, "scrape_each_news_with_document", stack_trace, e)
+            return None
+
+        for error in result['errors']:
+            err_message = f"THERE WAS AN ERROR WHILE EXTRACTING {error['element']} FROM {news_url}"
+            self.process_err_log_msg(err_message, "extract_fields", error['stack_trace'], error['exception'])
+        return result['data']
+
+    async def normalize_news_text(self, title: str, content: str, process: bool = True) -> dict:
+        """제목 정규화(한자 변환)와 본문 정제를 프로세스 풀에서 실행하는 함수
+        Args:
+            title (str): 기사 제목
+            content (str): 기사 본문
+            process (bool): process_content 적용 여부
+        Returns:
+            dict: {'norm_title': 정규화된 제목, 'content': 정제된 본문}
+        """
+        return await extraction_executor.run(normalize_fields, title, content, process)
+
+    async def normalize_news_texts(self, articles: list, process: bool = True) -> list:
+        """여러 기사의 제목 정규화와 본문 정제를 프로세스 풀에서 한 번에 실행하는 함수
+        Args:
+            articles (list): [(제목, 본문), ...]
+            process (bool): process_content 적용 여부
+        Returns:
+            list: [{'norm_title': 정규화된 제목, 'content': 정제된 본문}, ...]
+        """
+        return await extraction_executor.run(normalize_fields_batch, articles, process)
 
+    async def scrape_each_news_with_bs(self, news_url, elements, parsing_rules_dict=None):
+        if not parsing_rules_dict:
+            await self.warm_parsing_rules()
+        document = await self.fetch_news_document(news_url)
+        if document is None:
+            return None
+        try:
+            return self.extract_news_details(document.soup, elements, parsing_rules_dict=parsing_rules_dict)
         except Exception as e:
             stack_trace = traceback.format_exc()
             err_message = f"THERE WAS AN ERROR WHILE SCRAPING: {news_url}"
@@ -403,32 +1156,13 @@ class NewsScraper(abc.ABC):
             return None
 
     async def scrape_each_news_with_trafilatura(self, news_url, elements: list, parsing_rules_dict: dict = None, with_metadata=True):
-        extracted_data = {}
         if not parsing_rules_dict:
-            parsing_rules_dict = self.parsing_rules_dict
+            await self.warm_parsing_rules()
+        document = await self.fetch_news_document(news_url)
+        if document is None:
+            return None
         try:
-            info_message = f"SCRAPING STARTED FOR {news_url} WITH TRAFILATURA"
-            self.process_info_log_msg(info_message, type="info")
-
-            if self.media_name in ["dt", "wsobi", "munhwa", "dailypharm", "boannews"]:
-                response = requests.get(news_url)
-                response.encoding = 'euc-kr'
-                downloaded = response.text
-            else:
-                downloaded = fetch_url(
-                    news_url,
-                    no_ssl=True,
-                )
-            for element in elements:
-                result = bare_extraction(downloaded, with_metadata=with_metadata)
-                parsing_rule = parsing_rules_dict.get(element)[-1]
-                if parsing_rule:
-                    for path in parsing_rule.values():
-                        result = result.get(path)
-                    extracted_data[element] = result
-                else:
-                    extracted_data[element] = None
-            return extracted_data
+            return self.extract_news_details_with_trafilatura(document, elements, parsing_rules_dict, with_metadata)
         except Exception as e:
             stack_trace = traceback.format_exc()
             err_message = f"THERE WAS AN ERROR WHILE SCRAPING: {news_url}"
@@ -436,9 +1170,10 @@ class NewsScraper(abc.ABC):
             return None
 
     @abc.abstractmethod
-    def get_news_urls(self, category: str=None) -> Generator[str, None, None]:
+    async def get_news_urls(self, category: str=None) -> Optional[List[str]]:
         """
-        카테고리별 뉴스 URL을 가져오는 추상 메서드.
+        카테고리별 뉴스 URL 리스트를 비동기로 가져오는 추상 메서드.
+        게시판은 fetch_listing / fetch_feed로 가져와야 합니다.
         서브클래스에서 구현해야 합니다.
         """
         pass
@@ -466,19 +1201,3 @@ class NewsScraper(abc.ABC):
         서브클래스에서 구현해야 합니다.
         """
         pass
-
-    @abc.abstractmethod
-    def get_feed_entries(self) -> Generator[dict, None, None]:
-        """
-        피드 엔트리를 가져오는 추상 메서드.
-        서브클래스에서 구현해야 합니다.
-        """
-        pass
-
-    @abc.abstractmethod
-    async def scrape_each_feed_entry(self, feed_entry: dict) -> Optional[dict]:
-        """
-        피드 엔트리를 스크래핑하는 추상 메서드.
-        서브클래스에서 구현해야 합니다.
-        """
-        pass
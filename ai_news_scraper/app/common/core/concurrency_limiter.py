@@ -0,0 +1,108 @@
+import asyncio
+from contextlib import asynccontextmanager
+from urllib.parse import urlsplit
+
+from app.config.settings import ARTICLE_WORKERS
+from app.common.core.host_rate_limiter import host_rate_limiter
+
+
+class ConcurrencyLimiter:
+    """
+    기사 스크래핑 동시 실행 수를 제한하는 클래스.
+    프로세스 전체 동시 실행 수와 매체(호스트)별 동시 실행 수를 함께 제한하여
+    서로 다른 매체의 기사는 동시에 가져오면서도 한 매체에 요청이 몰리지 않도록 합니다.
+    호스트별 동시 실행 수는 host_rate_limiter가 응답 상태에 따라 늘리고 줄인 값을 사용합니다.
+    """
+
+    def __init__(self, max_concurrency: int = None, rate_limiter=None):
+        """
+        Args:
+            max_concurrency (int, optional): 프로세스 전체 동시 실행 수. Defaults to settings.ARTICLE_WORKERS['max_concurrency'].
+            rate_limiter (HostRateLimiter, optional): 호스트별 동시 실행 수를 정하는 속도 조절기. Defaults to host_rate_limiter.
+        """
+        self.max_concurrency = max_concurrency or ARTICLE_WORKERS['max_concurrency']
+        self.rate_limiter = rate_limiter or host_rate_limiter
+        self._semaphore = None
+        self._host_conditions = {}  # {호스트: asyncio.Condition}
+        self._host_active = {}      # {호스트: 동시 실행 중인 작업 수}
+        self._loop = None
+        self.stats = {
+            'active': 0,
+            'max_active': 0,
+            'waiting': 0,
+            'completed': 0,
+        }
+
+    def _bind_loop(self) -> None:
+        """세마포어를 현재 이벤트 루프에 맞게 준비하는 함수"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._host_conditions = {}
+            self._host_active = {}
+            self._loop = loop
+
+    @staticmethod
+    def get_host(url: str) -> str:
+        """URL의 호스트 이름을 반환하는 함수"""
+        return (urlsplit(url).hostname or '').lower()
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        """URL의 호스트 슬롯과 전체 슬롯을 차례로 얻는 컨텍스트 매니저
+        바쁘거나 대기 시간(cooldown) 중인 호스트를 기다리는 동안 전체 슬롯을 차지하지 않도록 호스트 슬롯을 먼저 얻습니다.
+        Args:
+            url (str): 요청할 URL
+        """
+        self._bind_loop()
+        host = self.get_host(url)
+        condition = self._host_conditions.get(host)
+        if condition is None:
+            condition = self._host_conditions[host] = asyncio.Condition()
+            self._host_active[host] = 0
+
+        self.stats['waiting'] += 1
+        try:
+            async with condition:
+                await condition.wait_for(lambda: self._host_active[host] < self.rate_limiter.get_concurrency(host))
+                self._host_active[host] += 1
+            try:
+                await self.rate_limiter.wait_until_open(host)
+                await self._semaphore.acquire()
+            except BaseException:
+                await self._release_host(host, condition)
+                raise
+        finally:
+            self.stats['waiting'] -= 1
+
+        self.stats['active'] += 1
+        self.stats['max_active'] = max(self.stats['max_active'], self.stats['active'])
+        try:
+            yield
+        finally:
+            self.stats['active'] -= 1
+            self.stats['completed'] += 1
+            self._semaphore.release()
+            await self._release_host(host, condition)
+
+    async def _release_host(self, host: str, condition: asyncio.Condition) -> None:
+        """호스트 슬롯을 반납하고 기다리는 작업을 깨우는 함수 (그 사이 늘어난 동시 실행 수만큼 더 실행될 수 있습니다)"""
+        async with condition:
+            self._host_active[host] -= 1
+            condition.notify_all()
+
+    def get_stats(self) -> dict:
+        """동시 실행 중인 작업 수, 대기 중인 작업 수 등의 통계를 반환하는 함수"""
+        stats = dict(self.stats)
+        stats['max_concurrency'] = self.max_concurrency
+        stats['hosts'] = len(self._host_conditions)
+        stats['busy_hosts'] = {
+            host: f"{active}/{self.rate_limiter.get_concurrency(host)}"
+            for host, active in self._host_active.items()
+            if active
+        }
+        return stats
+
+
+# 프로세스 전역 기사 스크래핑 동시 실행 제한기
+concurrency_limiter = ConcurrencyLimiter()
@@ -0,0 +1,213 @@
+"""
+날짜 파싱 엔진.
+preprocess_datetime_* 함수를 차례로 시도하는 대신, 매체/포털별로 마지막에 성공한 형식을 먼저 시도하고
+실패한 경우에만 나머지 형식을 기존 순서대로 시도합니다.
+앞선 형식과 같은 문자열을 다르게 읽을 수 있는 형식(shadowed_by)은 앞선 형식이 받아들이지 않을 때만 먼저 시도하므로
+결과는 기존 순서대로 시도한 결과와 같습니다.
+strptime 형식은 strptime과 같은 정규식으로 미리 컴파일하여 예외 없이 바로 datetime을 만들고,
+그 밖의 형식(ISO, RFC, 영문)은 빠른 정규식 검사를 통과한 문자열에만 기존 함수를 호출합니다.
+"""
+import re
+import datetime
+from typing import Callable, Optional
+
+from app.common.core.utils import (
+    preprocess_datetime_iso,
+    preprocess_datetime_rfc2822,
+    preprocess_datetime_rfc3339,
+    preprocess_datetime_eng_without_seconds,
+)
+
+
+OUTPUT_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# strptime(_strptime.TimeRE)과 같은 숫자 지시자 정규식 (같은 문자열에서 같은 값을 얻습니다)
+STRPTIME_DIRECTIVES = {
+    'Y': r'(?P<Y>\d\d\d\d)',
+    'm': r'(?P<m>1[0-2]|0[1-9]|[1-9])',
+    'd': r'(?P<d>3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9])',
+    'H': r'(?P<H>2[0-3]|[0-1]\d|\d)',
+    'M': r'(?P<M>[0-5]\d|\d)',
+    'S': r'(?P<S>6[0-1]|[0-5]\d|\d)',
+}
+
+# 영문 월 이름 (RFC 2822/3339 형식은 월 이름이 있어야 파싱됩니다)
+MONTH_NAME_PATTERN = re.compile(r'jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec', re.IGNORECASE)
+
+
+class DateFormat:
+    """날짜 형식 하나 (빠른 검사 정규식 + 파싱 함수)"""
+
+    __slots__ = ('name', 'gate', 'parse_func', 'shadowed_by')
+
+    def __init__(self, name: str, parse_func: Callable, gate: re.Pattern = None, shadowed_by: tuple = ()):
+        """
+        Args:
+            name (str): 형식 이름
+            parse_func (callable): 날짜 문자열을 받아 변환된 날짜(실패하면 None)를 반환하는 함수
+            gate (re.Pattern, optional): 이 정규식에 맞지 않는 문자열은 parse_func를 호출하지 않습니다.
+            shadowed_by (tuple, optional): 같은 문자열을 받아들여 다른 날짜를 반환할 수 있는 형식 이름
+                (예: '2024100101212'는 iso가 12:12:00, compact가 01:21:02로 읽습니다)
+        """
+        self.name = name
+        self.gate = gate
+        self.parse_func = parse_func
+        self.shadowed_by = shadowed_by
+
+    def parse(self, date_str: str):
+        if self.gate is not None and not self.gate.search(date_str):
+            return None
+        return self.parse_func(date_str)
+
+
+class StrptimeFormat(DateFormat):
+    """숫자 지시자(%Y %m %d %H %M %S)만 사용하는 strptime 형식을 미리 컴파일한 날짜 형식"""
+
+    __slots__ = ('pattern',)
+
+    def __init__(self, name: str, fmt: str, shadowed_by: tuple = ()):
+        """
+        Args:
+            name (str): 형식 이름
+            fmt (str): strptime 형식 문자열
+            shadowed_by (tuple, optional): 같은 문자열을 받아들여 다른 날짜를 반환할 수 있는 형식 이름
+        """
+        super().__init__(name, self._parse, shadowed_by=shadowed_by)
+        self.pattern = re.compile(self._to_regex(fmt), re.IGNORECASE)
+
+    @staticmethod
+    def _to_regex(fmt: str) -> str:
+        """strptime 형식 문자열을 strptime과 같은 규칙의 정규식으로 바꾸는 함수"""
+        regex = []
+        i = 0
+        while i < len(fmt):
+            char = fmt[i]
+            if char == '%':
+                regex.append(STRPTIME_DIRECTIVES[fmt[i + 1]])
+                i += 2
+                continue
+            regex.append(r'\s+' if char.isspace() else re.escape(char))
+            i += 1
+        return ''.join(regex)
+
+    def _parse(self, date_str: str) -> Optional[str]:
+        # strptime처럼 처음 찾은 일치가 문자열 끝까지 닿지 않으면 실패로 처리합니다.
+        matched = self.pattern.match(date_str)
+        if not matched or matched.end() != len(date_str):
+            return None
+        groups = matched.groupdict()
+        try:
+            return datetime.datetime(
+                int(groups['Y']),
+                int(groups['m']),
+                int(groups['d']),
+                int(groups.get('H') or 0),
+                int(groups.get('M') or 0),
+                int(groups.get('S') or 0),
+            ).strftime(OUTPUT_FORMAT)
+        except ValueError:
+            return None
+
+
+# preprocess_datetime_* 함수에 대응하는 날짜 형식
+DATE_FORMATS = {
+    date_format.name: date_format
+    for date_format in [
+        DateFormat('iso', preprocess_datetime_iso, gate=re.compile(r'^\d{4}')),
+        # fromisoformat은 숫자만 있는 일부 문자열('2024100101212', '20241001T2123')도 다르게 읽습니다.
+        StrptimeFormat('compact', "%Y%m%d%H%M%S", shadowed_by=('iso',)),
+        StrptimeFormat('compact_with_seperator', "%Y%m%dT%H%M%S", shadowed_by=('iso',)),
+        DateFormat('rfc2822', preprocess_datetime_rfc2822, gate=MONTH_NAME_PATTERN),
+        DateFormat('rfc3339', preprocess_datetime_rfc3339, gate=MONTH_NAME_PATTERN, shadowed_by=('rfc2822',)),
+        StrptimeFormat('standard', "%Y-%m-%d %H:%M:%S"),
+        StrptimeFormat('standard_without_seconds', "%Y-%m-%d %H:%M"),
+        StrptimeFormat('korean_without_seconds', '%Y년%m월%d일 %H:%M'),
+        StrptimeFormat('period_without_seconds', "%Y.%m.%d %H:%M"),
+        StrptimeFormat('date_period', "%Y.%m.%d"),
+        DateFormat('eng_without_seconds', preprocess_datetime_eng_without_seconds, gate=re.compile(r'[ap]\.m\. ET')),
+    ]
+}
+
+
+class DateParser:
+    """
+    형식 학습 날짜 파서 클래스.
+    키(매체/포털)별로 마지막에 성공한 형식을 기억하여 먼저 시도합니다.
+    형식마다 같은 문자열을 다르게 읽을 수 있으므로(예: iso와 compact), 학습한 형식보다 앞선 형식 중
+    shadowed_by에 있는 형식이 문자열을 받아들이면 학습한 형식을 먼저 시도하지 않고 기존 순서대로 시도합니다.
+    """
+
+    def __init__(self, formats: list):
+        """
+        Args:
+            formats (list): 기존 순서대로 시도할 형식 (DATE_FORMATS의 이름 또는 DateFormat)
+        """
+        self.formats = [DATE_FORMATS[date_format] if isinstance(date_format, str) else date_format for date_format in formats]
+        # 형식별로 먼저 확인할 앞선 형식 (학습한 형식보다 먼저 받아들이면 기존 순서대로 시도합니다)
+        self._shadows = {
+            date_format: [earlier for earlier in self.formats[:i] if earlier.name in date_format.shadowed_by]
+            for i, date_format in enumerate(self.formats)
+        }
+        self._learned = {}  # {키: DateFormat}
+        self.stats = {
+            'learned_hits': 0,
+            'cascade_hits': 0,
+            'shadowed': 0,      # 앞선 형식이 받아들여 학습한 형식을 먼저 시도하지 않은 수
+            'failures': 0,
+        }
+
+    def parse(self, date_str: str, key: str = None):
+        """날짜 문자열을 변환하는 함수
+        Args:
+            date_str (str): 전처리되지 않은 날짜
+            key (str, optional): 형식을 학습할 키 (매체 또는 포털 이름)
+        Returns:
+            변환된 날짜 (모든 형식이 실패하면 None)
+        """
+        learned = self._learned.get(key)
+        if learned is not None:
+            if any(earlier.parse(date_str) for earlier in self._shadows.get(learned, ())):
+                self.stats['shadowed'] += 1
+                learned = None
+            else:
+                processed_date = learned.parse(date_str)
+                if processed_date:
+                    self.stats['learned_hits'] += 1
+                    return processed_date
+
+        for date_format in self.formats:
+            if date_format is learned:
+                continue
+            processed_date = date_format.parse(date_str)
+            if processed_date:
+                self._learned[key] = date_format
+                self.stats['cascade_hits'] += 1
+                return processed_date
+
+        self.stats['failures'] += 1
+        return None
+
+    def get_stats(self) -> dict:
+        """학습한 형식 적중/기존 순서 적중/실패 횟수와 키별 학습 형식을 반환하는 함수"""
+        stats = dict(self.stats)
+        stats['learned_formats'] = {key: date_format.name for key, date_format in self._learned.items()}
+        return stats
+
+
+# esg_finance, missing 스크래퍼의 날짜 형식 순서
+ESG_MEDIA_DATE_FORMATS = [
+    'iso',
+    'compact',
+    'compact_with_seperator',
+    'rfc2822',
+    'rfc3339',
+    'standard',
+    'standard_without_seconds',
+    'korean_without_seconds',
+    'period_without_seconds',
+    'date_period',
+    'eng_without_seconds',
+]
+
+# esg_finance, missing 스크래퍼가 공유하는 날짜 파서 (매체별로 형식을 학습합니다)
+esg_media_date_parser = DateParser(ESG_MEDIA_DATE_FORMATS)
@@ -0,0 +1,145 @@
+"""
+프로세스 풀에서 실행되는 기사 파싱/추출 작업 모듈.
+모든 함수는 피클 가능한 인자만 받고 일반 dict를 반환하므로
+ExtractionExecutor의 워커 프로세스에서 그대로 실행할 수 있습니다.
+"""
+import feedparser
+from bs4 import BeautifulSoup
+
+from app.common.core.news_document import NewsDocument
+from app.common.core.utils import preprocess_datetime_rfc2822, preprocess_datetime_iso
+from app.common.core.parsing_rules import CompiledRuleSet
+from app.common.core.text_normalization import normalize_title, normalize_content, normalize_batch
+
+
+def select_element(soup, selector=None, attribute_name=None, default=None, find=False, tag=None, find_attributes=None, find_all=False):
+    """soup에서 파싱 규칙에 맞는 데이터를 추출하는 함수 (예외는 호출한 쪽에서 처리)
+    Args:
+        soup (BeautifulSoup): BeautifulSoup 객체.
+        selector (str): CSS 선택자.
+        attribute_name (str): 추출할 요소의 속성 이름.
+        default (str): 기본 반환값.
+        find (bool): find() 함수 사용 여부.
+        tag (str): 검색할 HTML 태그 이름.
+        find_attributes (dict): find() 또는 find_all()에서 사용할 속성 딕셔너리.
+        find_all (bool): find_all() 함수 사용 여부.
+    Returns:
+        str 또는 list: 추출된 데이터.
+    """
+    if selector:
+        element = soup.select_one(selector) if not find_all else soup.select(selector)
+    elif find and tag:
+        element = soup.find(tag, find_attributes) if not find_all else soup.find_all(tag, find_attributes)
+    else:
+        return default
+
+    if not element:
+        return default
+    if find_all:
+        return [el.get(attribute_name, default) if attribute_name else el.get_text().strip() for el in element]
+    if attribute_name:
+        return element.get(attribute_name, default)
+    return element.get_text().strip()
+
+
+def extract_fields(url: str, content: bytes, charset: str, media_name: str, rule_set: CompiledRuleSet, with_metadata: bool = True, parser_backend: str = 'html.parser') -> dict:
+    """기사 HTML을 디코딩/파싱하고 컴파일된 파싱 규칙으로 필드를 추출하는 작업
+    Args:
+        url (str): 기사 URL
+        content (bytes): 기사 HTML 바이트
+        charset (str): 응답 헤더의 charset
+        media_name (str): 매체 이름
+        rule_set (CompiledRuleSet): 컴파일된 파싱 규칙 (워커 프로세스에서는 규칙별로 한 번만 컴파일됩니다)
+        with_metadata (bool): trafilatura 메타데이터 추출 여부
+        parser_backend (str): bs 규칙에 사용할 파서 백엔드
+    Returns:
+        dict: {'data': 추출된 필드 dict, 'errors': 요소별 에러 메세지 리스트}
+    """
+    document = NewsDocument(url, content, charset=charset, media_name=media_name)
+    return rule_set.extract(document, with_metadata, parser_backend)
+
+
+def normalize_fields(title: str, content: str, process: bool = True) -> dict:
+    """제목 정규화와 본문 정제를 수행하는 작업
+    Args:
+        title (str): 기사 제목
+        content (str): 기사 본문
+        process (bool): process_content 적용 여부
+    Returns:
+        dict: {'norm_title': 정규화된 제목, 'content': 정제된 본문}
+    """
+    return {'norm_title': normalize_title(title), 'content': normalize_content(content, process)}
+
+
+def normalize_fields_batch(articles: list, process: bool = True) -> list:
+    """여러 기사의 제목 정규화와 본문 정제를 한 번에 수행하는 작업 (워커 프로세스 왕복을 기사 수만큼 줄입니다)
+    Args:
+        articles (list): [(제목, 본문), ...]
+        process (bool): process_content 적용 여부
+    Returns:
+        list: [{'norm_title': 정규화된 제목, 'content': 정제된 본문}, ...]
+    """
+    return normalize_batch(articles, process)
+
+
+def parse_feed(content: bytes) -> dict:
+    """RSS/Atom 피드를 파싱하는 작업
+    Args:
+        content (bytes): 피드 XML 바이트
+    Returns:
+        dict: {'entries': 피드 엔트리 리스트}
+    """
+    feed = feedparser.parse(content)
+    return {'entries': list(feed.entries)}
+
+
+def _feed_date(entry) -> str:
+    """피드 엔트리의 날짜(RFC 2822 또는 ISO 8601)를 '%Y-%m-%d %H:%M:%S'로 바꾸는 함수 (피드에 적힌 시간대의 시각을 그대로 사용)"""
+    date_str = entry.get('published') or entry.get('updated')
+    if not date_str:
+        return None
+    return preprocess_datetime_rfc2822(date_str) or preprocess_datetime_iso(date_str)
+
+
+def _feed_image_url(entry) -> str:
+    """피드 엔트리의 media:content, media:thumbnail, 이미지 enclosure에서 이미지 URL을 찾는 함수"""
+    for media in (entry.get('media_content') or []) + (entry.get('media_thumbnail') or []):
+        if media.get('url'):
+            return media['url']
+    for enclosure in entry.get('enclosures') or []:
+        if (enclosure.get('type') or '').startswith('image/') and enclosure.get('href'):
+            return enclosure['href']
+    return None
+
+
+def extract_feed_entries(content: bytes) -> dict:
+    """RSS/Atom 피드를 파싱하여 엔트리마다 뉴스 필드를 추출하는 작업
+    본문은 content:encoded(본문 전체)만 사용하고, 요약(description)만 있는 피드는 본문을 None으로 두어 기사 페이지에서 가져오게 합니다.
+    Args:
+        content (bytes): 피드 XML 바이트
+    Returns:
+        dict: {'media': 피드 제목, 'entries': [{'url', 'title', 'content', 'create_date', 'image_url', 'kind'}, ...]}
+    """
+    feed = feedparser.parse(content)
+    entries = []
+    for entry in feed.entries:
+        url = entry.get('link')
+        if not url:
+            continue
+        content_text = None
+        image_url = None
+        if entry.get('content'):
+            soup = BeautifulSoup(entry.content[0].get('value') or '', 'html.parser')
+            content_text = soup.get_text().strip() or None
+            image = soup.find('img', src=True)
+            image_url = image['src'] if image else None
+        tags = entry.get('tags') or []
+        entries.append({
+            'url': url,
+            'title': (entry.get('title') or '').strip() or None,
+            'content': content_text,
+            'create_date': _feed_date(entry),
+            'image_url': image_url or _feed_image_url(entry),
+            'kind': tags[0].get('term') if tags else None,
+        })
+    return {'media': feed.feed.get('title'), 'entries': entries}
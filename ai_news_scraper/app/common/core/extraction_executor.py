@@ -0,0 +1,98 @@
+import time
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from app.config.settings import EXTRACTION_EXECUTOR
+
+
+def _run_job(func, args: tuple, kwargs: dict) -> tuple:
+    """워커 프로세스에서 작업을 실행하고 CPU 사용 시간을 함께 반환하는 함수"""
+    started = time.process_time()
+    result = func(*args, **kwargs)
+    return result, time.process_time() - started
+
+
+class ExtractionExecutor:
+    """
+    CPU를 많이 사용하는 HTML 파싱/추출 작업을 프로세스 풀에서 실행하는 클래스.
+    모든 스크래퍼가 공유하는 이벤트 루프가 무거운 페이지 하나 때문에 멈추지 않도록
+    BeautifulSoup, trafilatura, 한자 변환, 본문 정제 작업을 워커 프로세스로 넘깁니다.
+    """
+
+    def __init__(self, max_workers: int = None):
+        """
+        Args:
+            max_workers (int, optional): 워커 프로세스 수. 0이면 이벤트 루프에서 직접 실행합니다.
+                Defaults to settings.EXTRACTION_EXECUTOR['max_workers'].
+        """
+        self.max_workers = EXTRACTION_EXECUTOR['max_workers'] if max_workers is None else max_workers
+        self._pool = None
+        self.stats = {
+            'pending': 0,
+            'max_pending': 0,
+            'completed': 0,
+            'failed': 0,
+            'total_cpu_time': 0.0,
+            'max_cpu_time': 0.0,
+            'last_cpu_time': 0.0,
+        }
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """프로세스 풀을 반환하는 함수. 스레드가 있는 프로세스에서 fork하지 않도록 spawn을 사용합니다."""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context('spawn'),
+            )
+        return self._pool
+
+    async def run(self, func, *args, **kwargs):
+        """작업을 프로세스 풀에 제출하고 결과를 기다리는 함수
+        Args:
+            func (callable): 모듈 최상위에 정의된(피클 가능한) 작업 함수
+        Returns:
+            작업 함수의 반환값 (일반 dict)
+        """
+        self.stats['pending'] += 1
+        self.stats['max_pending'] = max(self.stats['max_pending'], self.stats['pending'])
+        try:
+            if self.max_workers <= 0:
+                result, cpu_time = _run_job(func, args, kwargs)
+            else:
+                loop = asyncio.get_running_loop()
+                try:
+                    result, cpu_time = await loop.run_in_executor(self._get_pool(), _run_job, func, args, kwargs)
+                except BrokenProcessPool:
+                    # 워커 프로세스가 비정상 종료된 경우 풀을 다시 만들고 한 번 더 시도합니다.
+                    self.shutdown()
+                    result, cpu_time = await loop.run_in_executor(self._get_pool(), _run_job, func, args, kwargs)
+        except Exception:
+            self.stats['failed'] += 1
+            raise
+        finally:
+            self.stats['pending'] -= 1
+
+        self.stats['completed'] += 1
+        self.stats['total_cpu_time'] += cpu_time
+        self.stats['max_cpu_time'] = max(self.stats['max_cpu_time'], cpu_time)
+        self.stats['last_cpu_time'] = cpu_time
+        return result
+
+    def get_stats(self) -> dict:
+        """대기 중인 작업 수(큐 깊이)와 작업별 CPU 사용 시간 통계를 반환하는 함수"""
+        stats = dict(self.stats)
+        stats['max_workers'] = self.max_workers
+        stats['avg_cpu_time'] = round(stats['total_cpu_time'] / stats['completed'], 6) if stats['completed'] else 0.0
+        return stats
+
+    def shutdown(self) -> None:
+        """프로세스 풀을 종료하는 함수"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+# 프로세스 전역 추출 작업 실행기
+extraction_executor = ExtractionExecutor()
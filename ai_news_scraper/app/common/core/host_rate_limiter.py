@@ -0,0 +1,209 @@
+import time
+import asyncio
+import datetime
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from app.config.settings import HOST_RATE_LIMITER, ARTICLE_WORKERS
+
+
+# 호스트가 요청을 막았다는 응답 (대기 시간을 두고 속도를 줄입니다)
+THROTTLE_STATUSES = (403, 429)
+# 호스트가 과부하라는 신호로 보는 요청 예외 (속도를 줄입니다)
+OVERLOAD_ERRORS = (asyncio.TimeoutError, aiohttp.ServerDisconnectedError, aiohttp.ServerTimeoutError)
+
+
+class HostThrottle:
+    """호스트 하나의 토큰 버킷과 AIMD 상태"""
+
+    __slots__ = (
+        'host', 'rate', 'concurrency', 'tokens', 'refilled_at', 'blocked_until',
+        'last_backoff', 'consecutive_backoffs', 'stats',
+    )
+
+    def __init__(self, host: str, rate: float, concurrency: float, burst: float):
+        self.host = host
+        self.rate = rate                    # 초당 요청 수
+        self.concurrency = concurrency      # 동시 기사 스크래핑 수 (실수로 조절하고 정수로 사용)
+        self.tokens = burst
+        self.refilled_at = time.monotonic()
+        self.blocked_until = 0.0            # 이 시각(time.monotonic)까지 요청하지 않음
+        self.last_backoff = 0.0             # 마지막으로 속도를 줄인 시각
+        self.consecutive_backoffs = 0
+        self.stats = {
+            'requests': 0,
+            'throttled': 0,     # 403/429 응답
+            'server_errors': 0,  # 5xx 응답
+            'overloads': 0,     # 타임아웃/연결 끊김
+            'backoffs': 0,
+            'wait_time': 0.0,   # 토큰/대기 시간 때문에 기다린 시간(초)
+        }
+
+
+class HostRateLimiter:
+    """
+    호스트별 요청 속도와 동시 실행 수를 조절하는 클래스.
+    모든 스크래퍼의 요청(http_client.request)이 호스트별 토큰 버킷을 거치므로
+    여러 포털이 같은 매체를 가져와도 매체 하나에는 정해진 속도로만 요청합니다.
+    응답이 정상이고 빠르면 속도와 동시 실행 수를 조금씩(가산) 늘리고,
+    429/403/5xx 응답이나 타임아웃이 나면 크게(승산) 줄입니다. (AIMD)
+    429/403 응답은 Retry-After 또는 cooldown(연속되면 두 배씩) 동안 해당 호스트 요청을 멈춥니다.
+    """
+
+    def __init__(self, config: dict = None, initial_concurrency: int = None):
+        """
+        Args:
+            config (dict, optional): 속도 조절 설정. Defaults to settings.HOST_RATE_LIMITER.
+            initial_concurrency (int, optional): 호스트별 초기 동시 기사 스크래핑 수. Defaults to settings.ARTICLE_WORKERS['max_per_host'].
+        """
+        self.config = {**HOST_RATE_LIMITER, **(config or {})}
+        self.initial_concurrency = float(initial_concurrency or ARTICLE_WORKERS['max_per_host'])
+        self._throttles = {}    # {호스트: HostThrottle}
+
+    @staticmethod
+    def get_host(url: str) -> str:
+        """URL의 호스트 이름을 반환하는 함수"""
+        return (urlsplit(url).hostname or '').lower()
+
+    def get_throttle(self, host: str) -> HostThrottle:
+        """호스트의 HostThrottle을 반환하는 함수 (처음 보는 호스트는 초기값으로 생성)"""
+        throttle = self._throttles.get(host)
+        if throttle is None:
+            throttle = self._throttles[host] = HostThrottle(
+                host,
+                self.config['initial_rate'],
+                self.initial_concurrency,
+                self.config['burst'],
+            )
+        return throttle
+
+    def get_concurrency(self, host: str) -> int:
+        """호스트의 현재 동시 기사 스크래핑 수를 반환하는 함수"""
+        return max(1, int(self.get_throttle(host).concurrency))
+
+    async def wait_until_open(self, host: str) -> None:
+        """호스트의 대기 시간(cooldown)이 끝날 때까지 기다리는 함수"""
+        throttle = self.get_throttle(host)
+        while True:
+            delay = throttle.blocked_until - time.monotonic()
+            if delay <= 0:
+                return
+            throttle.stats['wait_time'] += delay
+            await asyncio.sleep(delay)
+
+    async def acquire(self, url: str) -> float:
+        """URL의 호스트에 요청할 수 있을 때까지(대기 시간이 끝나고 토큰이 있을 때까지) 기다리는 함수
+        Args:
+            url (str): 요청할 URL
+        Returns:
+            float: 요청을 시작한 시각 (record에 넘겨 응답 시간을 계산합니다)
+        """
+        throttle = self.get_throttle(self.get_host(url))
+        while True:
+            now = time.monotonic()
+            if now < throttle.blocked_until:
+                delay = throttle.blocked_until - now
+            else:
+                throttle.tokens = min(self.config['burst'], throttle.tokens + (now - throttle.refilled_at) * throttle.rate)
+                throttle.refilled_at = now
+                if throttle.tokens >= 1:
+                    throttle.tokens -= 1
+                    throttle.stats['requests'] += 1
+                    return now
+                delay = (1 - throttle.tokens) / throttle.rate
+            throttle.stats['wait_time'] += delay
+            await asyncio.sleep(delay)
+
+    def record(self, url: str, status: int, started: float, retry_after: str = None) -> None:
+        """응답 상태와 응답 시간으로 호스트의 속도와 동시 실행 수를 조절하는 함수
+        Args:
+            url (str): 요청한 URL
+            status (int): 응답 상태 코드
+            started (float): acquire가 반환한 요청 시작 시각
+            retry_after (str, optional): 응답의 Retry-After 헤더
+        """
+        throttle = self.get_throttle(self.get_host(url))
+        if status in THROTTLE_STATUSES:
+            throttle.stats['throttled'] += 1
+            self._backoff(throttle, started, cooldown=self._parse_retry_after(retry_after) or True)
+        elif status >= 500:
+            throttle.stats['server_errors'] += 1
+            self._backoff(throttle, started, cooldown=self._parse_retry_after(retry_after))
+        elif time.monotonic() - started <= self.config['latency_target']:
+            self._increase(throttle)
+
+    def record_error(self, url: str, error: BaseException, started: float) -> None:
+        """응답을 받지 못한 요청을 기록하는 함수 (타임아웃, 연결 끊김은 과부하로 보고 속도를 줄입니다)"""
+        if isinstance(error, OVERLOAD_ERRORS):
+            throttle = self.get_throttle(self.get_host(url))
+            throttle.stats['overloads'] += 1
+            self._backoff(throttle, started)
+
+    def _increase(self, throttle: HostThrottle) -> None:
+        """가산 증가: 정상 응답마다 초당 요청 수는 초마다 rate_increase만큼, 동시 실행 수는 한 번에 다 찰 때마다 1만큼 늘어나도록 나눠 늘립니다."""
+        throttle.consecutive_backoffs = 0
+        throttle.rate = min(self.config['max_rate'], throttle.rate + self.config['rate_increase'] / throttle.rate)
+        throttle.concurrency = min(self.config['max_concurrency'], throttle.concurrency + 1 / throttle.concurrency)
+
+    def _backoff(self, throttle: HostThrottle, started: float, cooldown=None) -> None:
+        """승산 감소: 속도와 동시 실행 수를 backoff_factor배로 줄이는 함수
+        마지막으로 줄인 뒤에 시작한 요청의 실패만 반영하여 한 번에 몰린 실패로 여러 번 줄이지 않습니다.
+        Args:
+            throttle (HostThrottle): 호스트 상태
+            started (float): 실패한 요청의 시작 시각
+            cooldown: 요청을 멈출 시간(초). True면 설정의 cooldown을 연속 횟수만큼 두 배씩 늘려 사용합니다.
+        """
+        now = time.monotonic()
+        if started < throttle.last_backoff:
+            return
+        throttle.last_backoff = now
+        throttle.consecutive_backoffs += 1
+        throttle.stats['backoffs'] += 1
+        factor = self.config['backoff_factor']
+        throttle.rate = max(self.config['min_rate'], throttle.rate * factor)
+        throttle.concurrency = max(1.0, throttle.concurrency * factor)
+        throttle.tokens = min(throttle.tokens, 0.0)
+        if cooldown is True:
+            cooldown = self.config['cooldown'] * 2 ** (throttle.consecutive_backoffs - 1)
+        if cooldown:
+            throttle.blocked_until = max(throttle.blocked_until, now + min(cooldown, self.config['max_cooldown']))
+
+    @staticmethod
+    def _parse_retry_after(retry_after: str):
+        """Retry-After 헤더(초 또는 HTTP 날짜)를 초로 바꾸는 함수 (없거나 잘못된 값이면 None)"""
+        if not retry_after:
+            return None
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+            return max(0.0, (retry_at - datetime.datetime.now(retry_at.tzinfo)).total_seconds())
+        except (TypeError, ValueError):
+            return None
+
+    def get_stats(self) -> dict:
+        """호스트 수, 전체 요청/차단/백오프 횟수와 속도를 줄인 적이 있는 호스트별 상태를 반환하는 함수"""
+        now = time.monotonic()
+        totals = {'hosts': len(self._throttles), 'requests': 0, 'throttled': 0, 'server_errors': 0, 'overloads': 0, 'backoffs': 0}
+        backed_off_hosts = {}
+        for host, throttle in self._throttles.items():
+            for key in ('requests', 'throttled', 'server_errors', 'overloads', 'backoffs'):
+                totals[key] += throttle.stats[key]
+            if throttle.stats['backoffs']:
+                backed_off_hosts[host] = {
+                    **throttle.stats,
+                    'wait_time': round(throttle.stats['wait_time'], 2),
+                    'rate': round(throttle.rate, 3),
+                    'concurrency': self.get_concurrency(host),
+                    'cooldown_remaining': round(max(0.0, throttle.blocked_until - now), 1),
+                }
+        totals['backed_off_hosts'] = backed_off_hosts
+        return totals
+
+
+# 프로세스 전역 호스트별 요청 속도 조절기
+host_rate_limiter = HostRateLimiter()
@@ -0,0 +1,149 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import aiohttp
+
+from app.config.settings import HTTP_CLIENT
+from app.common.core.host_rate_limiter import host_rate_limiter
+
+try:
+    # brotli 패키지가 설치된 경우에만 br 압축을 요청합니다.
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+
+class HttpClient:
+    """
+    프로세스 전역에서 공유하는 aiohttp 클라이언트 클래스.
+    모든 포털 스크래퍼가 하나의 TCPConnector(커넥션 풀)를 공유하므로
+    같은 호스트에 대한 TCP/TLS 핸드셰이크와 DNS 조회를 재사용할 수 있습니다.
+    """
+
+    def __init__(self, config: dict = None):
+        """
+        Args:
+            config (dict, optional): HTTP 클라이언트 설정. Defaults to settings.HTTP_CLIENT.
+        """
+        self.config = {**HTTP_CLIENT, **(config or {})}
+        self._session = None
+        self._loop = None
+        self.stats = {
+            'requests': 0,
+            'new_connections': 0,
+            'reused_connections': 0,
+            'dns_cache_hits': 0,
+            'dns_cache_misses': 0,
+            'request_errors': 0,
+        }
+
+    def _build_connector(self) -> aiohttp.TCPConnector:
+        """커넥션 풀(TCPConnector)을 생성하는 함수"""
+        return aiohttp.TCPConnector(
+            limit=self.config['limit'],
+            limit_per_host=self.config['limit_per_host'],
+            ttl_dns_cache=self.config['ttl_dns_cache'],
+            use_dns_cache=True,
+            keepalive_timeout=self.config['keepalive_timeout'],
+        )
+
+    def _build_timeout(self) -> aiohttp.ClientTimeout:
+        """연결/읽기 타임아웃을 생성하는 함수"""
+        return aiohttp.ClientTimeout(
+            total=self.config['total_timeout'],
+            sock_connect=self.config['connect_timeout'],
+            sock_read=self.config['read_timeout'],
+        )
+
+    def _build_trace_config(self) -> aiohttp.TraceConfig:
+        """커넥션 재사용 통계를 수집하기 위한 TraceConfig를 생성하는 함수"""
+        trace_config = aiohttp.TraceConfig()
+
+        async def on_request_start(session, context, params):
+            self.stats['requests'] += 1
+
+        async def on_connection_create_end(session, context, params):
+            self.stats['new_connections'] += 1
+
+        async def on_connection_reuseconn(session, context, params):
+            self.stats['reused_connections'] += 1
+
+        async def on_dns_cache_hit(session, context, params):
+            self.stats['dns_cache_hits'] += 1
+
+        async def on_dns_cache_miss(session, context, params):
+            self.stats['dns_cache_misses'] += 1
+
+        async def on_request_exception(session, context, params):
+            self.stats['request_errors'] += 1
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace_config.on_dns_cache_hit.append(on_dns_cache_hit)
+        trace_config.on_dns_cache_miss.append(on_dns_cache_miss)
+        trace_config.on_request_exception.append(on_request_exception)
+        return trace_config
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """공유 세션을 반환하는 함수. 세션이 없거나 닫혔으면 새로 생성합니다.
+        Returns:
+            aiohttp.ClientSession: 공유 세션
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            self._session = aiohttp.ClientSession(
+                connector=self._build_connector(),
+                timeout=self._build_timeout(),
+                headers={'Accept-Encoding': ACCEPT_ENCODING},
+                trace_configs=[self._build_trace_config()],
+                auto_decompress=True,
+            )
+            self._loop = loop
+        return self._session
+
+    @asynccontextmanager
+    async def request(self, url: str, **kwargs):
+        """호스트별 속도 조절(host_rate_limiter)을 거쳐 공유 세션으로 GET 요청을 보내는 컨텍스트 매니저
+        응답 상태와 응답 시간은 host_rate_limiter에 기록되어 호스트별 요청 속도와 동시 실행 수를 조절합니다.
+        Args:
+            url (str): 요청할 URL
+            **kwargs: session.get에 넘길 인자 (headers, params, ssl 등)
+        Yields:
+            aiohttp.ClientResponse: 응답
+        """
+        session = await self.get_session()
+        started = await host_rate_limiter.acquire(url)
+        recorded = False
+        try:
+            async with session.get(url, **kwargs) as response:
+                host_rate_limiter.record(url, response.status, started, response.headers.get('Retry-After'))
+                recorded = True
+                yield response
+        except Exception as e:
+            if not recorded:
+                host_rate_limiter.record_error(url, e, started)
+            raise
+
+    async def close(self) -> None:
+        """공유 세션을 닫는 함수"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._loop = None
+
+    def get_stats(self) -> dict:
+        """커넥션 재사용 통계를 반환하는 함수
+        Returns:
+            dict: 요청 수, 신규/재사용 커넥션 수, DNS 캐시 적중 수, 재사용 비율
+        """
+        stats = dict(self.stats)
+        total_connections = stats['new_connections'] + stats['reused_connections']
+        stats['reuse_ratio'] = round(stats['reused_connections'] / total_connections, 4) if total_connections else 0.0
+        return stats
+
+
+# 프로세스 전역 HTTP 클라이언트
+http_client = HttpClient()
+
@@ -0,0 +1,207 @@
+import os
+import time
+import math
+import random
+import socket
+import asyncio
+
+from app.config.settings import LEASE
+from app.common.db.db_executor import db_executor
+from app.common.db.scraper_manager_database import ScraperManagerDatabase
+from app.common.log.log_config import setup_logger
+
+
+NODE_PREFIX = 'node:'
+GROUP_PREFIX = 'scraper_group:'
+JOB_PREFIX = 'job:'
+
+
+class LeaseManager:
+    """
+    scrap_lease 테이블로 포털 그룹과 일일 통계 메시지 같은 작업을 인스턴스 하나만 실행하도록 점유하는 클래스.
+    인스턴스(컨테이너, uvicorn 워커 프로세스)마다 'node:<호스트>:<pid>'를 점유하여 살아 있는 인스턴스 수를 알리고,
+    renew_interval초마다 점유한 포털 그룹을 갱신하면서 (전체 그룹 수 / 살아 있는 인스턴스 수)개까지 빈 그룹을 가져옵니다.
+    인스턴스가 늘어나면 몫보다 많이 가진 인스턴스가 그룹을 내려놓고(워커 종료 후 점유 삭제), 인스턴스가 죽으면 ttl초 뒤 다른 인스턴스가 가져갑니다.
+    DB에 연결할 수 없어 ttl 안에 갱신하지 못하면 다른 인스턴스와 함께 스크랩하지 않도록 점유한 그룹을 멈춥니다.
+    """
+
+    def __init__(self, config: dict = None):
+        """
+        Args:
+            config (dict, optional): 작업 점유 설정. Defaults to settings.LEASE.
+        """
+        self.config = {**LEASE, **(config or {})}
+        self.owner = f"{socket.gethostname()}:{os.getpid()}"
+        self._scraper_mng_db = None
+        self._supervisor = None
+        self._task = None
+        self._held = {}             # {그룹 이름: 점유를 마지막으로 갱신한 시각(time.monotonic)}
+        self._releasing = set()     # 워커가 종료되면 점유를 삭제할 그룹
+        self.logger = setup_logger(
+            'lease_manager',
+            'app/log/lease_manager.log',
+            level='INFO'
+        )
+        self.stats = {
+            'live_nodes': 0,
+            'share': 0,
+            'acquired': 0,      # 새로 점유한 그룹 수
+            'lost': 0,          # 갱신하지 못해 멈춘 그룹 수
+            'released': 0,      # 다른 인스턴스에 넘긴 그룹 수
+            'renew_errors': 0,
+            'jobs_run': 0,
+            'jobs_skipped': 0,  # 다른 인스턴스가 점유하여 실행하지 않은 작업 수
+        }
+
+    @property
+    def enabled(self) -> bool:
+        return self.config['enabled']
+
+    @property
+    def scraper_mng_db(self) -> ScraperManagerDatabase:
+        if self._scraper_mng_db is None:
+            self._scraper_mng_db = ScraperManagerDatabase()
+        return self._scraper_mng_db
+
+    def start(self, supervisor) -> None:
+        """포털 그룹 점유 작업을 시작하는 함수 (이벤트 루프에서 호출)
+        Args:
+            supervisor (ScraperSupervisor): 점유한 그룹을 시작/종료할 슈퍼바이저
+        """
+        if self._task is not None:
+            return
+        self._supervisor = supervisor
+        self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        """renew_interval초마다 점유를 갱신하고, 점유 결과에 따라 그룹의 워커를 시작/종료하는 작업"""
+        while True:
+            try:
+                running = self._supervisor.running_groups()
+                to_start, to_stop = await db_executor.run(self._sync, list(self._supervisor.groups), running)
+                for group in to_stop:
+                    self._supervisor.stop_group(group)
+                for group in to_start:
+                    self._supervisor.start_group(group)
+            except Exception as e:
+                self.logger.error(f"THERE WAS AN ERROR WHILE SYNCING SCRAPER GROUP LEASES: {e}")
+            await asyncio.sleep(self.config['renew_interval'])
+
+    def _sync(self, groups: list, running: set) -> tuple:
+        """점유를 갱신하고 인스턴스별 몫에 맞춰 그룹을 가져오거나 내려놓는 함수 (DB 스레드에서 실행)
+        Args:
+            groups (list): 전체 그룹 이름 리스트
+            running (set): 이 인스턴스에서 워커가 실행 중이거나 종료 중인 그룹
+        Returns:
+            tuple: (시작할 그룹 리스트, 종료할 그룹 리스트)
+        """
+        ttl = self.config['ttl']
+        to_start, to_stop = [], []
+
+        try:
+            # 워커가 종료된 그룹은 점유를 삭제하여 다른 인스턴스가 바로 가져갈 수 있게 합니다.
+            for group in list(self._releasing):
+                if group not in running:
+                    self.scraper_mng_db.release_scrap_lease(GROUP_PREFIX + group, self.owner)
+                    self._releasing.discard(group)
+                    self.stats['released'] += 1
+                    self.logger.info(f"SCRAPER GROUP LEASE RELEASED: {group}")
+            self.scraper_mng_db.acquire_scrap_lease(NODE_PREFIX + self.owner, self.owner, ttl)
+            for group in list(self._held):
+                if self.scraper_mng_db.acquire_scrap_lease(GROUP_PREFIX + group, self.owner, ttl):
+                    self._held[group] = time.monotonic()
+                else:
+                    # 갱신이 늦어 다른 인스턴스가 가져간 그룹
+                    del self._held[group]
+                    to_stop.append(group)
+                    self.stats['lost'] += 1
+                    self.logger.error(f"SCRAPER GROUP LEASE LOST: {group}")
+            live_nodes = len(self.scraper_mng_db.get_live_scrap_leases(NODE_PREFIX)) or 1
+        except Exception as e:
+            self.stats['renew_errors'] += 1
+            self.logger.error(f"THERE WAS AN ERROR WHILE RENEWING LEASES: {e}")
+            # ttl이 지나기 전에(갱신 주기 하나 여유) 점유한 그룹을 멈춥니다.
+            deadline = time.monotonic() - (ttl - self.config['renew_interval'])
+            for group, renewed in list(self._held.items()):
+                if renewed < deadline:
+                    del self._held[group]
+                    to_stop.append(group)
+                    self.stats['lost'] += 1
+                    self.logger.error(f"SCRAPER GROUP LEASE EXPIRED WITHOUT RENEWAL: {group}")
+            return to_start, to_stop
+
+        share = math.ceil(len(groups) / live_nodes)
+        self.stats['live_nodes'] = live_nodes
+        self.stats['share'] = share
+
+        if len(self._held) > share:
+            # 몫보다 많이 가졌으면 한 번에 하나씩 내려놓습니다. (워커가 종료되면 점유 삭제)
+            group = max(self._held, key=self._held.get)
+            del self._held[group]
+            self._releasing.add(group)
+            to_stop.append(group)
+        elif len(self._held) < share:
+            candidates = [group for group in groups if group not in self._held and group not in self._releasing and group not in running]
+            # 여러 인스턴스가 같은 순서로 가져가려고 경쟁하지 않도록 섞습니다.
+            random.shuffle(candidates)
+            for group in candidates:
+                if len(self._held) >= share:
+                    break
+                if self.scraper_mng_db.acquire_scrap_lease(GROUP_PREFIX + group, self.owner, ttl):
+                    self._held[group] = time.monotonic()
+                    to_start.append(group)
+                    self.stats['acquired'] += 1
+                    self.logger.info(f"SCRAPER GROUP LEASE ACQUIRED: {group} (LIVE NODES {live_nodes}, SHARE {share})")
+        return to_start, to_stop
+
+    def run_once(self, name: str, func, ttl: float = None) -> bool:
+        """점유한 인스턴스 하나만 작업을 실행하는 함수 (점유는 ttl초 동안 유지하여 다른 인스턴스가 같은 작업을 다시 실행하지 않음)
+        Args:
+            name (str): 작업 이름 (예: 'daily_report')
+            func (callable): 실행할 동기 함수
+            ttl (float, optional): 점유 시간(초). Defaults to settings.LEASE['daily_report_ttl'].
+        Returns:
+            bool: 실행 여부
+        """
+        if self.enabled:
+            try:
+                acquired = self.scraper_mng_db.acquire_scrap_lease(JOB_PREFIX + name, self.owner, ttl or self.config['daily_report_ttl'])
+            except Exception as e:
+                self.logger.error(f"THERE WAS AN ERROR WHILE ACQUIRING JOB LEASE {name}: {e}")
+                return False
+            if not acquired:
+                self.stats['jobs_skipped'] += 1
+                self.logger.info(f"JOB {name} IS LEASED BY ANOTHER INSTANCE, SKIPPING")
+                return False
+        func()
+        self.stats['jobs_run'] += 1
+        return True
+
+    def stop(self) -> None:
+        """점유 작업을 멈추고 점유한 그룹과 인스턴스 점유를 삭제하는 함수 (워커를 종료한 뒤 호출)"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        for group in list(self._held) + list(self._releasing):
+            try:
+                self.scraper_mng_db.release_scrap_lease(GROUP_PREFIX + group, self.owner)
+            except Exception as e:
+                self.logger.error(f"THERE WAS AN ERROR WHILE RELEASING SCRAPER GROUP LEASE {group}: {e}")
+        self._held = {}
+        self._releasing = set()
+        try:
+            self.scraper_mng_db.release_scrap_lease(NODE_PREFIX + self.owner, self.owner)
+        except Exception as e:
+            self.logger.error(f"THERE WAS AN ERROR WHILE RELEASING NODE LEASE: {e}")
+
+    def get_stats(self) -> dict:
+        """점유한 그룹, 살아 있는 인스턴스 수, 인스턴스별 몫, 점유를 가져오거나 잃은 횟수 통계를 반환하는 함수"""
+        stats = dict(self.stats)
+        stats['owner'] = self.owner
+        stats['held_groups'] = sorted(self._held)
+        stats['releasing_groups'] = sorted(self._releasing)
+        return stats
+
+
+# 프로세스 전역 작업 점유 관리자
+lease_manager = LeaseManager()
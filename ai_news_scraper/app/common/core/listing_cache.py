@@ -0,0 +1,140 @@
+import hashlib
+from collections import OrderedDict
+from typing import Optional
+from urllib.parse import urlencode
+
+from app.config.settings import LISTING_CACHE
+
+
+class ListingEntry:
+    """게시판/피드 URL 하나의 검증자(ETag, Last-Modified)와 마지막 본문"""
+
+    __slots__ = ('etag', 'last_modified', 'content', 'charset')
+
+    def __init__(self, etag: str, last_modified: str, content: bytes, charset: Optional[str]):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.content = content
+        self.charset = charset
+
+
+class ListingCache:
+    """
+    게시판/피드 조건부 요청(conditional GET) 캐시 클래스.
+    응답에 ETag/Last-Modified가 있으면 본문과 함께 저장해 두고, 다음 요청에 If-None-Match/If-Modified-Since를 보냅니다.
+    304 응답이면 저장해 둔 본문을 그대로 사용하므로 게시판을 다시 내려받지 않습니다.
+    검증자를 주지 않는 게시판은 (포털, 카테고리)별 링크 목록 해시로 바뀌었는지 확인합니다.
+    """
+
+    def __init__(self, max_entries: int = None):
+        """
+        Args:
+            max_entries (int, optional): 본문을 저장할 최대 URL 수. Defaults to settings.LISTING_CACHE['max_entries'].
+        """
+        self.max_entries = max_entries or LISTING_CACHE['max_entries']
+        self._entries = OrderedDict()   # {요청 키: ListingEntry} (오래 쓰지 않은 순)
+        self._link_hashes = {}          # {(포털, 카테고리): 링크 목록 해시}
+        self.stats = {
+            'requests': 0,
+            'not_modified': 0,          # 304 응답 수
+            'no_validators': 0,         # ETag/Last-Modified가 없는 200 응답 수
+            'body_bytes': 0,            # 내려받은 게시판 본문 바이트
+            'saved_bytes': 0,           # 304 응답으로 내려받지 않은 본문 바이트
+            'unchanged_links': 0,       # 링크 목록이 지난 확인과 같아 건너뛴 게시판 수
+            'cycles': 0,
+            'unchanged_cycles': 0,      # 게시판이 모두 바뀌지 않은 사이클 수
+            'unchanged_cycle_bytes': 0,  # 바뀌지 않은 사이클에서 내려받은 본문 바이트
+        }
+
+    @staticmethod
+    def get_key(url: str, params: dict = None) -> str:
+        """URL과 쿼리 파라미터로 요청 키를 만드는 함수"""
+        if not params:
+            return url
+        return f"{url}?{urlencode(sorted(params.items()))}"
+
+    def conditional_headers(self, key: str) -> dict:
+        """저장된 검증자로 조건부 요청 헤더를 만드는 함수 (저장된 본문이 없으면 빈 딕셔너리)"""
+        self.stats['requests'] += 1
+        entry = self._entries.get(key)
+        if entry is None:
+            return {}
+        headers = {}
+        if entry.etag:
+            headers['If-None-Match'] = entry.etag
+        if entry.last_modified:
+            headers['If-Modified-Since'] = entry.last_modified
+        return headers
+
+    def get_not_modified(self, key: str) -> Optional[ListingEntry]:
+        """304 응답을 받은 요청의 저장된 본문을 반환하는 함수 (없으면 None)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        self.stats['not_modified'] += 1
+        self.stats['saved_bytes'] += len(entry.content)
+        return entry
+
+    def store(self, key: str, headers, content: bytes, charset: Optional[str]) -> None:
+        """200 응답의 검증자와 본문을 저장하는 함수 (검증자가 없으면 저장하지 않습니다)
+        Args:
+            key (str): 요청 키
+            headers: 응답 헤더
+            content (bytes): 응답 본문
+            charset (str): 응답 charset
+        """
+        self.stats['body_bytes'] += len(content)
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if not etag and not last_modified:
+            self.stats['no_validators'] += 1
+            self._entries.pop(key, None)
+            return
+        self._entries[key] = ListingEntry(etag, last_modified, content, charset)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def links_unchanged(self, portal: str, category, urls: list) -> bool:
+        """링크 목록이 지난 확인과 같은지 확인하고 해시를 갱신하는 함수
+        Args:
+            portal (str): 포털 이름
+            category (str): 카테고리 (카테고리가 없는 스크래퍼는 None)
+            urls (list): 게시판 링크 목록
+        Returns:
+            bool: 지난 확인과 같으면 True
+        """
+        link_hash = hashlib.md5('\n'.join(urls).encode()).hexdigest()
+        previous = self._link_hashes.get((portal, category))
+        self._link_hashes[(portal, category)] = link_hash
+        return previous == link_hash
+
+    def record_unchanged_links(self) -> None:
+        """링크 목록이 바뀌지 않아 건너뛴 게시판을 기록하는 함수"""
+        self.stats['unchanged_links'] += 1
+
+    def record_cycle(self, body_bytes: int, changed: bool) -> None:
+        """스크래퍼 사이클 하나에서 내려받은 게시판 본문 바이트를 기록하는 함수
+        Args:
+            body_bytes (int): 사이클에서 내려받은 게시판 본문 바이트
+            changed (bool): 바뀐 게시판이 있었는지 여부
+        """
+        self.stats['cycles'] += 1
+        if not changed:
+            self.stats['unchanged_cycles'] += 1
+            self.stats['unchanged_cycle_bytes'] += body_bytes
+
+    def get_stats(self) -> dict:
+        """304 응답 수, 절약한 바이트, 바뀌지 않은 사이클당 평균 바이트 등의 통계를 반환하는 함수"""
+        stats = dict(self.stats)
+        stats['entries'] = len(self._entries)
+        stats['not_modified_ratio'] = round(stats['not_modified'] / stats['requests'], 4) if stats['requests'] else 0.0
+        stats['bytes_per_unchanged_cycle'] = (
+            round(stats['unchanged_cycle_bytes'] / stats['unchanged_cycles']) if stats['unchanged_cycles'] else 0
+        )
+        return stats
+
+
+# 프로세스 전역 게시판/피드 조건부 요청 캐시
+listing_cache = ListingCache()
@@ -0,0 +1,182 @@
+import threading
+
+from app.config.settings import LISTING_WATERMARK
+from app.common.db.scraper_manager_database import ScraperManagerDatabase
+from app.common.db.db_executor import db_executor
+from app.common.log.log_config import setup_logger
+from app.models_init import ScrapWatermark
+
+
+class ListingWatermarks:
+    """
+    포털/카테고리별 게시판 워터마크 클래스.
+    마지막으로 확인한 게시판 상단 기사(최신 순 size개)를 scraper_mng DB(scrap_watermark)에 저장해 두고,
+    다음 확인 때는 게시판을 위에서부터 보다가 워터마크에 있고 이미 스크랩한 기사가 stop_run개 연달아 나오면
+    그 아래는 이미 확인한 구간으로 보고 멈춥니다.
+    고정 기사 하나가 맨 위에 있어도 멈추지 않고, 스크랩에 실패한 기사는 이미 스크랩한 기사가 아니므로 다음 확인 때 다시 시도합니다.
+    사이트맵처럼 날짜로 새 기사를 거르는 소스는 확인한 가장 최신 기사 날짜(newest_date)를 함께 저장합니다.
+    """
+
+    def __init__(self, size: int = None, stop_run: int = None):
+        """
+        Args:
+            size (int, optional): 저장할 게시판 상단 기사 수. Defaults to settings.LISTING_WATERMARK['size'].
+            stop_run (int, optional): 멈추기 위해 연달아 나와야 하는 확인한 기사 수. Defaults to settings.LISTING_WATERMARK['stop_run'].
+        """
+        self.size = size or LISTING_WATERMARK['size']
+        self.stop_run = stop_run or LISTING_WATERMARK['stop_run']
+        self._scraper_manager_db = None
+        self._marks = {}            # {(포털, 카테고리): 게시판 상단 URL MD5 리스트}
+        self._newest_urls = {}      # {(포털, 카테고리): 게시판의 가장 최신 기사 URL}
+        self._dates = {}            # {(포털, 카테고리): 확인한 가장 최신 기사 날짜}
+        self._loaded_portals = set()
+        self._write_lock = threading.Lock()
+        self.logger = setup_logger(
+            'listing_watermark',
+            'app/log/listing_watermark.log',
+            level='INFO'
+        )
+        self.stats = {
+            'listings': 0,
+            'early_stops': 0,
+            'listed_urls': 0,
+            'skipped_urls': 0,
+            'saves': 0,
+            'errors': 0,
+        }
+
+    @property
+    def scraper_manager_db(self) -> ScraperManagerDatabase:
+        if self._scraper_manager_db is None:
+            self._scraper_manager_db = ScraperManagerDatabase()
+        return self._scraper_manager_db
+
+    async def load(self, portal: str) -> bool:
+        """포털의 워터마크를 DB 스레드에서 불러오는 함수 (사이클에서 워터마크를 사용하기 전에 호출)
+        불러오기에 성공한 포털은 다시 불러오지 않고, 실패하면 이번에는 워터마크 없이 전체 게시판을 확인하고 다음에 다시 불러옵니다.
+        Args:
+            portal (str): 포털 이름
+        Returns:
+            bool: 워터마크를 불러왔는지 여부
+        """
+        if portal in self._loaded_portals:
+            return True
+        try:
+            watermarks = await db_executor.run(self.scraper_manager_db.get_scrap_watermarks, portal)
+        except Exception as e:
+            self.stats['errors'] += 1
+            self.logger.error(f"THERE WAS AN ERROR WHILE LOADING WATERMARKS FOR {portal}: {e}")
+            return False
+        for watermark in watermarks:
+            key = (portal, watermark.category or None)
+            # 불러오기에 실패했던 동안 메모리에서 갱신한 워터마크가 더 최신이므로 덮어쓰지 않습니다.
+            if key not in self._marks:
+                self._marks[key] = [url_md5 for url_md5 in (watermark.url_md5s or '').split(',') if url_md5]
+                self._newest_urls[key] = watermark.newest_url
+            if watermark.newest_date is not None and key not in self._dates:
+                self._dates[key] = watermark.newest_date
+        self._loaded_portals.add(portal)
+        return True
+
+    def cut(self, portal: str, category, url_md5s: list, is_scraped) -> int:
+        """게시판 URL 리스트(최신 순)에서 이미 확인한 구간이 시작되는 위치를 반환하는 함수
+        Args:
+            portal (str): 포털 이름
+            category (str): 카테고리 (카테고리가 없는 스크래퍼는 None)
+            url_md5s (list): 게시판 URL MD5 리스트 (최신 순)
+            is_scraped (callable): URL MD5를 받아 이미 스크랩했는지 반환하는 함수
+        Returns:
+            int: 이 위치부터는 확인하지 않아도 되는 위치 (멈추지 않으면 리스트 길이)
+        """
+        known = set(self._marks.get((portal, category)) or ())
+        self.stats['listings'] += 1
+        self.stats['listed_urls'] += len(url_md5s)
+
+        stop = len(url_md5s)
+        run = 0
+        for i, url_md5 in enumerate(url_md5s):
+            if url_md5 in known and is_scraped(url_md5):
+                run += 1
+                if run >= self.stop_run:
+                    stop = i - run + 1
+                    break
+            else:
+                run = 0
+        else:
+            # 게시판 끝까지 확인한 기사가 이어지면 그 구간부터 멈춥니다.
+            stop = len(url_md5s) - run
+
+        if stop < len(url_md5s):
+            self.stats['early_stops'] += 1
+            self.stats['skipped_urls'] += len(url_md5s) - stop
+        return stop
+
+    def update(self, portal: str, category, news_urls: list, url_md5s: list) -> None:
+        """게시판 상단 기사로 워터마크를 갱신하는 함수 (바뀐 경우에만 DB에 저장)
+        Args:
+            portal (str): 포털 이름
+            category (str): 카테고리 (카테고리가 없는 스크래퍼는 None)
+            news_urls (list): 게시판 URL 리스트 (최신 순)
+            url_md5s (list): news_urls의 URL MD5 리스트
+        """
+        if not url_md5s:
+            return
+        top_md5s = list(dict.fromkeys(url_md5s))[:self.size]
+        if self._marks.get((portal, category)) == top_md5s:
+            return
+        self._marks[(portal, category)] = top_md5s
+        self._newest_urls[(portal, category)] = news_urls[0]
+        self._save(portal, category)
+
+    def get_date(self, portal: str, category):
+        """확인한 가장 최신 기사 날짜를 반환하는 함수 (없으면 None)"""
+        return self._dates.get((portal, category))
+
+    def set_date(self, portal: str, category, newest_date) -> None:
+        """확인한 가장 최신 기사 날짜를 갱신하는 함수 (더 최신인 경우에만 DB에 저장)
+        Args:
+            portal (str): 포털 이름
+            category (str): 카테고리
+            newest_date (datetime.datetime): 확인한 가장 최신 기사 날짜
+        """
+        previous = self._dates.get((portal, category))
+        if newest_date is None or (previous is not None and newest_date <= previous):
+            return
+        self._dates[(portal, category)] = newest_date
+        self._save(portal, category)
+
+    def _save(self, portal: str, category) -> None:
+        """메모리의 워터마크를 DB 스레드에서 저장하는 함수 (저장을 기다리지 않고, 실패해도 스크래핑은 계속합니다)"""
+        db_executor.submit(self._write, portal, category)
+
+    def _write(self, portal: str, category) -> None:
+        """메모리의 워터마크를 DB에 저장하는 함수 (DB 스레드에서 실행)
+        저장할 때의 메모리 값을 저장하고 저장을 한 번에 하나씩 하므로, 마지막 저장이 항상 최신 워터마크입니다.
+        """
+        key = (portal, category)
+        with self._write_lock:
+            url_md5s = self._marks.get(key) or []
+            try:
+                self.scraper_manager_db.save_scrap_watermark(ScrapWatermark(
+                    portal=portal,
+                    category=category or '',
+                    newest_url=self._newest_urls.get(key),
+                    newest_url_md5=url_md5s[0] if url_md5s else None,
+                    url_md5s=','.join(url_md5s),
+                    newest_date=self._dates.get(key),
+                ))
+                self.stats['saves'] += 1
+            except Exception as e:
+                self.stats['errors'] += 1
+                self.logger.error(f"THERE WAS AN ERROR WHILE SAVING WATERMARK FOR {portal}/{category}: {e}")
+
+    def get_stats(self) -> dict:
+        """게시판 확인 수, 워터마크에서 멈춘 횟수, 건너뛴 URL 수 등의 통계를 반환하는 함수"""
+        stats = dict(self.stats)
+        stats['watermarks'] = len(self._marks)
+        stats['skip_ratio'] = round(stats['skipped_urls'] / stats['listed_urls'], 4) if stats['listed_urls'] else 0.0
+        return stats
+
+
+# 프로세스 전역 게시판 워터마크
+listing_watermarks = ListingWatermarks()
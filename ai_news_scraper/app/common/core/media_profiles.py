@@ -0,0 +1,124 @@
+"""
+매체별 후처리 프로파일.
+미디어 YAML의 profiles 섹션에 매체별로 적은 후처리 단계를 한 번만 컴파일하여
+필드(create_date, image_url 등)별 함수 파이프라인으로 만듭니다.
+
+profiles 섹션 예:
+    profiles:
+      dt:
+        image_url: [{prefix: 'https:'}]
+        create_date: [{split: [': ', -1]}, strip]
+      kidd:
+        with_metadata: false
+        create_date: [{slice: [5, null]}]
+
+후처리 단계 (PROFILE_STEPS)
+- strip: 앞뒤 공백 제거
+- {split: [구분자, 인덱스]}: value.split(구분자)[인덱스]
+- {slice: [시작, 끝]}: value[시작:끝] (null은 생략)
+- {replace: [찾을 문자열, 바꿀 문자열]}: value.replace(...)
+- {prefix: 문자열}: 문자열 + value
+- {join: [[단계...], [단계...]]}: 같은 값에 각 단계 목록을 적용한 결과를 이어 붙임
+"""
+from typing import Callable, Dict
+
+
+def _compile_strip(_=None) -> Callable:
+    return str.strip
+
+
+def _compile_split(args) -> Callable:
+    separator, index = args
+    return lambda value: value.split(separator)[index]
+
+
+def _compile_slice(args) -> Callable:
+    start, stop = args
+    return lambda value: value[start:stop]
+
+
+def _compile_replace(args) -> Callable:
+    old, new = args
+    return lambda value: value.replace(old, new)
+
+
+def _compile_prefix(prefix) -> Callable:
+    return lambda value: f"{prefix}{value}"
+
+
+def _compile_join(step_lists) -> Callable:
+    pipelines = [compile_steps(steps) for steps in step_lists]
+    return lambda value: ''.join(pipeline(value) for pipeline in pipelines)
+
+
+PROFILE_STEPS = {
+    'strip': _compile_strip,
+    'split': _compile_split,
+    'slice': _compile_slice,
+    'replace': _compile_replace,
+    'prefix': _compile_prefix,
+    'join': _compile_join,
+}
+
+
+def compile_steps(steps: list) -> Callable:
+    """후처리 단계 리스트를 하나의 함수로 컴파일하는 함수
+    Args:
+        steps (list): 후처리 단계 리스트 ('strip' 또는 {단계 이름: 인자})
+    Returns:
+        callable: 값을 받아 모든 단계를 차례로 적용한 값을 반환하는 함수
+    Raises:
+        ValueError: 알 수 없는 단계가 있는 경우
+    """
+    funcs = []
+    for step in steps:
+        if isinstance(step, str):
+            name, args = step, None
+        elif isinstance(step, dict) and len(step) == 1:
+            (name, args), = step.items()
+        else:
+            raise ValueError(f"INVALID PROFILE STEP: {step}")
+        if name not in PROFILE_STEPS:
+            raise ValueError(f"UNKNOWN PROFILE STEP: {name}")
+        funcs.append(PROFILE_STEPS[name](args))
+    funcs = tuple(funcs)
+
+    def pipeline(value):
+        for func in funcs:
+            value = func(value)
+        return value
+    return pipeline
+
+
+class MediaProfile:
+    """매체 하나의 후처리 프로파일 (컴파일된 필드별 파이프라인)"""
+
+    __slots__ = ('name', 'with_metadata', 'pipelines')
+
+    def __init__(self, name: str, profile: dict = None):
+        """
+        Args:
+            name (str): 프로파일(매체) 이름
+            profile (dict, optional): 미디어 YAML의 프로파일 {'with_metadata': bool, 필드: [단계...]}
+        """
+        profile = dict(profile or {})
+        self.name = name
+        self.with_metadata = bool(profile.pop('with_metadata', True))
+        self.pipelines: Dict[str, Callable] = {field: compile_steps(steps) for field, steps in profile.items()}
+
+    def process(self, field: str, value):
+        """필드 값에 프로파일의 후처리 파이프라인을 적용하는 함수 (파이프라인이 없거나 값이 비어 있으면 그대로 반환)"""
+        pipeline = self.pipelines.get(field)
+        if pipeline is None or not value:
+            return value
+        return pipeline(value)
+
+
+def load_media_profiles(profiles: dict) -> dict:
+    """미디어 YAML의 profiles 섹션을 컴파일하는 함수
+    Args:
+        profiles (dict): {프로파일 이름: 프로파일}
+    Returns:
+        dict: {프로파일 이름: MediaProfile}
+    """
+    return {name: MediaProfile(name, profile) for name, profile in (profiles or {}).items()}
@@ -0,0 +1,106 @@
+import threading
+from typing import NamedTuple, Optional
+from urllib.parse import urlsplit
+
+from app.config.settings import FILE_PATHS
+from app.common.core.utils import load_yaml
+from app.common.core.media_profiles import MediaProfile, load_media_profiles
+
+
+# 미디어 YAML의 매체 유형별 scrap_manager 파싱 규칙 포털 (None이면 매체 이름과 같은 포털)
+MEDIA_TYPE_RULES_PORTALS = {
+    'type1': 'esg_finance_hub1',
+    'type2': 'esg_finance_hub2',
+    'type3': 'esg_finance_hub3',
+    'type4': 'esg_finance_hub4',
+    'media': None,
+}
+
+NOT_REGISTERED_MEDIA = 'Not Registered'
+
+
+class MediaContext(NamedTuple):
+    """기사 URL 하나의 매체 정보 (변경 불가)"""
+    host: str                       # 미디어 YAML에 등록된 매체 호스트 (미등록 매체는 URL의 호스트)
+    media_name: str
+    rules_portal: Optional[str]     # 파싱 규칙을 가져올 scrap_manager 포털 이름 (미등록 매체는 None)
+    profile: Optional[MediaProfile]  # 컴파일된 후처리 프로파일 (미등록 매체는 None)
+
+    @property
+    def is_registered(self) -> bool:
+        return self.rules_portal is not None
+
+
+class MediaResolver:
+    """
+    기사 URL의 호스트로 매체 정보를 찾는 클래스.
+    미디어 YAML을 한 번만 읽어 호스트 인덱스를 만들고, URL마다 한 번의 조회로 MediaContext를 반환합니다.
+    호스트가 인덱스에 없으면 앞쪽 레이블을 하나씩 떼어낸 상위 도메인으로 찾습니다. (예: m.zdnet.co.kr -> zdnet.co.kr)
+    스크래퍼 속성을 바꾸지 않으므로 여러 기사를 동시에 스크랩해도 안전합니다.
+    """
+
+    def __init__(self, media_yaml_path: str = None):
+        """
+        Args:
+            media_yaml_path (str, optional): 미디어 YAML 파일 경로. Defaults to settings.FILE_PATHS['esg_finance_media'].
+        """
+        self.media_yaml_path = media_yaml_path or FILE_PATHS.get('esg_finance_media')
+        self._lock = threading.Lock()
+        self._hosts = None      # {호스트: MediaContext}
+        self._resolved = {}     # {URL 호스트: MediaContext} (상위 도메인 조회 결과 캐시)
+
+    def _build_index(self) -> dict:
+        """미디어 YAML에서 호스트 인덱스를 만드는 함수 (앞선 매체 유형이 우선)
+        매체별 후처리 프로파일(profiles 섹션)도 여기서 한 번만 컴파일합니다.
+        """
+        media_yaml = load_yaml(self.media_yaml_path) or {}
+        profiles = load_media_profiles(media_yaml.get('profiles'))
+        hosts = {}
+        aliases = {}
+        for media_type, type_rules_portal in MEDIA_TYPE_RULES_PORTALS.items():
+            for host, media_name in (media_yaml.get(media_type) or {}).items():
+                host = host.lower()
+                profile = profiles.get(media_name) or profiles.setdefault(media_name, MediaProfile(media_name))
+                context = MediaContext(host, media_name, type_rules_portal or media_name, profile)
+                hosts.setdefault(host, context)
+                # www.가 붙은 호스트는 www. 없이도 찾을 수 있도록 합니다.
+                if host.startswith('www.'):
+                    aliases.setdefault(host[4:], context)
+        for host, context in aliases.items():
+            hosts.setdefault(host, context)
+        return hosts
+
+    @property
+    def hosts(self) -> dict:
+        if self._hosts is None:
+            with self._lock:
+                if self._hosts is None:
+                    self._hosts = self._build_index()
+        return self._hosts
+
+    def resolve(self, news_url: str) -> MediaContext:
+        """기사 URL의 매체 정보를 반환하는 함수
+        Args:
+            news_url (str): 기사 URL
+        Returns:
+            MediaContext: 매체 정보 (등록되지 않은 매체는 media_name이 'Not Registered')
+        """
+        host = (urlsplit(news_url).hostname or '').lower()
+        context = self._resolved.get(host)
+        if context is None:
+            context = self._lookup(host)
+            self._resolved[host] = context
+        return context
+
+    def _lookup(self, host: str) -> MediaContext:
+        hosts = self.hosts
+        labels = host.split('.')
+        for i in range(len(labels) - 1):
+            context = hosts.get('.'.join(labels[i:]))
+            if context is not None:
+                return context
+        return MediaContext(host, NOT_REGISTERED_MEDIA, None, None)
+
+
+# ESG 금융 허브 미디어 YAML 매체 정보 조회기 (esg_finance, missing 스크래퍼가 공유)
+media_resolver = MediaResolver()
@@ -0,0 +1,155 @@
+import re
+
+import aiohttp
+from bs4 import BeautifulSoup
+from trafilatura import bare_extraction
+
+from app.common.core.http_client import http_client
+
+try:
+    # selectolax(lexbor)가 설치된 경우에만 selectolax 파서 백엔드를 사용할 수 있습니다.
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    import lxml  # noqa: F401
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+
+# 응답 헤더에 charset이 없거나 잘못된 경우 euc-kr로 디코딩하는 매체
+EUC_KR_MEDIA = ["dt", "wsobi", "munhwa", "dailypharm", "boannews"]
+
+# HTML meta 태그의 charset 선언
+META_CHARSET_PATTERN = re.compile(rb'<meta[^>]+charset=["\']?\s*([A-Za-z0-9_-]+)', re.IGNORECASE)
+
+
+class DocumentFetchError(Exception):
+    """기사 HTML을 가져오지 못했을 때 발생하는 예외"""
+
+    def __init__(self, url: str, status: int = None, reason: str = None):
+        self.url = url
+        self.status = status
+        self.reason = reason
+        super().__init__(f"RESPONSE STATUS: {status} {reason} FOR URL: {url}")
+
+
+class NewsDocument:
+    """
+    뉴스 기사 문서 클래스.
+    기사 HTML을 한 번만 내려받고 한 번만 디코딩한 뒤,
+    BeautifulSoup 객체와 trafilatura 추출 결과를 필요할 때 한 번씩만 생성하여
+    bs / trafilatura 파싱 규칙 모두에서 공유합니다.
+    """
+
+    def __init__(self, url: str, content: bytes, charset: str = None, media_name: str = None):
+        """
+        Args:
+            url (str): 기사 URL
+            content (bytes): 기사 HTML 바이트
+            charset (str, optional): 응답 헤더의 charset
+            media_name (str, optional): 매체 이름 (디코딩 규칙에 사용)
+        """
+        self.url = url
+        self.content = content
+        self.charset = charset
+        self.media_name = media_name
+        self._text = None
+        self._soups = {}
+        self._lexbor_tree = None
+        self._trafilatura_results = {}
+
+    @classmethod
+    async def fetch(cls, url: str, headers: dict = None, media_name: str = None) -> 'NewsDocument':
+        """공유 HTTP 세션(호스트별 속도 조절 포함)으로 기사 HTML을 한 번 내려받아 문서 객체를 생성하는 함수
+        Args:
+            url (str): 기사 URL
+            headers (dict, optional): 요청 헤더
+            media_name (str, optional): 매체 이름
+        Returns:
+            NewsDocument: 문서 객체
+        Raises:
+            DocumentFetchError: 응답 상태가 200이 아닌 경우
+        """
+        try:
+            return await cls._fetch(url, headers, media_name)
+        except aiohttp.ClientSSLError:
+            # 인증서가 잘못된 매체가 있어 SSL 검증 없이 한 번 더 시도합니다.
+            return await cls._fetch(url, headers, media_name, ssl=False)
+
+    @classmethod
+    async def _fetch(cls, url, headers, media_name, ssl=None) -> 'NewsDocument':
+        async with http_client.request(url, headers=headers, ssl=ssl) as response:
+            if response.status != 200:
+                raise DocumentFetchError(url, response.status, response.reason)
+            content = await response.read()
+            return cls(url, content, charset=response.charset, media_name=media_name)
+
+    @property
+    def text(self) -> str:
+        """디코딩된 HTML 문자열 (최초 접근 시 한 번만 디코딩)"""
+        if self._text is None:
+            self._text = self._decode()
+        return self._text
+
+    def _decode(self) -> str:
+        """응답 헤더 charset > 매체별 규칙 > meta charset > utf-8 순서로 디코딩하는 함수"""
+        candidates = []
+        if self.charset:
+            candidates.append(self.charset)
+        if self.media_name in EUC_KR_MEDIA:
+            candidates.append('euc-kr')
+        matched = META_CHARSET_PATTERN.search(self.content[:4096])
+        if matched:
+            candidates.append(matched.group(1).decode('ascii', 'ignore'))
+        candidates.append('utf-8')
+
+        for encoding in candidates:
+            try:
+                return self.content.decode(encoding)
+            except (UnicodeDecodeError, LookupError):
+                continue
+
+        if self.media_name in EUC_KR_MEDIA:
+            return self.content.decode('euc-kr', 'ignore')
+        return self.content.decode('utf-8', 'ignore')
+
+    @property
+    def soup(self) -> BeautifulSoup:
+        """BeautifulSoup 객체 (html.parser, 최초 접근 시 한 번만 파싱)"""
+        return self.get_soup()
+
+    def get_soup(self, features: str = 'html.parser', parse_only=None) -> BeautifulSoup:
+        """파서별 BeautifulSoup 객체를 반환하는 함수 (파서와 SoupStrainer 조합별로 한 번만 파싱)
+        Args:
+            features (str): BeautifulSoup 파서 ('html.parser', 'lxml')
+            parse_only (SoupStrainer, optional): 파싱할 요소를 제한하는 SoupStrainer
+        Returns:
+            BeautifulSoup: BeautifulSoup 객체
+        """
+        key = (features, id(parse_only) if parse_only is not None else None)
+        if key not in self._soups:
+            self._soups[key] = BeautifulSoup(self.text, features, parse_only=parse_only)
+        return self._soups[key]
+
+    def get_lexbor_tree(self):
+        """selectolax(lexbor) 트리를 반환하는 함수 (최초 접근 시 한 번만 파싱)
+        BeautifulSoup의 get_text()와 같은 결과를 내도록 script, style 요소는 제거합니다.
+        """
+        if self._lexbor_tree is None:
+            self._lexbor_tree = LexborHTMLParser(self.text)
+            self._lexbor_tree.strip_tags(['script', 'style'])
+        return self._lexbor_tree
+
+    def get_trafilatura_result(self, with_metadata: bool = True) -> dict:
+        """trafilatura 추출 결과를 반환하는 함수 (옵션별로 한 번만 추출)
+        Args:
+            with_metadata (bool): 메타데이터 추출 여부
+        Returns:
+            dict: trafilatura 추출 결과
+        """
+        if with_metadata not in self._trafilatura_results:
+            self._trafilatura_results[with_metadata] = bare_extraction(self.text, with_metadata=with_metadata) or {}
+        return self._trafilatura_results[with_metadata]
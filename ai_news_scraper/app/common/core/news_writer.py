@@ -0,0 +1,169 @@
+import asyncio
+import contextvars
+import time
+import weakref
+
+from app.config.settings import NEWS_WRITER
+
+
+# flush()가 큐에 넣는 표시 (이 표시까지 모인 기사를 바로 저장합니다)
+_FLUSH = object()
+
+# 저장 작업을 시작한 쓰기 큐 (프로세스 종료 시 close_news_writers로 남은 기사를 저장합니다)
+_open_writers = weakref.WeakSet()
+
+
+class NewsWriter:
+    """
+    스크랩한 뉴스 데이터를 모아서 저장하는 쓰기 지연(write-behind) 큐 클래스.
+    DartNoticeScraper._db_writer처럼 asyncio.Queue와 저장 작업(writer task) 하나로 저장하되,
+    batch_size개가 모이거나 첫 기사를 받은 뒤 flush_interval초가 지나면 모인 기사를 한 번에 저장합니다.
+    큐 크기를 제한하므로 DB 저장이 밀리면 기사 스크랩(put)이 기다립니다(backpressure).
+    저장 작업은 배치를 하나씩 순서대로 저장하고(save_func는 DB 스레드에서 저장하는 코루틴 함수),
+    저장 결과(on_saved)는 이벤트 루프에서 받으므로 세션 로그 카운트는 한 곳에서만 바뀝니다.
+    """
+
+    def __init__(self, name: str, save_func, on_saved, on_error, config: dict = None):
+        """
+        Args:
+            name (str): 이름 (스크래퍼 이름)
+            save_func (callable): 뉴스 데이터 리스트를 받아 저장 결과를 반환하는 코루틴 함수
+            on_saved (callable): 저장 결과를 받는 함수 (이벤트 루프에서 실행)
+            on_error (callable): 저장 중 발생한 예외를 받는 함수 (이벤트 루프에서 실행)
+            config (dict, optional): 쓰기 큐 설정. Defaults to settings.NEWS_WRITER.
+        """
+        self.name = name
+        self.config = {**NEWS_WRITER, **(config or {})}
+        self._save_func = save_func
+        self._on_saved = on_saved
+        self._on_error = on_error
+        self._queue = None
+        self._task = None
+        self._loop = None
+        self.stats = {
+            'queued': 0,
+            'batches': 0,
+            'saved': 0,
+            'size_flushes': 0,      # batch_size개가 모여서 저장한 수
+            'time_flushes': 0,      # flush_interval초가 지나서 저장한 수
+            'forced_flushes': 0,    # flush()로 저장한 수
+            'errors': 0,
+            'max_queue_depth': 0,
+            'put_wait_time': 0.0,   # 큐가 가득 차서 기사 스크랩이 기다린 시간(초)
+            'save_time': 0.0,       # DB 저장에 걸린 시간(초)
+        }
+
+    def _ensure_started(self) -> None:
+        """현재 이벤트 루프에 큐와 저장 작업을 만드는 함수 (이미 있으면 그대로 사용)"""
+        loop = asyncio.get_running_loop()
+        if self._task is not None and not self._task.done() and self._loop is loop:
+            return
+        self._loop = loop
+        self._queue = asyncio.Queue(maxsize=max(1, self.config['queue_size']))
+        # 저장 작업이 처음 put한 기사의 에러 로그 상태(contextvars)를 물려받지 않도록 빈 컨텍스트에서 만듭니다.
+        self._task = contextvars.Context().run(loop.create_task, self._writer())
+        _open_writers.add(self)
+
+    async def put(self, news_data) -> None:
+        """뉴스 데이터를 쓰기 큐에 넣는 함수 (큐가 가득 차면 자리가 날 때까지 기다립니다)"""
+        self._ensure_started()
+        self.stats['queued'] += 1
+        if self._queue.full():
+            start = time.perf_counter()
+            await self._queue.put(news_data)
+            self.stats['put_wait_time'] += time.perf_counter() - start
+        else:
+            self._queue.put_nowait(news_data)
+        self.stats['max_queue_depth'] = max(self.stats['max_queue_depth'], self._queue.qsize())
+
+    async def flush(self) -> None:
+        """쓰기 큐에 넣은 뉴스 데이터를 모두 저장할 때까지 기다리는 함수"""
+        if self._task is None or self._task.done():
+            return
+        await self._queue.put(_FLUSH)
+        await self._queue.join()
+
+    async def _next_batch(self) -> tuple:
+        """batch_size개가 모이거나, flush_interval초가 지나거나, flush 표시가 나올 때까지 뉴스 데이터를 모으는 함수
+        Returns:
+            tuple: (뉴스 데이터 리스트, 큐에서 꺼낸 항목 수, 저장 이유)
+        """
+        batch = []
+        taken = 0
+        deadline = None
+        while True:
+            if deadline is None:
+                item = await self._queue.get()
+            else:
+                timeout = deadline - self._loop.time()
+                if timeout <= 0:
+                    return batch, taken, 'time_flushes'
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    return batch, taken, 'time_flushes'
+            taken += 1
+            if item is _FLUSH:
+                return batch, taken, 'forced_flushes'
+            batch.append(item)
+            if len(batch) >= self.config['batch_size']:
+                return batch, taken, 'size_flushes'
+            if deadline is None:
+                deadline = self._loop.time() + self.config['flush_interval']
+
+    async def _writer(self) -> None:
+        """모인 뉴스 데이터를 배치 단위로 저장하는 작업"""
+        while True:
+            batch, taken, reason = await self._next_batch()
+            try:
+                if batch:
+                    self.stats[reason] += 1
+                    start = time.perf_counter()
+                    try:
+                        result = await self._save_func(batch)
+                        self.stats['batches'] += 1
+                        self.stats['saved'] += len(batch)
+                        self._on_saved(result, batch)
+                    except Exception as e:
+                        self.stats['errors'] += 1
+                        self._on_error(e, batch)
+                    finally:
+                        self.stats['save_time'] += time.perf_counter() - start
+            finally:
+                for _ in range(taken):
+                    self._queue.task_done()
+
+    async def close(self) -> None:
+        """남은 뉴스 데이터를 저장하고 저장 작업을 정리하는 함수"""
+        await self.flush()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        _open_writers.discard(self)
+
+    def get_stats(self) -> dict:
+        """저장한 배치 수, 저장 이유별 횟수, 큐 대기 시간 등의 통계를 반환하는 함수"""
+        stats = dict(self.stats)
+        stats['queue_depth'] = self._queue.qsize() if self._queue is not None else 0
+        stats['avg_batch_size'] = round(stats['saved'] / stats['batches'], 2) if stats['batches'] else 0.0
+        stats['put_wait_time'] = round(stats['put_wait_time'], 3)
+        stats['save_time'] = round(stats['save_time'], 3)
+        return stats
+
+
+async def close_news_writers() -> list:
+    """저장 작업을 시작한 모든 쓰기 큐의 남은 뉴스 데이터를 저장하고 닫는 함수 (DB 스레드 풀을 닫기 전에 호출)
+    Returns:
+        list: [(쓰기 큐 이름, 예외), ...] 닫지 못한 쓰기 큐
+    """
+    errors = []
+    for writer in list(_open_writers):
+        try:
+            await writer.close()
+        except Exception as e:
+            errors.append((writer.name, e))
+    return errors
@@ -0,0 +1,197 @@
+import json
+import time
+import asyncio
+import threading
+
+from sqlalchemy import func
+
+from app.config.settings import PARSING_RULE_CACHE
+from app.common.db.scraper_manager_database import ScraperManagerDatabase
+from app.common.db.db_executor import db_executor
+from app.common.log.log_config import setup_logger
+from app.models_init import ScrapManager
+
+
+# 무효화된 캐시 버전 (어떤 버전과도 같지 않으므로 다음 조회 때 다시 불러옵니다)
+_INVALIDATED = object()
+
+class ParsingRuleCache:
+    """
+    포털별 파싱 규칙 캐시 클래스.
+    scrap_manager 테이블의 파싱 규칙을 포털별로 메모리에 두고 모든 스크래퍼가 공유합니다.
+    check_interval 초마다 한 번의 쿼리로 포털별 버전(규칙 수, 최종 수정 시각, 최대 id)을 확인하여
+    버전이 바뀐 포털의 규칙만 다시 불러오므로, 조회는 메모리에서 끝나고 규칙 수정은 몇 초 안에 반영됩니다.
+    이벤트 루프에서 조회할 때는 버전 확인/재로딩을 DB 스레드(db_executor)로 넘기고 그동안 캐시된 규칙을 반환하므로,
+    쿼리 때문에 이벤트 루프가 멈추지 않습니다. 캐시된 규칙이 없는 포털은 사용하기 전에 warm으로 DB 스레드에서 불러옵니다.
+    _lock은 DB 스레드(와 이벤트 루프 밖)에서만 잡습니다.
+    """
+
+    def __init__(self, check_interval: float = None):
+        """
+        Args:
+            check_interval (float, optional): 버전 확인 주기(초). Defaults to settings.PARSING_RULE_CACHE['check_interval'].
+        """
+        self.check_interval = PARSING_RULE_CACHE['check_interval'] if check_interval is None else check_interval
+        self._scraper_manager_db = None
+        self._lock = threading.Lock()
+        self._versions = {}     # {포털: 버전}
+        self._rules = {}        # {포털: (버전, 파싱 규칙 딕셔너리)}
+        self._checked_at = 0.0
+        self._refreshing = set()    # DB 스레드에서 다시 불러오는 중인 포털
+        self.logger = setup_logger(
+            'parsing_rule_cache',
+            'app/log/parsing_rule_cache.log',
+            level='INFO'
+        )
+        self.stats = {
+            'hits': 0,
+            'reloads': 0,
+            'version_checks': 0,
+            'background_refreshes': 0,  # DB 스레드로 넘긴 버전 확인/재로딩 수
+            'cold_misses': 0,           # warm으로 불러오지 않아 빈 규칙을 반환한 수
+            'errors': 0,
+        }
+
+    @property
+    def scraper_manager_db(self) -> ScraperManagerDatabase:
+        if self._scraper_manager_db is None:
+            self._scraper_manager_db = ScraperManagerDatabase()
+        return self._scraper_manager_db
+
+    def get(self, portal: str) -> dict:
+        """포털의 파싱 규칙 딕셔너리를 반환하는 함수
+        버전이 바뀌지 않았으면 같은 딕셔너리 객체를 반환하므로 컴파일된 규칙 캐시도 그대로 사용됩니다.
+        Args:
+            portal (str): scrap_manager의 포털 이름
+        Returns:
+            dict: 파싱 규칙 딕셔너리 {요소: (파싱 방법, 파싱 규칙)} (규칙이 없으면 빈 딕셔너리)
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return self._get(portal)
+
+        # 이벤트 루프에서는 DB 쿼리를 기다리지 않습니다.
+        # (DB 스레드가 쿼리하는 동안 _lock을 잡고 있으므로 여기서는 _lock 없이 딕셔너리를 읽기만 합니다)
+        cached = self._rules.get(portal)
+        stale = cached is None or (
+            time.monotonic() - self._checked_at >= self.check_interval
+            or cached[0] != self._versions.get(portal)
+        )
+        if stale and portal not in self._refreshing:
+            self._refreshing.add(portal)
+            self.stats['background_refreshes'] += 1
+            db_executor.submit(self._refresh, portal)
+        if cached is None:
+            # warm으로 불러오지 않은 포털은 DB 스레드에서 불러오는 동안 빈 규칙을 반환합니다.
+            # (스크래퍼의 기사 추출 경로는 warm_parsing_rules를 먼저 기다리므로, 여기에 오면 warm이 빠진 호출 경로입니다)
+            self.stats['cold_misses'] += 1
+            self.logger.error(f"PARSING RULES ARE NOT WARMED FOR {portal}, LOADING IN BACKGROUND")
+            return {}
+        self.stats['hits'] += 1
+        return cached[1]
+
+    async def warm(self, portal: str) -> dict:
+        """포털의 파싱 규칙이 캐시에 없으면 DB 스레드에서 불러오는 함수 (이벤트 루프에서 규칙을 사용하기 전에 호출)
+        Args:
+            portal (str): scrap_manager의 포털 이름
+        Returns:
+            dict: 파싱 규칙 딕셔너리 (규칙이 없으면 빈 딕셔너리)
+        """
+        if portal in self._rules:
+            return self.get(portal)
+        return await db_executor.run(self._get, portal)
+
+    def _refresh(self, portal: str) -> None:
+        """DB 스레드에서 포털의 파싱 규칙을 다시 확인하는 함수"""
+        try:
+            self._get(portal)
+        finally:
+            self._refreshing.discard(portal)
+
+    def _get(self, portal: str) -> dict:
+        """버전을 확인하고 바뀌었으면 DB에서 다시 불러와 파싱 규칙 딕셔너리를 반환하는 함수"""
+        with self._lock:
+            if time.monotonic() - self._checked_at >= self.check_interval:
+                self._check_versions()
+
+            version = self._versions.get(portal)
+            cached = self._rules.get(portal)
+            if cached is not None and cached[0] == version:
+                self.stats['hits'] += 1
+                return cached[1]
+
+            parsing_rules_dict = self._load(portal)
+            if parsing_rules_dict is None:
+                # 불러오지 못하면 이전 규칙을 계속 사용합니다.
+                return cached[1] if cached is not None else {}
+            self._rules[portal] = (version, parsing_rules_dict)
+            return parsing_rules_dict
+
+    def invalidate(self, portal: str = None) -> None:
+        """캐시를 무효화하는 함수 (다음 조회 시 버전을 다시 확인합니다)
+        Args:
+            portal (str, optional): 규칙을 다시 불러올 포털 이름. 없으면 모든 포털.
+        """
+        # API 엔드포인트(이벤트 루프)에서 호출하므로 _lock을 잡지 않습니다.
+        # DB 스레드가 다시 불러오는 중이면 그 결과가 무효화를 덮어쓸 수 있지만, _checked_at을 초기화하므로 다음 조회 때 버전을 다시 확인합니다.
+        # 규칙은 지우지 않고 버전만 무효화하여, 다시 불러오는 동안에도 이전 규칙을 사용합니다.
+        for rules_portal in ([portal] if portal is not None else list(self._rules)):
+            cached = self._rules.get(rules_portal)
+            if cached is not None:
+                self._rules[rules_portal] = (_INVALIDATED, cached[1])
+        self._checked_at = 0.0
+
+    def _check_versions(self) -> None:
+        """모든 포털의 파싱 규칙 버전을 한 번의 쿼리로 확인하는 함수"""
+        self._checked_at = time.monotonic()
+        self.stats['version_checks'] += 1
+        session = self.scraper_manager_db.SessionLocal()
+        try:
+            rows = session.query(
+                ScrapManager.portal,
+                func.count(ScrapManager.id),
+                func.max(ScrapManager.updated),
+                func.max(ScrapManager.id),
+            ).group_by(ScrapManager.portal).all()
+            self._versions = {portal: (count, str(updated), max_id) for portal, count, updated, max_id in rows}
+        except Exception as e:
+            self.stats['errors'] += 1
+            self.logger.error(f"THERE WAS AN ERROR WHILE CHECKING PARSING RULE VERSIONS: {e}")
+        finally:
+            session.close()
+
+    def _load(self, portal: str):
+        """포털의 파싱 규칙을 DB에서 불러오는 함수 (실패하면 None)"""
+        session = self.scraper_manager_db.SessionLocal()
+        try:
+            parsing_rules_dict = {}
+            for parsing_rule in session.query(ScrapManager).filter(ScrapManager.portal == portal).all():
+                parsing_rule_dict = json.loads(parsing_rule.parsing_rule) if isinstance(parsing_rule.parsing_rule, str) else parsing_rule.parsing_rule
+                parsing_rules_dict[parsing_rule.parsing_target_name] = (
+                    parsing_rule.parsing_method,
+                    parsing_rule_dict,
+                )
+            self.stats['reloads'] += 1
+            if parsing_rules_dict:
+                self.logger.info(f"PARSING RULES SUCCESSFULLY LOADED FOR {portal}")
+            else:
+                self.logger.error(f"PARSING RULES IS EMPTY FOR {portal}")
+            return parsing_rules_dict
+        except Exception as e:
+            self.stats['errors'] += 1
+            self.logger.error(f"THERE WAS AN ERROR WHILE TRANSFORMING PARSING RULES TO DICTIONARY FOR {portal}: {e}")
+            return None
+        finally:
+            session.close()
+
+    def get_stats(self) -> dict:
+        """캐시 적중/재로딩 횟수와 포털별 버전을 반환하는 함수"""
+        stats = dict(self.stats)
+        stats['check_interval'] = self.check_interval
+        stats['portals'] = {portal: version[0] for portal, (version, _) in self._rules.items() if version and version is not _INVALIDATED}
+        return stats
+
+
+# 프로세스 전역 파싱 규칙 캐시
+parsing_rule_cache = ParsingRuleCache()
@@ -0,0 +1,296 @@
+"""
+파싱 규칙 엔진.
+scrap_manager의 JSON 파싱 규칙을 한 번만 컴파일하여 실행 가능한 추출기 객체(CompiledRuleSet)로 만듭니다.
+CSS 선택자는 미리 컴파일하고, 속성/텍스트 추출 함수는 규칙에 맞게 미리 묶어 두므로
+기사마다 규칙 딕셔너리를 해석하지 않고 추출기 목록만 차례로 실행합니다.
+
+파서 백엔드 (PARSER_BACKENDS)
+- html.parser: 기존 동작 (기준 결과)
+- lxml: lxml 파서로 만든 BeautifulSoup
+- lxml_strainer: 규칙이 참조하는 태그의 하위 트리만 lxml로 파싱 (SoupStrainer)
+- selectolax: CSS 선택자만 사용하는 규칙 묶음을 selectolax(lexbor)로 추출
+사용할 수 없는 백엔드(미설치, 규칙이 지원하지 않음)는 html.parser로 대체합니다.
+"""
+import re
+import json
+import traceback
+
+import soupsieve
+from bs4 import SoupStrainer
+
+from app.common.core.news_document import LexborHTMLParser, LXML_AVAILABLE
+
+
+PARSER_BACKENDS = ('html.parser', 'lxml', 'lxml_strainer', 'selectolax')
+
+# CSS 선택자 맨 앞의 태그 이름 (SoupStrainer 대상 태그를 만들 때 사용)
+LEADING_TAG_PATTERN = re.compile(r'^\s*([A-Za-z][A-Za-z0-9-]*)')
+# 하위 트리로 제한해도 문서 전체를 파싱하는 것과 같은 태그
+WHOLE_DOCUMENT_TAGS = {'html', 'head', 'body'}
+
+
+class BsField:
+    """bs 파싱 규칙 하나를 컴파일한 추출기"""
+
+    __slots__ = ('name', 'default', 'find_all', 'select', 'get_value', 'selector', 'attribute_name', 'strain_tags')
+
+    def __init__(self, name: str, rule: dict):
+        """
+        Args:
+            name (str): 추출할 요소 이름
+            rule (dict): bs 파싱 규칙 (selector, find, tag, find_attributes, attribute_name, default, find_all)
+        """
+        self.name = name
+        self.default = rule.get('default')
+        self.find_all = bool(rule.get('find_all'))
+        self.selector = rule.get('selector') or None
+        self.attribute_name = rule.get('attribute_name')
+        self.select = self._compile_select(rule)
+        self.get_value = self._compile_getter(self.attribute_name, self.default)
+        self.strain_tags = self._get_strain_tags(rule)
+
+    def _compile_select(self, rule: dict):
+        """요소를 찾는 함수를 만드는 함수 (CSS 선택자는 미리 컴파일)"""
+        selector = rule.get('selector')
+        if selector:
+            pattern = soupsieve.compile(selector)
+            return pattern.select if self.find_all else pattern.select_one
+
+        tag = rule.get('tag')
+        if rule.get('find') and tag:
+            find_attributes = rule.get('find_attributes')
+            if self.find_all:
+                return lambda soup: soup.find_all(tag, find_attributes)
+            return lambda soup: soup.find(tag, find_attributes)
+        return None
+
+    def _get_strain_tags(self, rule: dict):
+        """이 규칙이 찾는 요소를 포함하는 최상위 태그 이름 집합을 반환하는 함수 (알 수 없으면 None)"""
+        if self.select is None:
+            return set()
+        if self.selector:
+            tags = set()
+            for part in self.selector.split(','):
+                matched = LEADING_TAG_PATTERN.match(part)
+                if not matched:
+                    return None
+                tags.add(matched.group(1).lower())
+        else:
+            tag = rule.get('tag')
+            tags = {tag.lower()} if isinstance(tag, str) else None
+        if not tags or tags & WHOLE_DOCUMENT_TAGS:
+            return None
+        return tags
+
+    @staticmethod
+    def _compile_getter(attribute_name: str, default):
+        """찾은 요소에서 값을 꺼내는 함수를 만드는 함수"""
+        if attribute_name:
+            return lambda element: element.get(attribute_name, default)
+        return lambda element: element.get_text().strip()
+
+    def extract(self, soup):
+        """soup에서 요소 값을 추출하는 함수 (예외는 호출한 쪽에서 처리)"""
+        if self.select is None:
+            return self.default
+        element = self.select(soup)
+        if not element:
+            return self.default
+        if self.find_all:
+            return [self.get_value(el) for el in element]
+        return self.get_value(element)
+
+    def extract_lexbor(self, tree):
+        """selectolax(lexbor) 트리에서 요소 값을 추출하는 함수 (CSS 선택자 규칙만 지원)"""
+        if self.find_all:
+            nodes = tree.css(self.selector)
+            if not nodes:
+                return self.default
+            return [self._get_lexbor_value(node) for node in nodes]
+        node = tree.css_first(self.selector)
+        if node is None:
+            return self.default
+        return self._get_lexbor_value(node)
+
+    def _get_lexbor_value(self, node):
+        if self.attribute_name:
+            return node.attributes.get(self.attribute_name, self.default)
+        return node.text().strip()
+
+
+class TrafilaturaField:
+    """trafilatura 파싱 규칙 하나를 컴파일한 추출기"""
+
+    __slots__ = ('name', 'path')
+
+    def __init__(self, name: str, rule: dict):
+        """
+        Args:
+            name (str): 추출할 요소 이름
+            rule (dict): trafilatura 결과에서 값을 찾아갈 경로
+        """
+        self.name = name
+        self.path = tuple(rule.values()) if rule else None
+
+    def extract(self, trafilatura_result: dict):
+        """trafilatura 추출 결과에서 경로를 따라 값을 가져오는 함수"""
+        if self.path is None:
+            return None
+        result = trafilatura_result
+        for key in self.path:
+            result = result.get(key)
+        return result
+
+
+class CompiledRuleSet:
+    """
+    한 포털(또는 매체 유형)의 파싱 규칙 전체를 컴파일한 추출기 묶음.
+    피클할 때는 규칙 딕셔너리만 보내고, 워커 프로세스에서는 키별로 한 번만 컴파일합니다.
+    """
+
+    def __init__(self, key: str, parsing_rules_dict: dict):
+        """
+        Args:
+            key (str): 규칙 묶음 키 (규칙 내용의 지문)
+            parsing_rules_dict (dict): 파싱 규칙 딕셔너리 {요소: (파싱 방법, 파싱 규칙)}
+        """
+        self.key = key
+        self.parsing_rules_dict = parsing_rules_dict
+        self.bs_fields = []
+        self.trafilatura_fields = []
+        for name, (method, rule) in parsing_rules_dict.items():
+            if method == "bs":
+                self.bs_fields.append(BsField(name, rule))
+            elif method == "trafilatura":
+                self.trafilatura_fields.append(TrafilaturaField(name, rule))
+        self.fields_by_name = {field.name: field for field in self.bs_fields + self.trafilatura_fields}
+        self.strainer = self._build_strainer()
+        self.css_only = all(field.selector or field.select is None for field in self.bs_fields)
+
+    def __reduce__(self):
+        return (load_rule_set, (self.key, self.parsing_rules_dict))
+
+    def _build_strainer(self):
+        """bs 규칙이 참조하는 태그의 하위 트리만 파싱하는 SoupStrainer를 만드는 함수
+        맨 앞에 태그 이름이 없는 선택자(.class, #id 등)가 하나라도 있으면 만들지 않습니다.
+        """
+        tags = set()
+        for field in self.bs_fields:
+            if field.strain_tags is None:
+                return None
+            tags |= field.strain_tags
+        return SoupStrainer(sorted(tags)) if tags else None
+
+    def resolve_backend(self, parser_backend: str) -> str:
+        """이 규칙 묶음에서 실제로 사용할 파서 백엔드를 결정하는 함수
+        Args:
+            parser_backend (str): 요청한 파서 백엔드
+        Returns:
+            str: 실제 사용할 파서 백엔드 (사용할 수 없으면 'html.parser')
+        """
+        if parser_backend in ('lxml', 'lxml_strainer'):
+            if not LXML_AVAILABLE:
+                return 'html.parser'
+            if parser_backend == 'lxml_strainer' and self.strainer is None:
+                return 'lxml'
+            return parser_backend
+        if parser_backend == 'selectolax':
+            if LexborHTMLParser is None or not self.css_only:
+                return 'html.parser'
+            return parser_backend
+        return 'html.parser'
+
+    def extract(self, document, with_metadata: bool = True, parser_backend: str = 'html.parser') -> dict:
+        """문서에서 모든 요소를 추출하는 함수
+        Args:
+            document (NewsDocument): 기사 문서 객체
+            with_metadata (bool): trafilatura 메타데이터 추출 여부
+            parser_backend (str): bs 규칙에 사용할 파서 백엔드 (PARSER_BACKENDS)
+        Returns:
+            dict: {'data': 추출된 필드 dict, 'errors': 요소별 에러 리스트}
+        """
+        data = {}
+        errors = []
+        if self.bs_fields:
+            backend = self.resolve_backend(parser_backend)
+            if backend == 'selectolax':
+                tree = document.get_lexbor_tree()
+                extract_field = lambda field: field.extract_lexbor(tree)
+            else:
+                if backend == 'lxml_strainer':
+                    soup = document.get_soup('lxml', self.strainer)
+                elif backend == 'lxml':
+                    soup = document.get_soup('lxml')
+                else:
+                    soup = document.soup
+                extract_field = lambda field: field.extract(soup)
+            for field in self.bs_fields:
+                try:
+                    data[field.name] = extract_field(field)
+                except Exception as e:
+                    data[field.name] = field.default
+                    errors.append(_error(field.name, e))
+        if self.trafilatura_fields:
+            try:
+                trafilatura_result = document.get_trafilatura_result(with_metadata)
+            except Exception as e:
+                trafilatura_result = None
+                trafilatura_error = e
+            for field in self.trafilatura_fields:
+                if trafilatura_result is None:
+                    data[field.name] = None
+                    errors.append(_error(field.name, trafilatura_error))
+                    continue
+                try:
+                    data[field.name] = field.extract(trafilatura_result)
+                except Exception as e:
+                    data[field.name] = None
+                    errors.append(_error(field.name, e))
+        return {'data': data, 'errors': errors}
+
+
+def _error(element: str, exception: Exception) -> dict:
+    return {
+        'element': element,
+        'exception': repr(exception),
+        'stack_trace': traceback.format_exc(),
+    }
+
+
+# 컴파일된 규칙 묶음 캐시 (규칙 지문 -> CompiledRuleSet)
+_rule_sets_by_key = {}
+# 규칙 딕셔너리 객체별 캐시 (id -> (규칙 딕셔너리, CompiledRuleSet)), 지문 계산도 한 번만 합니다.
+_rule_sets_by_id = {}
+_MAX_CACHED_RULE_DICTS = 256
+
+
+def get_rule_key(parsing_rules_dict: dict) -> str:
+    """파싱 규칙 내용의 지문을 만드는 함수"""
+    return json.dumps(parsing_rules_dict, sort_keys=True, ensure_ascii=False, default=str)
+
+
+def load_rule_set(key: str, parsing_rules_dict: dict) -> CompiledRuleSet:
+    """키에 해당하는 컴파일된 규칙 묶음을 반환하는 함수 (없으면 컴파일하여 캐시)"""
+    rule_set = _rule_sets_by_key.get(key)
+    if rule_set is None:
+        rule_set = _rule_sets_by_key[key] = CompiledRuleSet(key, parsing_rules_dict)
+    return rule_set
+
+
+def get_rule_set(parsing_rules_dict: dict) -> CompiledRuleSet:
+    """파싱 규칙 딕셔너리를 컴파일된 규칙 묶음으로 바꾸는 함수
+    같은 딕셔너리 객체는 지문 계산 없이 바로 캐시에서 찾고, 내용이 같은 딕셔너리는 같은 규칙 묶음을 공유합니다.
+    Args:
+        parsing_rules_dict (dict): 파싱 규칙 딕셔너리 {요소: (파싱 방법, 파싱 규칙)}
+    Returns:
+        CompiledRuleSet: 컴파일된 규칙 묶음
+    """
+    cached = _rule_sets_by_id.get(id(parsing_rules_dict))
+    if cached is not None and cached[0] is parsing_rules_dict:
+        return cached[1]
+
+    rule_set = load_rule_set(get_rule_key(parsing_rules_dict), parsing_rules_dict)
+    if len(_rule_sets_by_id) >= _MAX_CACHED_RULE_DICTS:
+        _rule_sets_by_id.clear()
+    _rule_sets_by_id[id(parsing_rules_dict)] = (parsing_rules_dict, rule_set)
+    return rule_set
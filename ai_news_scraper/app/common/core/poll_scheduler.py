@@ -0,0 +1,108 @@
+import time
+
+from app.config.settings import POLL_SCHEDULER
+
+
+class PollSchedule:
+    """(포털, 카테고리) 하나의 게시판 확인 주기 상태"""
+
+    __slots__ = ('interval', 'next_poll', 'polls', 'listed', 'new', 'last_miss_ratio')
+
+    def __init__(self, interval: float):
+        self.interval = interval    # 현재 확인 주기(초)
+        self.next_poll = 0.0        # 다음 확인 시각 (time.monotonic, 0이면 바로 확인)
+        self.polls = 0
+        self.listed = 0             # 게시판에서 가져온 URL 수 (누적)
+        self.new = 0                # 그중 처음 보는 URL 수 (누적)
+        self.last_miss_ratio = None  # 마지막 확인의 새 기사 비율
+
+
+class PollScheduler:
+    """
+    포털의 카테고리별 게시판 확인 주기를 조절하는 클래스.
+    게시판을 확인할 때마다 가져온 URL 중 처음 보는 URL의 비율(중복 확인 미스 비율)을 보고
+    새 기사가 거의 없는 카테고리는 주기를 늘리고, 새 기사가 많은(놓칠 수 있는) 카테고리는 주기를 줄입니다.
+    주기는 스크래퍼의 기본 주기(interval_time_sleep)에 min_factor, max_factor를 곱한 범위 안에서 조절됩니다.
+    """
+
+    def __init__(self, portal: str, base_interval: float, config: dict = None):
+        """
+        Args:
+            portal (str): 포털(스크래퍼) 이름
+            base_interval (float): 기본 확인 주기(초) (스크래퍼의 interval_time_sleep)
+            config (dict, optional): 주기 조절 설정. Defaults to settings.POLL_SCHEDULER.
+        """
+        self.portal = portal
+        self.config = {**POLL_SCHEDULER, **(config or {})}
+        self.base_interval = base_interval
+        self.min_interval = max(self.config['min_interval'], base_interval * self.config['min_factor'])
+        self.max_interval = max(self.min_interval, base_interval * self.config['max_factor'])
+        self._schedules = {}    # {카테고리: PollSchedule} (카테고리가 없는 스크래퍼는 None)
+
+    def get_schedule(self, category: str = None) -> PollSchedule:
+        """카테고리의 PollSchedule을 반환하는 함수 (처음 보는 카테고리는 기본 주기로 생성)"""
+        schedule = self._schedules.get(category)
+        if schedule is None:
+            schedule = self._schedules[category] = PollSchedule(self.base_interval)
+        return schedule
+
+    def due_categories(self, categories: list) -> list:
+        """확인할 때가 된 카테고리 리스트를 반환하는 함수
+        Args:
+            categories (list): 스크래퍼의 전체 카테고리 리스트
+        Returns:
+            list: 다음 확인 시각이 지난 카테고리 리스트
+        """
+        now = time.monotonic()
+        return [category for category in categories if self.get_schedule(category).next_poll <= now]
+
+    def record(self, category: str, listed: int, new: int) -> float:
+        """게시판 확인 결과로 카테고리의 확인 주기를 조절하는 함수
+        Args:
+            category (str): 카테고리 (카테고리가 없는 스크래퍼는 None)
+            listed (int): 게시판에서 가져온 URL 수
+            new (int): 그중 이미 스크랩하지 않은(중복 확인에 걸리지 않은) URL 수
+        Returns:
+            float: 조절된 확인 주기(초)
+        """
+        schedule = self.get_schedule(category)
+        miss_ratio = new / listed if listed else 0.0
+        if miss_ratio > self.config['high_miss_ratio']:
+            # 새 기사가 많으면 다음 확인 전에 게시판에서 밀려날 수 있으므로 주기를 줄입니다.
+            schedule.interval *= self.config['decrease_factor']
+        elif miss_ratio < self.config['low_miss_ratio']:
+            schedule.interval *= self.config['increase_factor']
+        schedule.interval = min(self.max_interval, max(self.min_interval, schedule.interval))
+        schedule.next_poll = time.monotonic() + schedule.interval
+        schedule.polls += 1
+        schedule.listed += listed
+        schedule.new += new
+        schedule.last_miss_ratio = round(miss_ratio, 3)
+        return schedule.interval
+
+    def record_failure(self, category: str = None) -> None:
+        """게시판을 가져오지 못한 카테고리는 주기를 바꾸지 않고 다음 주기에 다시 확인하도록 하는 함수"""
+        schedule = self.get_schedule(category)
+        schedule.next_poll = time.monotonic() + schedule.interval
+
+    def seconds_until_next_poll(self) -> float:
+        """가장 먼저 확인할 카테고리까지 남은 시간(초)을 반환하는 함수 (확인한 카테고리가 없으면 기본 주기)"""
+        if not self._schedules:
+            return self.base_interval
+        next_poll = min(schedule.next_poll for schedule in self._schedules.values())
+        return max(0.0, next_poll - time.monotonic())
+
+    def get_stats(self) -> dict:
+        """카테고리별 현재 확인 주기, 다음 확인까지 남은 시간, 새 기사 비율을 반환하는 함수"""
+        now = time.monotonic()
+        return {
+            str(category): {
+                'interval': round(schedule.interval, 1),
+                'next_poll_in': round(max(0.0, schedule.next_poll - now), 1),
+                'polls': schedule.polls,
+                'listed': schedule.listed,
+                'new': schedule.new,
+                'last_miss_ratio': schedule.last_miss_ratio,
+            }
+            for category, schedule in self._schedules.items()
+        }
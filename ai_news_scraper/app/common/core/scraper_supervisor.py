@@ -0,0 +1,328 @@
+import os
+import time
+import queue
+import signal
+import asyncio
+import multiprocessing
+
+from app.config.settings import SCRAPER_WORKERS
+from app.common.log.log_config import setup_logger
+from app.common.core.http_client import http_client
+from app.common.core.extraction_executor import extraction_executor
+from app.common.core.concurrency_limiter import concurrency_limiter
+from app.common.core.url_index import url_index
+from app.common.core.news_writer import close_news_writers
+from app.common.db.db_executor import db_executor
+from app.common.db.engine_registry import engine_registry
+import app.scrapers_init as scraper
+
+
+def collect_worker_stats() -> dict:
+    """워커 프로세스의 공유 자원 통계를 모으는 함수 (상태 보고에 함께 보냅니다)"""
+    return {
+        'http_client': http_client.get_stats(),
+        'extraction': extraction_executor.get_stats(),
+        'article_workers': concurrency_limiter.get_stats(),
+        'url_index': url_index.get_stats(),
+        'db_executor': db_executor.get_stats(),
+        'db_pools': engine_registry.get_stats(),
+    }
+
+
+async def _send_heartbeats(group: str, heartbeats, interval: float, parent_pid: int) -> None:
+    """interval초마다 상태를 보내는 작업 (이벤트 루프가 멈추면 상태가 오지 않아 슈퍼바이저가 워커를 재시작합니다)"""
+    while True:
+        # API 프로세스가 종료되어 고아 프로세스가 되면 워커도 종료합니다.
+        if os.getppid() != parent_pid:
+            raise SystemExit(0)
+        heartbeats.put((group, os.getpid(), time.time(), collect_worker_stats()))
+        await asyncio.sleep(interval)
+
+
+async def _run_worker(group: str, portals: list, heartbeats, interval: float, parent_pid: int) -> None:
+    """워커 프로세스의 이벤트 루프에서 포털 스크래퍼들을 실행하는 함수"""
+    loop = asyncio.get_running_loop()
+    main_task = asyncio.current_task()
+    # 슈퍼바이저의 종료 요청(SIGTERM)을 받으면 스크래퍼를 취소하고 공유 자원을 정리합니다.
+    loop.add_signal_handler(signal.SIGTERM, main_task.cancel)
+    heartbeat_task = asyncio.create_task(_send_heartbeats(group, heartbeats, interval, parent_pid))
+    scraper_tasks = []
+    try:
+        await http_client.get_session()
+        await db_executor.run(url_index.load)
+        scraper_tasks = [asyncio.create_task(scraper.PORTAL_SCRAPERS[portal]()) for portal in portals]
+        # 상태 보고 작업이 끝나면(고아 프로세스) 스크래퍼도 함께 종료합니다.
+        await asyncio.gather(heartbeat_task, *scraper_tasks)
+    finally:
+        heartbeat_task.cancel()
+        for task in scraper_tasks:
+            task.cancel()
+        await asyncio.gather(*scraper_tasks, return_exceptions=True)
+        # DB 스레드 풀을 닫기 전에 스크래퍼 쓰기 큐에 남은 기사를 저장합니다.
+        for name, error in await close_news_writers():
+            logger = setup_logger('scraper_worker', 'app/log/scraper_worker.log', level='INFO')
+            logger.error(f"THERE WAS AN ERROR WHILE CLOSING NEWS WRITER {name} IN SCRAPER WORKER {group}: {error}")
+        await http_client.close()
+        extraction_executor.shutdown()
+        db_executor.shutdown()
+        engine_registry.dispose()
+
+
+def run_scraper_worker(group: str, portals: list, heartbeats, interval: float, parent_pid: int) -> None:
+    """워커 프로세스 진입 함수
+    Args:
+        group (str): 포털 그룹 이름
+        portals (list): 실행할 포털 이름 리스트 (scrapers_init.PORTAL_SCRAPERS의 키)
+        heartbeats (multiprocessing.Queue): 상태를 보낼 큐
+        interval (float): 상태를 보내는 주기(초)
+        parent_pid (int): API 프로세스 pid
+    """
+    # Ctrl+C(SIGINT)는 API 프로세스가 받고, 워커는 슈퍼바이저의 종료 요청(SIGTERM)으로만 종료합니다.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    try:
+        asyncio.run(_run_worker(group, portals, heartbeats, interval, parent_pid))
+    except asyncio.CancelledError:
+        pass
+
+
+class ScraperSupervisor:
+    """
+    포털 스크래퍼를 API 프로세스 밖의 워커 프로세스에서 실행하고 관리하는 클래스.
+    포털 그룹마다 워커 프로세스 하나를 만들고, 워커는 자체 이벤트 루프와 HTTP/추출/DB 풀로 그룹의 포털 스크래퍼를 실행합니다.
+    스크래핑의 CPU 사용, GC 멈춤, 블로킹 호출이 API 응답을 늦추지 않도록 API 프로세스는 API 요청만 처리합니다.
+    워커가 종료되거나 heartbeat_timeout초 동안 상태를 보내지 않으면(이벤트 루프 멈춤) 대기 후 다시 시작합니다.
+    lease_manager가 그룹을 점유하면 start_group, 놓으면 stop_group으로 그룹의 워커를 시작/종료합니다.
+    워커 프로세스를 사용하지 않으면(enabled=False) 그룹의 스크래퍼를 API 프로세스의 작업으로 실행합니다.
+    """
+
+    def __init__(self, config: dict = None):
+        """
+        Args:
+            config (dict, optional): 워커 프로세스 설정. Defaults to settings.SCRAPER_WORKERS.
+        """
+        self.config = {**SCRAPER_WORKERS, **(config or {})}
+        # API 프로세스의 스레드/이벤트 루프를 물려받지 않도록 spawn으로 워커를 만듭니다.
+        self._context = multiprocessing.get_context('spawn')
+        self._heartbeats = None
+        self._monitor_task = None
+        self._started = False
+        self._workers = {}      # {그룹 이름: 워커 상태}
+        self.logger = setup_logger(
+            'scraper_supervisor',
+            'app/log/scraper_supervisor.log',
+            level='INFO'
+        )
+        self.groups = self._load_groups()
+
+    @property
+    def enabled(self) -> bool:
+        return self.config['enabled']
+
+    def _load_groups(self) -> dict:
+        """{그룹 이름: 포털 이름 리스트}를 반환하는 함수 (scrapers_init.PORTAL_SCRAPERS에 없는 포털은 제외)"""
+        groups = {}
+        for group, portals in self.config['groups'].items():
+            unknown = [portal for portal in portals if portal not in scraper.PORTAL_SCRAPERS]
+            if unknown:
+                self.logger.error(f"UNKNOWN PORTALS IN SCRAPER WORKER GROUP {group}: {unknown}")
+            portals = [portal for portal in portals if portal in scraper.PORTAL_SCRAPERS]
+            if portals:
+                groups[group] = portals
+        return groups
+
+    def start(self, groups: list = None) -> None:
+        """상태 확인 작업을 만들고 그룹별 워커를 시작하는 함수 (이벤트 루프에서 호출)
+        Args:
+            groups (list, optional): 시작할 그룹 이름 리스트. Defaults to 모든 그룹.
+        """
+        if not self._started:
+            self._started = True
+            if self.enabled:
+                self._heartbeats = self._context.Queue()
+                self._monitor_task = asyncio.create_task(self._monitor())
+        for group in self.groups if groups is None else groups:
+            self.start_group(group)
+
+    def start_group(self, group: str) -> None:
+        """그룹의 워커를 시작하는 함수 (이미 실행 중이면 무시)"""
+        portals = self.groups.get(group)
+        if not portals or group in self._workers:
+            return
+        self._workers[group] = {
+            'portals': portals,
+            'process': None,
+            'tasks': [],
+            'started_at': None,
+            'last_heartbeat': None,
+            'stats': {},
+            'restarts': 0,
+            'consecutive_failures': 0,
+            'last_exitcode': None,
+            'restart_at': None,
+            'terminated_at': None,
+            'stopping': False,
+        }
+        if self.enabled:
+            self._spawn(group)
+        else:
+            self._workers[group]['started_at'] = time.time()
+            self._workers[group]['tasks'] = [asyncio.create_task(scraper.PORTAL_SCRAPERS[portal]()) for portal in portals]
+            self.logger.info(f"SCRAPER GROUP STARTED IN API PROCESS: {group} (PORTALS {portals})")
+
+    def stop_group(self, group: str) -> None:
+        """그룹의 워커에 종료를 요청하는 함수 (워커가 종료되면 running_groups에서 빠집니다)"""
+        worker = self._workers.get(group)
+        if worker is None or worker['stopping']:
+            return
+        worker['stopping'] = True
+        if not self.enabled:
+            for task in worker['tasks']:
+                task.cancel()
+            del self._workers[group]
+            self.logger.info(f"SCRAPER GROUP STOPPED IN API PROCESS: {group}")
+            return
+        if worker['process'] is None:
+            del self._workers[group]
+            return
+        worker['process'].terminate()
+        worker['terminated_at'] = time.time()
+
+    def running_groups(self) -> set:
+        """워커가 실행 중이거나 종료 중인 그룹 이름 집합"""
+        return set(self._workers)
+
+    def _spawn(self, group: str) -> None:
+        worker = self._workers[group]
+        process = self._context.Process(
+            target=run_scraper_worker,
+            args=(group, worker['portals'], self._heartbeats, self.config['heartbeat_interval'], os.getpid()),
+            name=f'scraper-{group}',
+        )
+        process.start()
+        worker.update({
+            'process': process,
+            'started_at': time.time(),
+            'last_heartbeat': time.time(),    # 첫 상태 보고 전까지는 시작 시각 기준으로 확인합니다.
+            'restart_at': None,
+            'terminated_at': None,
+        })
+        self.logger.info(f"SCRAPER WORKER STARTED: {group} (PID {process.pid}, PORTALS {worker['portals']})")
+
+    def _receive_heartbeats(self) -> None:
+        while True:
+            try:
+                group, pid, sent_at, stats = self._heartbeats.get_nowait()
+            except queue.Empty:
+                return
+            worker = self._workers.get(group)
+            # 재시작 전 워커가 보낸 상태는 무시합니다.
+            if worker is not None and worker['process'] is not None and worker['process'].pid == pid:
+                worker['last_heartbeat'] = sent_at
+                worker['stats'] = stats
+
+    def _check_worker(self, group: str, now: float) -> None:
+        worker = self._workers[group]
+        process = worker['process']
+
+        if process is None:
+            if worker['stopping']:
+                del self._workers[group]
+                return
+            if now >= worker['restart_at']:
+                worker['restarts'] += 1
+                self._spawn(group)
+            return
+
+        if process.is_alive():
+            if worker['terminated_at'] is not None:
+                # 종료 요청 후에도 살아 있으면 강제 종료합니다.
+                if now - worker['terminated_at'] > self.config['stop_timeout']:
+                    process.kill()
+            elif now - worker['last_heartbeat'] > self.config['heartbeat_timeout']:
+                self.logger.error(f"SCRAPER WORKER {group} (PID {process.pid}) SENT NO HEARTBEAT FOR {now - worker['last_heartbeat']:.0f}S, RESTARTING")
+                process.terminate()
+                worker['terminated_at'] = now
+            return
+
+        process.join()
+        worker['last_exitcode'] = process.exitcode
+        if worker['stopping']:
+            del self._workers[group]
+            self.logger.info(f"SCRAPER WORKER STOPPED: {group} (EXIT CODE {process.exitcode})")
+            return
+        # 오래 실행된 워커가 종료되면 대기 시간을 처음부터 다시 늘립니다.
+        if now - worker['started_at'] > self.config['max_restart_delay']:
+            worker['consecutive_failures'] = 0
+        worker['consecutive_failures'] += 1
+        delay = min(
+            self.config['restart_delay'] * 2 ** (worker['consecutive_failures'] - 1),
+            self.config['max_restart_delay'],
+        )
+        worker['process'] = None
+        worker['restart_at'] = now + delay
+        self.logger.error(f"SCRAPER WORKER {group} EXITED WITH CODE {process.exitcode}, RESTARTING IN {delay:.0f}S")
+
+    async def _monitor(self) -> None:
+        """워커 상태를 받고, 종료되었거나 멈춘 워커를 다시 시작하는 작업"""
+        interval = min(1.0, self.config['heartbeat_interval'])
+        while True:
+            try:
+                self._receive_heartbeats()
+                now = time.time()
+                for group in list(self._workers):
+                    self._check_worker(group, now)
+            except Exception as e:
+                self.logger.error(f"THERE WAS AN ERROR WHILE MONITORING SCRAPER WORKERS: {e}")
+            await asyncio.sleep(interval)
+
+    def stop(self) -> None:
+        """워커 프로세스를 종료하는 함수 (stop_timeout초 안에 종료되지 않으면 강제 종료)"""
+        if self._monitor_task is not None:
+            self._monitor_task.cancel()
+            self._monitor_task = None
+        for worker in self._workers.values():
+            for task in worker['tasks']:
+                task.cancel()
+        processes = [worker['process'] for worker in self._workers.values() if worker['process'] is not None]
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        deadline = time.time() + self.config['stop_timeout']
+        for process in processes:
+            process.join(max(0.0, deadline - time.time()))
+            if process.is_alive():
+                self.logger.error(f"SCRAPER WORKER {process.name} (PID {process.pid}) DID NOT STOP, KILLING")
+                process.kill()
+                process.join()
+        if self._heartbeats is not None:
+            self._heartbeats.close()
+            self._heartbeats = None
+        self.logger.info(f"SCRAPER WORKERS STOPPED: {list(self._workers)}")
+        self._workers = {}
+
+    def get_stats(self) -> dict:
+        """워커별 실행 상태, 재시작 수, 마지막 상태 보고 후 지난 시간, 워커의 공유 자원 통계를 반환하는 함수"""
+        now = time.time()
+        stats = {}
+        for group, worker in self._workers.items():
+            process = worker['process']
+            if self.enabled:
+                alive = process is not None and process.is_alive()
+            else:
+                alive = any(not task.done() for task in worker['tasks'])
+            stats[group] = {
+                'portals': worker['portals'],
+                'pid': process.pid if process is not None else os.getpid(),
+                'alive': alive,
+                'stopping': worker['stopping'],
+                'uptime': round(now - worker['started_at'], 1) if worker['started_at'] is not None else 0.0,
+                'last_heartbeat_age': round(now - worker['last_heartbeat'], 1) if worker['last_heartbeat'] is not None else None,
+                'restarts': worker['restarts'],
+                'last_exitcode': worker['last_exitcode'],
+                'stats': worker['stats'],
+            }
+        return stats
+
+
+# API 프로세스의 스크래퍼 워커 슈퍼바이저
+scraper_supervisor = ScraperSupervisor()
@@ -0,0 +1,206 @@
+import asyncio
+import datetime
+import zlib
+import xml.etree.ElementTree as ET
+from typing import NamedTuple, Optional
+
+from app.config.settings import SITEMAP
+from app.common.core.http_client import http_client
+
+
+# 사이트맵 날짜는 한국 시간으로 바꿔 create_date와 같은 기준(시간대 없는 datetime)으로 비교합니다.
+KST = datetime.timezone(datetime.timedelta(hours=9))
+GZIP_MAGIC = b'\x1f\x8b'
+
+
+class SitemapEntry(NamedTuple):
+    """사이트맵의 <url> 또는 사이트맵 인덱스의 <sitemap> 항목"""
+    loc: str
+    lastmod: Optional[datetime.datetime]    # news:publication_date가 있으면 그 값, 없으면 lastmod (KST)
+    is_index: bool                          # 하위 사이트맵 항목 여부
+
+
+def parse_w3c_datetime(value: str) -> Optional[datetime.datetime]:
+    """사이트맵 날짜(W3C Datetime)를 KST 기준 시간대 없는 datetime으로 바꾸는 함수 (잘못된 값이면 None)"""
+    value = (value or '').strip()
+    if not value:
+        return None
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    try:
+        date = datetime.datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if date.tzinfo is not None:
+        date = date.astimezone(KST).replace(tzinfo=None)
+    return date
+
+
+def _local_name(tag: str) -> str:
+    """네임스페이스를 뗀 태그 이름을 반환하는 함수"""
+    return tag.rsplit('}', 1)[-1]
+
+
+class SitemapParser:
+    """
+    조각(chunk) 단위로 받은 사이트맵 XML을 점진적으로 파싱하는 클래스.
+    gzip으로 압축된 사이트맵(.xml.gz)은 받은 조각을 바로 풀어서 파싱하고,
+    <url>/<sitemap> 항목은 읽는 즉시 비우므로 사이트맵 크기와 관계없이 메모리를 적게 사용합니다.
+    """
+
+    def __init__(self):
+        self._parser = ET.XMLPullParser(events=('end',))
+        self._decompressor = None
+        self._started = False
+
+    def feed(self, chunk: bytes) -> list:
+        """XML 조각을 파싱하고 완성된 항목 리스트를 반환하는 함수"""
+        if not self._started:
+            self._started = True
+            if chunk[:2] == GZIP_MAGIC:
+                self._decompressor = zlib.decompressobj(wbits=31)
+        if self._decompressor is not None:
+            chunk = self._decompressor.decompress(chunk)
+        self._parser.feed(chunk)
+        return self._read_entries()
+
+    def close(self) -> list:
+        """남은 XML을 파싱하고 완성된 항목 리스트를 반환하는 함수 (XML이 잘렸으면 ET.ParseError)"""
+        if self._decompressor is not None:
+            self._parser.feed(self._decompressor.flush())
+        self._parser.close()
+        return self._read_entries()
+
+    def _read_entries(self) -> list:
+        entries = []
+        for _, element in self._parser.read_events():
+            tag = _local_name(element.tag)
+            if tag not in ('url', 'sitemap'):
+                continue
+            loc = None
+            lastmod = None
+            publication_date = None
+            for child in element:
+                name = _local_name(child.tag)
+                if name == 'loc':
+                    loc = (child.text or '').strip()
+                elif name == 'lastmod':
+                    lastmod = parse_w3c_datetime(child.text)
+                elif name == 'news':
+                    for news_child in child.iter():
+                        if _local_name(news_child.tag) == 'publication_date':
+                            publication_date = parse_w3c_datetime(news_child.text)
+            if loc:
+                entries.append(SitemapEntry(loc, publication_date or lastmod, tag == 'sitemap'))
+            element.clear()
+        return entries
+
+
+class SitemapSource:
+    """
+    사이트맵/뉴스 사이트맵에서 새 기사 URL을 찾는 클래스.
+    사이트맵을 조각 단위로 내려받으면서 파싱하고, 날짜가 since 이후인 기사만 남깁니다.
+    사이트맵 인덱스는 lastmod가 since 이후인(또는 날짜가 없는) 하위 사이트맵만 가져옵니다.
+    """
+
+    def __init__(self, config: dict = None):
+        """
+        Args:
+            config (dict, optional): 사이트맵 설정. Defaults to settings.SITEMAP.
+        """
+        self.config = {**SITEMAP, **(config or {})}
+        self.stats = {
+            'sitemaps': 0,
+            'child_sitemaps_skipped': 0,
+            'bytes': 0,
+            'entries': 0,
+            'new_entries': 0,
+            'truncated': 0,         # max_urls로 잘려 다음 확인에서 이어서 찾은 횟수
+            'undated_entries': 0,   # 날짜가 없어 거를 수 없는 항목 (사용하지 않음)
+            'errors': 0,
+        }
+
+    async def _stream(self, url: str, headers: dict = None) -> list:
+        """사이트맵 하나를 조각 단위로 내려받으면서 파싱하는 함수"""
+        parser = SitemapParser()
+        entries = []
+        async with http_client.request(url, headers=headers) as response:
+            if response.status != 200:
+                raise ValueError(f"RESPONSE STATUS: {response.status} FOR SITEMAP URL: {url}")
+            async for chunk in response.content.iter_chunked(self.config['chunk_size']):
+                self.stats['bytes'] += len(chunk)
+                entries.extend(parser.feed(chunk))
+        entries.extend(parser.close())
+        self.stats['sitemaps'] += 1
+        return entries
+
+    async def discover(self, sitemap_urls: list, since: datetime.datetime, until: datetime.datetime = None, headers: dict = None, max_urls: int = None, resume_after: datetime.datetime = None) -> dict:
+        """사이트맵에서 since 이후(until 이전)에 올라온 기사 URL을 찾는 함수
+        max_urls개보다 많으면 오래된 기사부터 max_urls개를 반환하므로, 'newest'까지 워터마크를 옮기면 다음 확인에서 나머지를 이어서 찾습니다.
+        Args:
+            sitemap_urls (list): 사이트맵 또는 사이트맵 인덱스 URL 리스트
+            since (datetime.datetime): 이 날짜 이후의 기사만 찾습니다 (KST)
+            until (datetime.datetime, optional): 이 날짜까지의 기사만 찾습니다 (KST)
+            headers (dict, optional): 요청 헤더
+            max_urls (int, optional): 반환할 최대 URL 수 (오래된 순으로 선택). Defaults to config['max_urls'].
+            resume_after (datetime.datetime, optional): 이미 확인한 날짜(워터마크). 이 날짜까지의 항목(다시 확인하는 구간)은 max_urls에 세지 않습니다.
+        Returns:
+            dict: {'entries': SitemapEntry 리스트 (최신 순), 'newest': 반환한 항목 중 가장 최신 날짜, 'truncated': max_urls로 잘린 항목이 있는지 여부,
+                   'fetched': 가져온 사이트맵 수, 'errors': [(URL, 예외), ...]}
+        """
+        max_urls = max_urls or self.config['max_urls']
+        found = {}
+        errors = []
+        fetched = 0
+        child_budget = self.config['max_child_sitemaps']
+        pending = list(sitemap_urls)
+        while pending:
+            results = await asyncio.gather(*(self._stream(url, headers) for url in pending), return_exceptions=True)
+            next_pending = []
+            for url, result in zip(pending, results):
+                if isinstance(result, Exception):
+                    self.stats['errors'] += 1
+                    errors.append((url, result))
+                    continue
+                fetched += 1
+                for entry in result:
+                    is_new = entry.lastmod is None or (entry.lastmod > since and (until is None or entry.lastmod <= until))
+                    if entry.is_index:
+                        # 바뀌지 않은 하위 사이트맵은 가져오지 않습니다.
+                        if is_new and child_budget > 0:
+                            child_budget -= 1
+                            next_pending.append(entry.loc)
+                        else:
+                            self.stats['child_sitemaps_skipped'] += 1
+                        continue
+                    self.stats['entries'] += 1
+                    if entry.lastmod is None:
+                        self.stats['undated_entries'] += 1
+                    elif is_new and entry.loc not in found:
+                        found[entry.loc] = entry
+            pending = next_pending
+
+        entries = sorted(found.values(), key=lambda entry: entry.lastmod)
+        overlap = [entry for entry in entries if resume_after is not None and entry.lastmod <= resume_after]
+        fresh = entries[len(overlap):]
+        truncated = len(fresh) > max_urls
+        if truncated:
+            self.stats['truncated'] += 1
+        # 잘린 항목보다 최신인 항목은 반환하지 않으므로 워터마크가 잘린 항목을 건너뛰지 않습니다.
+        entries = (overlap + fresh[:max_urls])[::-1]
+        self.stats['new_entries'] += len(entries)
+        return {
+            'entries': entries,
+            'newest': entries[0].lastmod if entries else None,
+            'truncated': truncated,
+            'fetched': fetched,
+            'errors': errors,
+        }
+
+    def get_stats(self) -> dict:
+        """가져온 사이트맵 수, 내려받은 바이트, 새 기사 항목 수 등의 통계를 반환하는 함수"""
+        return dict(self.stats)
+
+
+# 프로세스 전역 사이트맵 URL 소스
+sitemap_source = SitemapSource()
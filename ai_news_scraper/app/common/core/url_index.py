@@ -0,0 +1,124 @@
+from app.config.settings import URL_INDEX
+from app.common.db.news_database import NewsDatabase, NEWS_MODELS_BY_PORTAL
+from app.common.db.db_executor import db_executor
+from app.common.log.log_config import setup_logger
+
+
+class UrlIndex:
+    """
+    스크랩한 기사 URL의 중복 확인 인덱스 클래스.
+    뉴스 테이블별로 url_md5 집합을 메모리에 두고 모든 포털 스크래퍼가 공유합니다.
+    시작할 때 테이블의 최근 url_md5를 불러오고(warm load), 집합에 없는 URL은
+    항상 DB의 url_md5 unique 인덱스로 정확히 확인합니다. (게시판마다 DB 스레드에서 IN 조회 한 번)
+    같은 테이블에 워커 프로세스, 다른 인스턴스, API 프로세스가 함께 저장하므로 메모리에 없다고 새 기사로 보지 않습니다.
+    """
+
+    def __init__(self, warm_load_limit: int = None):
+        """
+        Args:
+            warm_load_limit (int, optional): 테이블별로 불러올 최근 url_md5 수. Defaults to settings.URL_INDEX['warm_load_limit'].
+        """
+        self.warm_load_limit = warm_load_limit or URL_INDEX['warm_load_limit']
+        self.lookup_batch_size = URL_INDEX['lookup_batch_size']
+        self._news_db = None
+        self._keys = {}     # {테이블 이름: url_md5 정수 키 집합}
+        self.logger = setup_logger(
+            'url_index',
+            'app/log/url_index.log',
+            level='INFO'
+        )
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'db_lookups': 0,
+            'db_hits': 0,
+            'db_errors': 0,
+        }
+
+    @property
+    def news_db(self) -> NewsDatabase:
+        if self._news_db is None:
+            self._news_db = NewsDatabase()
+        return self._news_db
+
+    @staticmethod
+    def _to_key(url_md5: str) -> int:
+        """url_md5(32자리 16진수 문자열)를 메모리를 덜 쓰는 정수 키로 바꾸는 함수"""
+        return int(url_md5, 16)
+
+    def load(self) -> None:
+        """뉴스 테이블별로 최근 url_md5를 불러오는 함수 (서비스 시작 시 한 번 실행)"""
+        for model in set(NEWS_MODELS_BY_PORTAL.values()):
+            table = model.__tablename__
+            try:
+                url_md5s = self.news_db.get_recent_url_md5s(model, self.warm_load_limit)
+                keys = self._keys.setdefault(table, set())
+                keys.update(self._to_key(url_md5) for url_md5 in url_md5s)
+                self.logger.info(f"URL INDEX LOADED {len(url_md5s)} URL MD5S FROM {table}")
+            except Exception as e:
+                self.logger.error(f"THERE WAS AN ERROR WHILE LOADING URL INDEX FROM {table}: {e}")
+
+    def contains_cached(self, model, url_md5: str) -> bool:
+        """url_md5가 메모리 인덱스에 있는지 확인하는 함수 (DB는 조회하지 않음, get_scraped로 확인한 뒤 사용)
+        Args:
+            model: 뉴스 테이블 모델
+            url_md5 (str): URL MD5
+        Returns:
+            bool: 메모리 인덱스에 있으면 True
+        """
+        return self._to_key(url_md5) in self._keys.get(model.__tablename__, ())
+
+    async def get_scraped(self, model, url_md5s) -> set:
+        """url_md5 중 이미 스크랩된 url_md5를 반환하는 함수
+        메모리 인덱스에 없는 url_md5는 DB 스레드에서 IN 조회로 한 번에 확인합니다.
+        Args:
+            model: 뉴스 테이블 모델
+            url_md5s (iterable): URL MD5 목록
+        Returns:
+            set: 이미 스크랩된 url_md5 집합
+        """
+        table = model.__tablename__
+        keys = self._keys.setdefault(table, set())
+        scraped = set()
+        misses = []
+        for url_md5 in set(url_md5s):
+            if self._to_key(url_md5) in keys:
+                scraped.add(url_md5)
+            else:
+                misses.append(url_md5)
+        self.stats['hits'] += len(scraped)
+        self.stats['misses'] += len(misses)
+        if not misses:
+            return scraped
+
+        # 불러오지 못한 오래된 기사이거나 다른 프로세스(워커, 다른 인스턴스)가 저장한 기사일 수 있으므로 DB에서 정확히 확인합니다.
+        found = set()
+        for start in range(0, len(misses), self.lookup_batch_size):
+            batch = misses[start:start + self.lookup_batch_size]
+            self.stats['db_lookups'] += 1
+            try:
+                found |= await db_executor.run(self.news_db.get_existing_url_md5s, model, batch)
+            except Exception as e:
+                self.stats['db_errors'] += 1
+                self.logger.error(f"THERE WAS AN ERROR WHILE LOOKING UP {len(batch)} URL MD5S IN {table}: {e}")
+        self.stats['db_hits'] += len(found)
+        keys.update(self._to_key(url_md5) for url_md5 in found)
+        return scraped | found
+
+    def add(self, model, url_md5: str) -> None:
+        """스크랩한 url_md5를 인덱스에 추가하는 함수
+        Args:
+            model: 뉴스 테이블 모델
+            url_md5 (str): URL MD5
+        """
+        self._keys.setdefault(model.__tablename__, set()).add(self._to_key(url_md5))
+
+    def get_stats(self) -> dict:
+        """테이블별 인덱스 크기와 적중/DB 조회 통계를 반환하는 함수"""
+        stats = dict(self.stats)
+        stats['sizes'] = {table: len(keys) for table, keys in self._keys.items()}
+        return stats
+
+
+# 프로세스 전역 URL 중복 확인 인덱스
+url_index = UrlIndex()
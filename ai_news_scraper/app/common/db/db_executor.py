@@ -0,0 +1,103 @@
+import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+
+from app.config.settings import DB_EXECUTOR
+
+
+class DatabaseExecutor:
+    """
+    동기 SQLAlchemy 호출을 DB 전용 스레드 풀에서 실행하는 클래스.
+    모든 스크래퍼와 API 요청이 공유하는 이벤트 루프가 쿼리 하나 때문에 멈추지 않도록
+    세션/에러 로그 저장, 뉴스 저장, 파싱 규칙 조회, scrap_manager API 쿼리를 DB 스레드로 넘깁니다.
+    스레드 수는 엔진 커넥션 풀 크기(pool_size)보다 크지 않게 설정합니다.
+    """
+
+    def __init__(self, max_workers: int = None):
+        """
+        Args:
+            max_workers (int, optional): DB 스레드 수. Defaults to settings.DB_EXECUTOR['max_workers'].
+        """
+        self.max_workers = max_workers or DB_EXECUTOR['max_workers']
+        self._pool = None
+        self._stats_lock = threading.Lock()    # 여러 DB 스레드가 통계를 함께 갱신합니다.
+        self.stats = {
+            'pending': 0,
+            'max_pending': 0,
+            'completed': 0,
+            'failed': 0,
+            'submitted': 0,         # 결과를 기다리지 않고 넘긴 작업 수
+            'total_time': 0.0,
+            'max_time': 0.0,
+        }
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='db')
+        return self._pool
+
+    def _run_job(self, func, args: tuple, kwargs: dict):
+        """DB 스레드에서 작업을 실행하고 걸린 시간을 기록하는 함수"""
+        started = time.perf_counter()
+        failed = False
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            failed = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._stats_lock:
+                self.stats['pending'] -= 1
+                self.stats['completed'] += 1
+                self.stats['failed'] += failed
+                self.stats['total_time'] += elapsed
+                self.stats['max_time'] = max(self.stats['max_time'], elapsed)
+
+    def _count_pending(self) -> None:
+        with self._stats_lock:
+            self.stats['pending'] += 1
+            self.stats['max_pending'] = max(self.stats['max_pending'], self.stats['pending'])
+
+    async def run(self, func, *args, **kwargs):
+        """DB 작업을 DB 스레드에서 실행하고 결과를 기다리는 함수
+        Args:
+            func (callable): 동기 DB 작업 함수
+        Returns:
+            작업 함수의 반환값
+        """
+        self._count_pending()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_pool(), self._run_job, func, args, kwargs)
+
+    def submit(self, func, *args, **kwargs) -> Future:
+        """DB 작업을 DB 스레드에 넘기고 결과를 기다리지 않는 함수 (워터마크 저장, 파싱 규칙 갱신 등)
+        Args:
+            func (callable): 동기 DB 작업 함수 (예외는 함수 안에서 처리해야 합니다)
+        Returns:
+            concurrent.futures.Future
+        """
+        self._count_pending()
+        with self._stats_lock:
+            self.stats['submitted'] += 1
+        return self._get_pool().submit(self._run_job, func, args, kwargs)
+
+    def get_stats(self) -> dict:
+        """대기 중인 작업 수와 작업별 실행 시간 통계를 반환하는 함수"""
+        stats = dict(self.stats)
+        stats['max_workers'] = self.max_workers
+        stats['avg_time'] = round(stats['total_time'] / stats['completed'], 6) if stats['completed'] else 0.0
+        stats['total_time'] = round(stats['total_time'], 3)
+        stats['max_time'] = round(stats['max_time'], 6)
+        return stats
+
+    def shutdown(self) -> None:
+        """DB 스레드 풀을 종료하는 함수 (실행 중인 작업은 마칩니다)"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+
+# 프로세스 전역 DB 작업 실행기
+db_executor = DatabaseExecutor()
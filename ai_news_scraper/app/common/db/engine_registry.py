@@ -0,0 +1,144 @@
+import time
+import threading
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
+
+from app.config.settings import DB_ENGINE
+
+
+class MeasuredQueuePool(QueuePool):
+    """커넥션을 받을 때까지 기다린 시간과 타임아웃 수를 기록하는 QueuePool"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = {
+            'checkouts': 0,
+            'checked_out': 0,
+            'max_checked_out': 0,
+            'connects': 0,          # 새로 연결한 커넥션 수
+            'timeouts': 0,          # pool_timeout 안에 커넥션을 받지 못한 수
+            'total_wait_time': 0.0,
+            'max_wait_time': 0.0,
+        }
+        self._metrics_lock = threading.Lock()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            with self._metrics_lock:
+                self.metrics['timeouts'] += 1
+            raise
+        waited = time.perf_counter() - started
+        with self._metrics_lock:
+            self.metrics['checkouts'] += 1
+            self.metrics['total_wait_time'] += waited
+            self.metrics['max_wait_time'] = max(self.metrics['max_wait_time'], waited)
+        return connection
+
+    def recreate(self):
+        # pool.dispose() 후에도 같은 metrics를 이어서 기록합니다.
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        pool._metrics_lock = self._metrics_lock
+        return pool
+
+
+class EngineRegistry:
+    """
+    DB URL별 SQLAlchemy 엔진(커넥션 풀)을 프로세스에서 하나만 만들어 공유하는 클래스.
+    스크래퍼, 라우터, 알림 등이 NewsDatabase()/ScraperManagerDatabase()를 여러 번 만들어도 커넥션 풀은 URL마다 하나이므로
+    DB 커넥션 수는 (URL 수 * (pool_size + max_overflow))를 넘지 않습니다.
+    pool_size는 DB 쿼리를 동시에 실행하는 DB 스레드 수(settings.DB_EXECUTOR)에 맞추고,
+    커넥션을 기다린 시간과 타임아웃 수를 기록하여 커넥션을 줄여도 저장이 밀리지 않는지 확인합니다.
+    """
+
+    def __init__(self, config: dict = None):
+        """
+        Args:
+            config (dict, optional): 커넥션 풀 설정. Defaults to settings.DB_ENGINE.
+        """
+        self.config = {**DB_ENGINE, **(config or {})}
+        self._lock = threading.Lock()
+        self._engines = {}          # {DB URL: Engine}
+        self._sessionmakers = {}    # {DB URL: sessionmaker}
+
+    def get_engine(self, url: str) -> Engine:
+        """DB URL의 공유 엔진을 반환하는 함수 (처음 요청할 때 만듭니다)"""
+        with self._lock:
+            engine = self._engines.get(url)
+            if engine is None:
+                engine = self._engines[url] = self._create_engine(url)
+            return engine
+
+    def get_sessionmaker(self, url: str) -> sessionmaker:
+        """DB URL의 공유 엔진에 연결된 sessionmaker를 반환하는 함수"""
+        engine = self.get_engine(url)
+        with self._lock:
+            session_factory = self._sessionmakers.get(url)
+            if session_factory is None:
+                session_factory = self._sessionmakers[url] = sessionmaker(bind=engine)
+            return session_factory
+
+    def _create_engine(self, url: str) -> Engine:
+        engine = create_engine(
+            url,
+            poolclass=MeasuredQueuePool,
+            pool_size=self.config['pool_size'],
+            max_overflow=self.config['max_overflow'],
+            pool_timeout=self.config['pool_timeout'],
+            pool_recycle=self.config['pool_recycle'],
+        )
+        metrics = engine.pool.metrics
+        metrics_lock = engine.pool._metrics_lock
+
+        @event.listens_for(engine, 'connect')
+        def on_connect(dbapi_connection, connection_record):
+            with metrics_lock:
+                metrics['connects'] += 1
+
+        @event.listens_for(engine, 'checkout')
+        def on_checkout(dbapi_connection, connection_record, connection_proxy):
+            with metrics_lock:
+                metrics['checked_out'] += 1
+                metrics['max_checked_out'] = max(metrics['max_checked_out'], metrics['checked_out'])
+
+        @event.listens_for(engine, 'checkin')
+        def on_checkin(dbapi_connection, connection_record):
+            with metrics_lock:
+                metrics['checked_out'] -= 1
+
+        return engine
+
+    def get_stats(self) -> dict:
+        """DB별 커넥션 풀 크기, 사용 중인 커넥션 수, 커넥션을 기다린 시간 등의 통계를 반환하는 함수"""
+        stats = {}
+        with self._lock:
+            engines = dict(self._engines)
+        for url, engine in engines.items():
+            pool = engine.pool
+            pool_stats = dict(pool.metrics)
+            pool_stats['pool_size'] = pool.size()
+            pool_stats['max_overflow'] = self.config['max_overflow']
+            pool_stats['idle'] = pool.checkedin()
+            pool_stats['avg_wait_time'] = round(pool_stats['total_wait_time'] / pool_stats['checkouts'], 6) if pool_stats['checkouts'] else 0.0
+            pool_stats['total_wait_time'] = round(pool_stats['total_wait_time'], 3)
+            pool_stats['max_wait_time'] = round(pool_stats['max_wait_time'], 6)
+            # 비밀번호를 가린 URL을 키로 사용합니다.
+            stats[make_url(url).render_as_string(hide_password=True)] = pool_stats
+        return stats
+
+    def dispose(self) -> None:
+        """모든 엔진의 커넥션을 닫는 함수"""
+        with self._lock:
+            for engine in self._engines.values():
+                engine.dispose()
+
+
+# 프로세스 전역 엔진 레지스트리
+engine_registry = EngineRegistry()
@@ -1,17 +1,35 @@
 import traceback
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import insert
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from app.config.settings import NEWS_DB_URL
+from app.common.db.db_executor import db_executor
+from app.common.db.engine_registry import engine_registry
 from app.models_init import DaumNews, NaverNews, EtcNews, EsgNews
 from app.common.log.log_config import setup_logger
 
 
+# 포털별 뉴스 테이블 모델
+NEWS_MODELS_BY_PORTAL = {
+    'naver': NaverNews,
+    'daum': DaumNews,
+    **{portal: EtcNews for portal in ['venturesquare', 'zdnet', 'the bell', 'startuptoday', 'startupn', 'platum']},
+    **{portal: EsgNews for portal in ['esg_economy', 'greenpost_korea', 'esg_finance_hub', 'missing_news_scraper']},
+}
+
+
 class NewsDatabase:
-    def __init__(self):
-        self.engine = create_engine(NEWS_DB_URL, pool_recycle=3600, pool_size=20, max_overflow=0)
-        self.SessionLocal = sessionmaker(bind=self.engine)
+    def __init__(self, db_url: str = None):
+        """
+        Args:
+            db_url (str, optional): 뉴스 DB URL (벤치마크 등). Defaults to settings.NEWS_DB_URL.
+        """
+        db_url = db_url or NEWS_DB_URL
+        # 커넥션 풀은 프로세스에서 DB마다 하나만 만들어 공유합니다.
+        self.engine = engine_registry.get_engine(db_url)
+        self.SessionLocal = engine_registry.get_sessionmaker(db_url)
         self.existing_data = None
         self.logger = setup_logger(
             'news_database',
@@ -19,52 +37,171 @@ class NewsDatabase:
             level='INFO'
         )
 
+    # 포털의 뉴스 테이블 모델을 반환하는 함수
+    def get_news_model(self, portal: str):
+        """포털의 뉴스 테이블 모델을 반환하는 함수
+        Args:
+            portal (str): 포털 이름
+        Returns:
+            뉴스 테이블 모델 (등록되지 않은 포털이면 None)
+        """
+        return NEWS_MODELS_BY_PORTAL.get(portal)
+
+    # 뉴스 테이블에 있는 url_md5를 한 번에 조회하는 함수
+    def get_existing_url_md5s(self, model, url_md5s: list) -> set:
+        """url_md5 리스트 중 뉴스 테이블에 존재하는 url_md5를 한 번의 IN 조회로 가져오는 함수 (url_md5 unique 인덱스 조회)
+        Args:
+            model: 뉴스 테이블 모델
+            url_md5s (list): URL MD5 리스트
+        Returns:
+            set: 존재하는 url_md5 집합
+        """
+        if not url_md5s:
+            return set()
+        session = self.SessionLocal()
+        try:
+            rows = session.query(model.url_md5).filter(model.url_md5.in_(url_md5s)).all()
+            return {row.url_md5 for row in rows}
+        finally:
+            session.close()
+
+    # 최근에 저장된 url_md5 목록을 가져오는 함수
+    def get_recent_url_md5s(self, model, limit: int) -> list:
+        """최근에 저장된 url_md5 목록을 가져오는 함수
+        Args:
+            model: 뉴스 테이블 모델
+            limit (int): 가져올 최대 개수 (id 역순)
+        Returns:
+            list: url_md5 리스트
+        """
+        session = self.SessionLocal()
+        try:
+            rows = session.query(model.url_md5).order_by(model.id.desc()).limit(limit).all()
+            return [row.url_md5 for row in rows if row.url_md5]
+        finally:
+            session.close()
+
+    # 뉴스 데이터 객체를 INSERT 할 행 딕셔너리로 바꾸는 함수
+    @staticmethod
+    def to_insert_rows(model, news_data_list: list) -> list:
+        """뉴스 데이터 객체 리스트를 INSERT 할 행 딕셔너리 리스트로 바꾸는 함수 (배치 내 중복 url_md5 제거)
+        Args:
+            model: 뉴스 테이블 모델
+            news_data_list (list): 뉴스 데이터 객체 리스트
+        Returns:
+            list: 행 딕셔너리 리스트
+        """
+        columns = [column.key for column in model.__table__.columns]
+        # id가 비어 있는 객체가 있으면 id는 DB의 autoincrement에 맡깁니다.
+        if any(news_data.id is None for news_data in news_data_list):
+            columns = [column for column in columns if column != 'id']
+
+        rows = {}
+        for news_data in news_data_list:
+            rows.setdefault(news_data.url_md5, {column: getattr(news_data, column) for column in columns})
+        return list(rows.values())
+
+    # url_md5 충돌만 무시하는 INSERT 문을 만드는 함수
+    @staticmethod
+    def insert_skipping_url_md5_conflict(session, model):
+        """url_md5 unique 키 충돌만 무시하는 INSERT 문을 반환하는 함수
+        INSERT IGNORE는 모든 에러(길이 초과 잘림, NOT NULL 컬럼의 NULL 등)를 경고로 바꿔 잘못된 행을 저장하므로 사용하지 않습니다.
+        Args:
+            session: DB 세션
+            model: 뉴스 테이블 모델
+        Returns:
+            INSERT 문 (MySQL: ON DUPLICATE KEY UPDATE url_md5 = url_md5, SQLite: ON CONFLICT (url_md5) DO NOTHING)
+        """
+        table = model.__table__
+        dialect = session.get_bind().dialect.name
+        if dialect == 'mysql':
+            return mysql_insert(table).on_duplicate_key_update(url_md5=table.c.url_md5)
+        if dialect == 'sqlite':
+            return sqlite_insert(table).on_conflict_do_nothing(index_elements=['url_md5'])
+        return insert(table)
+
+    # 테이블에 없는 url_md5의 행만 한 번에 INSERT 하는 함수
+    def insert_new_rows(self, session, model, rows: list) -> int:
+        """url_md5가 테이블에 없는 행만 multi-row INSERT 하는 함수
+        이미 있는 url_md5는 IN 조회 한 번으로 거르고, 그 사이에 다른 프로세스가 저장한 url_md5의 충돌만 무시합니다.
+        (pymysql 연결은 CLIENT_FOUND_ROWS를 사용하므로 ON DUPLICATE KEY UPDATE의 rowcount로는 중복을 구분할 수 없습니다)
+        그 밖의 에러(길이 초과, NOT NULL 등)는 예외로 올라오므로 save_data_bulk가 한 행씩 다시 저장하여 실패로 셉니다.
+        Args:
+            session: DB 세션
+            model: 뉴스 테이블 모델
+            rows (list): 행 딕셔너리 리스트
+        Returns:
+            int: INSERT 한 행 수
+        """
+        existing_md5s = {
+            row.url_md5 for row in
+            session.query(model.url_md5).filter(model.url_md5.in_([row['url_md5'] for row in rows])).all()
+        }
+        new_rows = [row for row in rows if row['url_md5'] not in existing_md5s]
+        if new_rows:
+            session.execute(self.insert_skipping_url_md5_conflict(session, model), new_rows)
+        return len(new_rows)
+
     # 뉴스 데이터베이스에 대량의 데이터를 저장하는 함수
-    def save_data_bulk(self, news_data_list: list, portal: str):
+    def save_data_bulk(self, news_data_list: list, portal: str) -> dict:
         """뉴스 데이터베이스에 데이터를 대량으로 저장하는 함수
+        테이블마다 이미 있는 url_md5를 IN 조회로 거른 뒤 새 행만 multi-row INSERT 한 번으로 저장하고,
+        실패하면 한 행씩 다시 저장합니다. (저장할 수 없는 행은 잘려서 저장되지 않고 실패로 셉니다)
         Args:
             news_data_list (list): 뉴스 데이터 객체 리스트
             portal (str): 포털 이름
+        Returns:
+            dict: {'inserted': 저장된 수, 'duplicates': 이미 존재하여 무시된 수, 'failed': 저장에 실패한 수}
         """
+        counts = {'inserted': 0, 'duplicates': 0, 'failed': 0}
+        if not news_data_list:
+            return counts
+
+        # 뉴스 데이터를 테이블 모델별로 나눕니다.
+        news_data_by_model = {}
+        for news_data in news_data_list:
+            news_data_by_model.setdefault(type(news_data), []).append(news_data)
+
         session = self.SessionLocal()
         try:
-            to_add = []
-            for news_data in news_data_list:
-                existing_data = None
-                # 기존 데이터 확인 로직 (기존 로직을 사용)
-                if portal == "naver":
-                    existing_data = session.query(NaverNews).filter(NaverNews.url_md5 == news_data.url_md5).first()
-                elif portal == "daum":
-                    existing_data = session.query(DaumNews).filter(DaumNews.url_md5 == news_data.url_md5).first()
-                elif portal in ['venturesquare', 'zdnet', 'the bell', 'startuptoday', 'startupn', 'platum']:
-                    existing_data = session.query(EtcNews).filter(EtcNews.url_md5 == news_data.url_md5).first()
-                elif portal in ['esg_economy', 'greenpost_korea', 'missing_news_scraper']:
-                    existing_data = session.query(EsgNews).filter(EsgNews.url_md5 == news_data.url_md5).first()
-
-                # 기존 데이터가 없으면 to_add 리스트에 추가
-                if not existing_data:
-                    to_add.append(news_data)
-
-            # to_add에 있는 모든 뉴스 데이터를 한 번에 데이터베이스에 저장
-            if to_add:
+            for model, model_news_data_list in news_data_by_model.items():
+                rows = self.to_insert_rows(model, model_news_data_list)
                 try:
-                    session.bulk_save_objects(to_add)
+                    inserted_count = self.insert_new_rows(session, model, rows)
                     session.commit()
-                    self.logger.info(f"{portal} news data bulk saved")
-                except Exception as builk_save_error:
+                    counts['inserted'] += inserted_count
+                    counts['duplicates'] += len(model_news_data_list) - inserted_count
+                    self.logger.info(f"{portal} news data bulk saved: {inserted_count} inserted, {len(model_news_data_list) - inserted_count} duplicates")
+                except Exception as bulk_save_error:
                     session.rollback()
-                    self.logger.error(f"{portal} news data bulk save error: {builk_save_error}")
-                    for record in to_add:
+                    self.logger.error(f"{portal} news data bulk save error: {bulk_save_error}")
+                    # 배치 내 중복으로 제거된 행은 중복으로 셉니다.
+                    counts['duplicates'] += len(model_news_data_list) - len(rows)
+                    for row in rows:
                         try:
-                            session.add(record)
+                            inserted_count = self.insert_new_rows(session, model, [row])
                             session.commit()
-                            self.logger.info(f"{portal} news data saved")
+                            counts['inserted'] += inserted_count
+                            counts['duplicates'] += 1 - inserted_count
                         except Exception as individual_save_error:
                             session.rollback()
-                            self.logger.error(f"{portal} news {record.url} data save error: {individual_save_error}")
+                            counts['failed'] += 1
+                            self.logger.error(f"{portal} news {row.get('url')} data save error: {individual_save_error}")
         except Exception as e:
             session.rollback()
             stack_trace = traceback.format_exc()
             print(f"Error: {e}\n{stack_trace}")
         finally:
             session.close()
+        return counts
+
+    # 뉴스 데이터베이스에 대량의 데이터를 DB 스레드에서 저장하는 함수
+    async def save_data_bulk_async(self, news_data_list: list, portal: str) -> dict:
+        """save_data_bulk를 DB 스레드에서 실행하는 함수 (이벤트 루프를 막지 않습니다)
+        Args:
+            news_data_list (list): 뉴스 데이터 객체 리스트
+            portal (str): 포털 이름
+        Returns:
+            dict: {'inserted': 저장된 수, 'duplicates': 이미 존재하여 무시된 수, 'failed': 저장에 실패한 수}
+        """
+        return await db_executor.run(self.save_data_bulk, news_data_list, portal)
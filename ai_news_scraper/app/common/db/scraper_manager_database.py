@@ -1,18 +1,23 @@
 import traceback
 from collections import defaultdict
+from datetime import timedelta
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy import func
+from sqlalchemy import func, select, update, delete, case, or_
+from sqlalchemy.exc import IntegrityError
 
 from app.config.settings import SCRAPER_MNG_DB_URL
+from app.common.db.db_executor import db_executor
+from app.common.db.engine_registry import engine_registry
 from app.models.scrap_session_log import ScrapSessionLog
+from app.models.scrap_watermark import ScrapWatermark
+from app.models.scrap_lease import ScrapLease
 
 
 class ScraperManagerDatabase:
     def __init__(self):
-        self.engine = create_engine(SCRAPER_MNG_DB_URL, pool_recycle=3600, pool_size=20, max_overflow=0)
-        self.SessionLocal = sessionmaker(bind=self.engine)
+        # 커넥션 풀은 프로세스에서 DB마다 하나만 만들어 공유합니다.
+        self.engine = engine_registry.get_engine(SCRAPER_MNG_DB_URL)
+        self.SessionLocal = engine_registry.get_sessionmaker(SCRAPER_MNG_DB_URL)
 
     # scraper_mng 세션을 반환하는 함수
     def get_session_scraper_mng(self):
@@ -49,6 +54,16 @@ class ScraperManagerDatabase:
         finally:
             session.close()
 
+    # scrap_session_log 테이블에 데이터를 DB 스레드에서 저장하는 함수
+    async def save_scrap_session_log_async(self, session_log):
+        """scrap_session_log 테이블에 데이터를 DB 스레드에서 저장하는 함수 (이벤트 루프를 막지 않습니다)
+        Args:
+            session_log (ScrapSessionLog): 세션 로그
+        Returns:
+            int: 세션 로그 id
+        """
+        return await db_executor.run(self.save_scrap_session_log, session_log)
+
     # scrap_error_log 테이블에 데이터를 저장하는 함수
     def save_scrap_error_logs(self, error_logs):
         """scrap_error_log 테이블에 데이터를 저장하는 함수
@@ -69,6 +84,14 @@ class ScraperManagerDatabase:
         finally:
             session.close()
 
+    # scrap_error_log 테이블에 데이터를 DB 스레드에서 저장하는 함수
+    async def save_scrap_error_logs_async(self, error_logs):
+        """scrap_error_log 테이블에 데이터를 DB 스레드에서 저장하는 함수 (이벤트 루프를 막지 않습니다)
+        Args:
+            error_logs (list): 에러 로그 리스트
+        """
+        await db_executor.run(self.save_scrap_error_logs, error_logs)
+
     def get_scraping_statistics_by_portal(self, date):
         """특정 날짜에 대한 포털별 스크래핑 통계를 가져오는 함수
         Args:
@@ -102,3 +125,102 @@ class ScraperManagerDatabase:
         finally:
             # 세션 닫기
             session.close()
+
+    # scrap_watermark 테이블에서 포털의 워터마크를 가져오는 함수
+    def get_scrap_watermarks(self, portal):
+        """scrap_watermark 테이블에서 포털의 카테고리별 워터마크를 가져오는 함수
+        Args:
+            portal (str): 포털 이름
+        Returns:
+            list: ScrapWatermark 리스트
+        """
+        session = self.SessionLocal()
+        try:
+            return session.query(ScrapWatermark).filter(ScrapWatermark.portal == portal).all()
+        finally:
+            session.close()
+
+    # scrap_watermark 테이블에 워터마크를 저장하는 함수
+    def save_scrap_watermark(self, watermark):
+        """scrap_watermark 테이블에 워터마크를 저장하는 함수 (같은 포털/카테고리가 있으면 갱신)
+        Args:
+            watermark (ScrapWatermark): 워터마크
+        """
+        session = self.SessionLocal()
+        try:
+            session.merge(watermark)
+            session.commit()
+        finally:
+            session.close()
+
+    # scrap_lease 테이블에서 작업을 점유하거나 점유 기간을 연장하는 함수
+    def acquire_scrap_lease(self, name, owner, ttl):
+        """scrap_lease 테이블에서 작업을 점유하거나 점유 기간을 연장하는 함수
+        비어 있거나, 기간이 지났거나, 이미 owner가 점유한 작업만 가져옵니다. 시각은 모든 인스턴스가 같은 DB 시각을 사용합니다.
+        Args:
+            name (str): 작업 이름
+            owner (str): 점유할 인스턴스
+            ttl (float): 점유 기간(초)
+        Returns:
+            bool: 점유 여부
+        """
+        session = self.SessionLocal()
+        try:
+            now = session.scalar(select(func.now()))
+            expires = now + timedelta(seconds=ttl)
+            # MySQL은 SET을 왼쪽부터 적용하므로 owner를 바꾸기 전에 acquired를 계산합니다.
+            result = session.execute(
+                update(ScrapLease)
+                .where(
+                    ScrapLease.name == name,
+                    or_(ScrapLease.owner == owner, ScrapLease.expires < now),
+                )
+                .ordered_values(
+                    (ScrapLease.acquired, case((ScrapLease.owner == owner, ScrapLease.acquired), else_=now)),
+                    (ScrapLease.owner, owner),
+                    (ScrapLease.expires, expires),
+                )
+            )
+            if result.rowcount:
+                session.commit()
+                return True
+            # 행이 없으면 새로 만들고, 다른 인스턴스가 점유 중이면(기본 키 중복) 가져오지 못합니다.
+            session.add(ScrapLease(name=name, owner=owner, acquired=now, expires=expires))
+            session.commit()
+            return True
+        except IntegrityError:
+            session.rollback()
+            return False
+        finally:
+            session.close()
+
+    # scrap_lease 테이블에서 점유한 작업을 놓는 함수
+    def release_scrap_lease(self, name, owner):
+        """scrap_lease 테이블에서 owner가 점유한 작업을 놓는 함수 (다른 인스턴스가 바로 가져갈 수 있음)
+        Args:
+            name (str): 작업 이름
+            owner (str): 점유한 인스턴스
+        """
+        session = self.SessionLocal()
+        try:
+            session.execute(delete(ScrapLease).where(ScrapLease.name == name, ScrapLease.owner == owner))
+            session.commit()
+        finally:
+            session.close()
+
+    # scrap_lease 테이블에서 기간이 남은 작업 점유를 가져오는 함수
+    def get_live_scrap_leases(self, prefix=''):
+        """scrap_lease 테이블에서 이름이 prefix로 시작하고 기간이 남은 작업 점유를 가져오는 함수
+        Args:
+            prefix (str): 작업 이름 접두사
+        Returns:
+            list: ScrapLease 리스트
+        """
+        session = self.SessionLocal()
+        try:
+            return session.query(ScrapLease).filter(
+                ScrapLease.name.startswith(prefix, autoescape=True),
+                ScrapLease.expires >= func.now(),
+            ).all()
+        finally:
+            session.close()
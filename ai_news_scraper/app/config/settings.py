@@ -37,6 +37,145 @@ FILE_PATHS = {
     'data': 'app/data',
     }
 
+# HTTP 클라이언트 설정 (모든 스크래퍼가 공유하는 커넥션 풀)
+HTTP_CLIENT = {
+    'limit': int(os.getenv('HTTP_CLIENT_LIMIT', 100)),      # 전체 동시 커넥션 수
+    'limit_per_host': int(os.getenv('HTTP_CLIENT_LIMIT_PER_HOST', 8)),  # 호스트별 동시 커넥션 수
+    'ttl_dns_cache': int(os.getenv('HTTP_CLIENT_TTL_DNS_CACHE', 300)),  # DNS 캐시 유지 시간(초)
+    'keepalive_timeout': int(os.getenv('HTTP_CLIENT_KEEPALIVE_TIMEOUT', 150)),  # keep-alive 유지 시간(초)
+    'connect_timeout': int(os.getenv('HTTP_CLIENT_CONNECT_TIMEOUT', 10)),  # 연결 타임아웃(초)
+    'read_timeout': int(os.getenv('HTTP_CLIENT_READ_TIMEOUT', 30)),  # 읽기 타임아웃(초)
+    'total_timeout': int(os.getenv('HTTP_CLIENT_TOTAL_TIMEOUT', 60)),  # 전체 요청 타임아웃(초)
+}
+
+# 추출 작업(HTML 파싱, 본문 정제) 프로세스 풀 설정
+EXTRACTION_EXECUTOR = {
+    'max_workers': int(os.getenv('EXTRACTION_MAX_WORKERS', min(4, os.cpu_count() or 1))),    # 0이면 이벤트 루프에서 직접 실행
+}
+
+# 기사 동시 스크래핑 설정
+ARTICLE_WORKERS = {
+    'max_concurrency': int(os.getenv('ARTICLE_MAX_CONCURRENCY', 16)),  # 프로세스 전체 동시 기사 스크래핑 수
+    'max_per_host': int(os.getenv('ARTICLE_MAX_PER_HOST', 2)),  # 매체(호스트)별 동시 기사 스크래핑 수 (초기값, 이후 HOST_RATE_LIMITER가 조절)
+    'scraper_concurrency': int(os.getenv('ARTICLE_SCRAPER_CONCURRENCY', 8)),  # 스크래퍼별 동시 기사 스크래핑 수
+}
+
+# DB 작업 스레드 풀 설정 (동기 SQLAlchemy 호출을 이벤트 루프 밖에서 실행, DB_ENGINE['pool_size'] 이하)
+DB_EXECUTOR = {
+    'max_workers': int(os.getenv('DB_EXECUTOR_MAX_WORKERS', 8)),   # DB 스레드 수
+}
+
+# DB URL별 공유 커넥션 풀 설정 (프로세스에서 URL마다 엔진 하나)
+# DB 쿼리는 DB 스레드(DB_EXECUTOR)에서 실행하므로 기본 pool_size는 DB 스레드 수 + 2 (시작 시 로딩, 동기 API 엔드포인트용)
+DB_ENGINE = {
+    'pool_size': int(os.getenv('DB_ENGINE_POOL_SIZE', DB_EXECUTOR['max_workers'] + 2)),
+    'max_overflow': int(os.getenv('DB_ENGINE_MAX_OVERFLOW', 2)),      # 잠깐 몰릴 때 더 열 수 있는 커넥션 수
+    'pool_timeout': float(os.getenv('DB_ENGINE_POOL_TIMEOUT', 30)),   # 커넥션을 기다리는 최대 시간(초)
+    'pool_recycle': int(os.getenv('DB_ENGINE_POOL_RECYCLE', 3600)),   # 커넥션 재연결 주기(초)
+}
+
+# 뉴스 데이터 쓰기 큐 설정 (스크래퍼별로 모아서 저장)
+NEWS_WRITER = {
+    'queue_size': int(os.getenv('NEWS_WRITER_QUEUE_SIZE', 200)),          # 저장을 기다릴 수 있는 최대 기사 수 (가득 차면 기사 스크랩이 기다림)
+    'batch_size': int(os.getenv('NEWS_WRITER_BATCH_SIZE', 50)),           # 한 번에 저장할 최대 기사 수
+    'flush_interval': float(os.getenv('NEWS_WRITER_FLUSH_INTERVAL', 5)),  # 첫 기사를 받은 뒤 저장할 때까지 기다리는 최대 시간(초)
+}
+
+# 호스트별 요청 속도/동시 실행 수 조절(AIMD) 설정 (모든 스크래퍼가 공유)
+HOST_RATE_LIMITER = {
+    'initial_rate': float(os.getenv('HOST_RATE_LIMITER_INITIAL_RATE', 1)),     # 호스트별 초기 초당 요청 수
+    'min_rate': float(os.getenv('HOST_RATE_LIMITER_MIN_RATE', 0.05)),          # 호스트별 최소 초당 요청 수
+    'max_rate': float(os.getenv('HOST_RATE_LIMITER_MAX_RATE', 10)),            # 호스트별 최대 초당 요청 수
+    'rate_increase': float(os.getenv('HOST_RATE_LIMITER_RATE_INCREASE', 0.2)),  # 정상 응답이 이어질 때 초마다 늘리는 초당 요청 수
+    'burst': float(os.getenv('HOST_RATE_LIMITER_BURST', 2)),                   # 토큰 버킷 크기
+    'max_concurrency': int(os.getenv('HOST_RATE_LIMITER_MAX_CONCURRENCY', 8)),  # 호스트별 최대 동시 기사 스크래핑 수
+    'backoff_factor': float(os.getenv('HOST_RATE_LIMITER_BACKOFF_FACTOR', 0.5)),  # 429/403/5xx 응답 시 속도/동시 실행 수에 곱하는 값
+    'latency_target': float(os.getenv('HOST_RATE_LIMITER_LATENCY_TARGET', 3)),  # 이보다 느린 응답은 속도를 늘리지 않음(초)
+    'cooldown': float(os.getenv('HOST_RATE_LIMITER_COOLDOWN', 30)),            # 429/403 응답 시 첫 대기 시간(초), 연속되면 두 배씩
+    'max_cooldown': float(os.getenv('HOST_RATE_LIMITER_MAX_COOLDOWN', 600)),   # 최대 대기 시간(초)
+}
+
+# 카테고리별 게시판 확인 주기 조절 설정 (스크래퍼의 interval_time_sleep 기준)
+POLL_SCHEDULER = {
+    'min_factor': float(os.getenv('POLL_SCHEDULER_MIN_FACTOR', 0.25)),        # 최소 주기 = 기본 주기 * min_factor
+    'max_factor': float(os.getenv('POLL_SCHEDULER_MAX_FACTOR', 4)),           # 최대 주기 = 기본 주기 * max_factor
+    'min_interval': float(os.getenv('POLL_SCHEDULER_MIN_INTERVAL', 30)),      # 모든 포털의 최소 주기(초)
+    'low_miss_ratio': float(os.getenv('POLL_SCHEDULER_LOW_MISS_RATIO', 0.1)),  # 새 기사 비율이 이보다 낮으면 주기를 늘림
+    'high_miss_ratio': float(os.getenv('POLL_SCHEDULER_HIGH_MISS_RATIO', 0.5)),  # 새 기사 비율이 이보다 높으면 주기를 줄임
+    'increase_factor': float(os.getenv('POLL_SCHEDULER_INCREASE_FACTOR', 1.5)),
+    'decrease_factor': float(os.getenv('POLL_SCHEDULER_DECREASE_FACTOR', 0.5)),
+}
+
+# 게시판/피드 조건부 요청(ETag/Last-Modified) 캐시 설정
+LISTING_CACHE = {
+    'max_entries': int(os.getenv('LISTING_CACHE_MAX_ENTRIES', 256)),   # 본문을 저장할 최대 게시판/피드 URL 수
+}
+
+# 사이트맵 URL 소스 설정 (URLs의 'sitemap_urls'가 있는 포털만 사용)
+SITEMAP = {
+    'lookback_hours': float(os.getenv('SITEMAP_LOOKBACK_HOURS', 24)),     # 워터마크가 없을 때 찾을 기간(시간)
+    'overlap_minutes': float(os.getenv('SITEMAP_OVERLAP_MINUTES', 60)),   # 워터마크보다 이만큼 앞부터 다시 확인(분)
+    'max_urls': int(os.getenv('SITEMAP_MAX_URLS', 300)),                  # 사이클마다 반환할 최대 URL 수
+    'backfill_max_urls': int(os.getenv('SITEMAP_BACKFILL_MAX_URLS', 5000)),  # 백필에서 반환할 최대 URL 수
+    'max_child_sitemaps': int(os.getenv('SITEMAP_MAX_CHILD_SITEMAPS', 20)),  # 사이트맵 인덱스에서 가져올 최대 하위 사이트맵 수
+    'chunk_size': int(os.getenv('SITEMAP_CHUNK_SIZE', 65536)),            # 스트리밍 파싱 조각 크기(바이트)
+}
+
+# 게시판 워터마크 설정 (이미 확인한 구간에서 게시판 확인을 멈춤)
+LISTING_WATERMARK = {
+    'size': int(os.getenv('LISTING_WATERMARK_SIZE', 20)),          # 저장할 게시판 상단 기사 수
+    'stop_run': int(os.getenv('LISTING_WATERMARK_STOP_RUN', 3)),   # 멈추기 위해 연달아 나와야 하는 확인한 기사 수
+}
+
+# URL 중복 확인 인덱스 설정
+URL_INDEX = {
+    'warm_load_limit': int(os.getenv('URL_INDEX_WARM_LOAD_LIMIT', 100000)),    # 시작 시 테이블별로 불러올 최근 url_md5 수
+    'lookup_batch_size': int(os.getenv('URL_INDEX_LOOKUP_BATCH_SIZE', 500)),   # 메모리에 없는 url_md5를 DB에서 한 번에 확인할 최대 수 (IN 조회)
+}
+
+# 파싱 규칙 캐시 설정
+PARSING_RULE_CACHE = {
+    'check_interval': float(os.getenv('PARSING_RULE_CACHE_CHECK_INTERVAL', 5)),   # scrap_manager 규칙 버전 확인 주기(초)
+}
+
+# 기사 HTML 파서 백엔드 설정 ('html.parser', 'lxml', 'lxml_strainer', 'selectolax')
+# PARSER_BACKEND_PORTALS 예: "naver:lxml,daum:selectolax" (포털별로 하나씩 전환)
+PARSER_BACKEND = {
+    'default': os.getenv('PARSER_BACKEND', 'html.parser'),
+    'portals': dict(
+        item.replace(' ', '').split(':', 1)
+        for item in os.getenv('PARSER_BACKEND_PORTALS', '').split(',')
+        if ':' in item
+    ),
+}
+
+# 스크래퍼 워커 프로세스 설정 (API 프로세스는 API 요청만 처리하고, 포털 그룹마다 워커 프로세스에서 스크래퍼 실행)
+# SCRAPER_WORKER_GROUPS 예: "portal:naver,daum;startup:zdnet,vs;esg:esg,greenpost" (포털 이름은 scrapers_init.PORTAL_SCRAPERS)
+SCRAPER_WORKERS = {
+    'enabled': os.getenv('SCRAPER_WORKERS_ENABLED', 'true').lower() == 'true',   # false면 API 프로세스에서 스크래퍼 실행
+    'groups': {
+        group.split(':', 1)[0].strip(): [portal.strip() for portal in group.split(':', 1)[1].split(',') if portal.strip()]
+        for group in os.getenv(
+            'SCRAPER_WORKER_GROUPS',
+            'portal:naver,daum;startup:zdnet,vs,thebell,startupn,startuptoday,platum;esg:esg,greenpost',
+        ).split(';')
+        if ':' in group
+    },
+    'heartbeat_interval': float(os.getenv('SCRAPER_WORKER_HEARTBEAT_INTERVAL', 10)),   # 워커가 상태를 보내는 주기(초)
+    'heartbeat_timeout': float(os.getenv('SCRAPER_WORKER_HEARTBEAT_TIMEOUT', 180)),    # 이 시간 동안 상태가 오지 않으면 워커 재시작(초)
+    'restart_delay': float(os.getenv('SCRAPER_WORKER_RESTART_DELAY', 5)),              # 워커 재시작 전 첫 대기 시간(초), 연속되면 두 배씩
+    'max_restart_delay': float(os.getenv('SCRAPER_WORKER_MAX_RESTART_DELAY', 300)),    # 최대 대기 시간(초)
+    'stop_timeout': float(os.getenv('SCRAPER_WORKER_STOP_TIMEOUT', 15)),               # 종료 요청 후 강제 종료까지 기다리는 시간(초)
+}
+
+# 작업 점유(lease) 설정 (여러 인스턴스/uvicorn 워커가 포털 그룹과 일일 통계 메시지를 나눠서 한 번씩만 실행)
+LEASE = {
+    'enabled': os.getenv('LEASE_ENABLED', 'true').lower() == 'true',   # false면 인스턴스마다 모든 포털 그룹과 일일 통계 메시지를 실행
+    'ttl': float(os.getenv('LEASE_TTL', 60)),                          # 이 시간 동안 갱신하지 않으면 다른 인스턴스가 가져감(초)
+    'renew_interval': float(os.getenv('LEASE_RENEW_INTERVAL', 15)),    # 점유 갱신/새 그룹 점유 주기(초), ttl보다 충분히 짧게
+    'daily_report_ttl': float(os.getenv('LEASE_DAILY_REPORT_TTL', 3600)),  # 일일 통계 메시지를 보낸 인스턴스가 점유하는 시간(초)
+}
+
 # 시놀로지 챗봇 설정
 SYNOLOGY_CHAT = {
     'api_url': os.getenv('SYNOLOGY_CHAT_API_URL'),
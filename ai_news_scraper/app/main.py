@@ -1,5 +1,4 @@
 import time
-import asyncio
 import datetime
 import threading
 
@@ -8,6 +7,7 @@ import pandas as pd
 from fastapi import FastAPI, UploadFile, Depends
 
 from app.scrap_manager.api.router import router as scrap_manager_router
+from app.stats.api.router import router as stats_router
 from app.common.db.news_database import NewsDatabase
 from app.common.db.scraper_manager_database import ScraperManagerDatabase
 from app.common.db.base import BaseScraper, BaseManager
@@ -18,6 +18,14 @@ from app.notification.synology_chat import send_message_to_synology_chat
 from app.notification.statistics import create_daily_message, create_error_report_message
 from app.common.log.log_config import setup_logger
 from app.config.auth import verify_token
+from app.common.core.http_client import http_client
+from app.common.core.extraction_executor import extraction_executor
+from app.common.core.url_index import url_index
+from app.common.db.db_executor import db_executor
+from app.common.db.engine_registry import engine_registry
+from app.common.core.scraper_supervisor import scraper_supervisor
+from app.common.core.lease_manager import lease_manager
+from app.common.core.news_writer import close_news_writers
 
 
 # 로거 설정
@@ -43,6 +51,7 @@ BaseManager.metadata.create_all(bind=scraper_mng_engine)
 
 app = FastAPI()
 app.include_router(scrap_manager_router, tags=["scrap_manager"], prefix="/api")
+app.include_router(stats_router, tags=["stats"], prefix="/stats", dependencies=[Depends(verify_token)])
 
 
 @app.get("/health")
@@ -245,22 +254,43 @@ async def scrape_missing_news_endpoint(csv_file: UploadFile = None, token: str =
 
 @app.on_event("startup")
 async def start_scrapers():
-    """서비스가 시작되면, 스크래퍼들을 별도의 스레드에서 실행"""
+    """서비스가 시작되면, 포털 그룹별 워커 프로세스에서 스크래퍼들을 실행"""
     info_msg = "News Scraper Service Started"
     logger.info(info_msg)
     send_message_to_synology_chat(info_msg, prod_token)
     print(info_msg)
-    asyncio.create_task(scraper.scrape_zdnet_news())
-    asyncio.create_task(scraper.scrape_daum_news())
-    asyncio.create_task(scraper.scrape_naver_news())
-    asyncio.create_task(scraper.scrape_vs_news())
-    asyncio.create_task(scraper.scrape_thebell_news())
-    asyncio.create_task(scraper.scrape_startupn_news())
-    asyncio.create_task(scraper.scrape_startuptoday_news())
-    asyncio.create_task(scraper.scrape_platum_news())
-    asyncio.create_task(scraper.scrape_esg_news())
-    asyncio.create_task(scraper.scrape_greenpost_news())
-    # asyncio.create_task(scraper.scrape_esg_finance_news())
+    # 모든 포털 스크래퍼가 공유하는 HTTP 커넥션 풀 생성
+    await http_client.get_session()
+    # 뉴스 테이블의 최근 url_md5를 불러와 재시작 후에도 이미 스크랩한 기사를 다시 가져오지 않도록 함
+    # (워커 프로세스를 사용해도 /scrape 엔드포인트는 이 프로세스에서 실행되므로 함께 불러옴)
+    await db_executor.run(url_index.load)
+    if lease_manager.enabled:
+        # 다른 인스턴스와 나눠서 점유한 포털 그룹만 실행
+        scraper_supervisor.start(groups=[])
+        lease_manager.start(scraper_supervisor)
+    else:
+        scraper_supervisor.start()
+
+
+@app.on_event("shutdown")
+async def close_shared_resources():
+    """서비스가 종료되면, 스크래퍼 워커 프로세스를 종료하고 작업 점유를 삭제한 뒤 쓰기 큐에 남은 기사를 저장하고 공유 HTTP 커넥션 풀, 추출 프로세스 풀, DB 스레드 풀, DB 커넥션 풀을 닫음"""
+    logger.info(f"Scraper Worker Stats: {scraper_supervisor.get_stats()}")
+    scraper_supervisor.stop()
+    # 워커를 종료한 뒤 점유를 삭제하여 다른 인스턴스가 바로 가져갈 수 있게 함
+    logger.info(f"Lease Stats: {lease_manager.get_stats()}")
+    lease_manager.stop()
+    # API 프로세스에서 실행한 스크래퍼(/scrape 엔드포인트, 워커를 사용하지 않는 경우)의 쓰기 큐에 남은 기사를 저장
+    for name, error in await close_news_writers():
+        logger.error(f"THERE WAS AN ERROR WHILE CLOSING NEWS WRITER {name}: {error}")
+    logger.info(f"HTTP Client Stats: {http_client.get_stats()}")
+    await http_client.close()
+    logger.info(f"Extraction Executor Stats: {extraction_executor.get_stats()}")
+    extraction_executor.shutdown()
+    logger.info(f"DB Executor Stats: {db_executor.get_stats()}")
+    db_executor.shutdown()
+    logger.info(f"DB Pool Stats: {engine_registry.get_stats()}")
+    engine_registry.dispose()
 
 
 # 스케줄러 관련 코드
@@ -277,7 +307,8 @@ def scheduled_job_send_statistics_message():
 
 
 # 매일 00:00에 스케줄러 실행 -> 한국 시간 기준
-schedule.every().day.at("15:10").do(scheduled_job_send_statistics_message)
+# 여러 인스턴스가 실행 중이면 작업을 점유한 인스턴스 하나만 메시지를 보냄
+schedule.every().day.at("15:10").do(lease_manager.run_once, 'daily_report', scheduled_job_send_statistics_message)
 # schedule.every(1).minutes.do(scheduled_job) # 테스트용
 
 
@@ -0,0 +1,38 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Column, String, DateTime
+from pydantic import BaseModel
+
+from app.common.db.base import BaseManager
+
+
+class ScrapLease(BaseManager):
+    """스크래퍼 인스턴스 간 작업 점유(lease) 테이블 (포털 그룹, 일일 통계 메시지 등을 한 인스턴스만 실행)"""
+
+    __tablename__ = 'scrap_lease'
+
+    name = Column(String(255), primary_key=True)    # 예: 'scraper_group:portal', 'node:<호스트>:<pid>', 'job:daily_report'
+    owner = Column(String(255), nullable=False)     # 점유한 인스턴스 (<호스트>:<pid>)
+    acquired = Column(DateTime)                     # 현재 owner가 점유한 시각 (DB 시각)
+    expires = Column(DateTime, index=True)          # 이 시각까지 갱신하지 않으면 다른 인스턴스가 가져갈 수 있음 (DB 시각)
+
+    # 테이블 인코딩 설정
+    __table_args__ = {
+        'mysql_charset': 'utf8mb4',         # utf8mb4로 설정
+        'mysql_collate': 'utf8mb4_unicode_ci'   # utf8mb4_unicode_ci로 설정
+        }
+
+
+# pydantic 모델
+class ScrapLeasePydantic(BaseModel):
+    """작업 점유 테이블의 Pydantic 모델"""
+
+    name: str
+    owner: str
+    acquired: Optional[datetime]
+    expires: Optional[datetime]
+
+    # Pydantic 모델의 Config 클래스
+    class Config:
+        from_attributes = True  # Pydantic 모델의 생성자의 인자로 attribute를 받을 수 있게 함
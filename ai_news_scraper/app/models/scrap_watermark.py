@@ -0,0 +1,45 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Column, String, Text, DateTime
+from sqlalchemy.sql import func
+from pydantic import BaseModel
+
+from app.common.db.base import BaseManager
+
+
+class ScrapWatermark(BaseManager):
+    """포털/카테고리별 게시판 워터마크 테이블 (마지막으로 확인한 게시판 상단 기사)"""
+
+    __tablename__ = 'scrap_watermark'
+
+    portal = Column(String(255), primary_key=True)
+    category = Column(String(255), primary_key=True)    # 카테고리가 없는 스크래퍼는 빈 문자열
+    newest_url = Column(Text)                           # 게시판의 가장 최신 기사 URL
+    newest_url_md5 = Column(String(35))
+    url_md5s = Column(Text)                             # 게시판 상단 기사 URL MD5 (쉼표로 구분, 최신 순)
+    newest_date = Column(DateTime)                      # 확인한 가장 최신 기사 날짜 (사이트맵 lastmod 워터마크)
+    updated = Column(DateTime, default=func.current_timestamp(), onupdate=func.current_timestamp())
+
+    # 테이블 인코딩 설정
+    __table_args__ = {
+        'mysql_charset': 'utf8mb4',         # utf8mb4로 설정
+        'mysql_collate': 'utf8mb4_unicode_ci'   # utf8mb4_unicode_ci로 설정
+        }
+
+
+# pydantic 모델
+class ScrapWatermarkPydantic(BaseModel):
+    """게시판 워터마크 테이블의 Pydantic 모델"""
+
+    portal: str
+    category: str
+    newest_url: Optional[str]
+    newest_url_md5: Optional[str]
+    url_md5s: Optional[str]
+    newest_date: Optional[datetime]
+    updated: Optional[datetime]
+
+    # Pydantic 모델의 Config 클래스
+    class Config:
+        from_attributes = True  # Pydantic 모델의 생성자의 인자로 attribute를 받을 수 있게 함
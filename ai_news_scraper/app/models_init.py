@@ -5,3 +5,5 @@ from app.models.scrap_session_log import ScrapSessionLog, ScrapSessionLogPydanti
 from app.models.scrap_error_log import ScrapErrorLog, ScrapErrorLogPydantic
 from app.models.etc_news import EtcNews, EtcNewsPydantic
 from app.models.esg_news import EsgNews, EsgNewsPydantic
+from app.models.scrap_watermark import ScrapWatermark, ScrapWatermarkPydantic
+from app.models.scrap_lease import ScrapLease, ScrapLeasePydantic
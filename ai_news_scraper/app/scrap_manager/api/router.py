@@ -10,6 +10,8 @@ import pandas as pd
 
 from app.models_init import ScrapManager, ScrapManagerPydantic, ScrapManagerWithIDPydantic, ScrapSessionLog, ScrapSessionLogPydantic, ScrapErrorLog, ScrapErrorLogPydantic
 from app.common.db.scraper_manager_database import ScraperManagerDatabase
+from app.common.db.db_executor import db_executor
+from app.common.core.parsing_rule_cache import parsing_rule_cache
 from app.common.log.log_config import setup_logger
 from app.config.settings import FILE_PATHS
 
@@ -24,6 +26,7 @@ logger = setup_logger(
     backup_count=30,    # log 파일이 30개가 넘으면 이전 로그 파일을 삭제
     )
 
+# async 엔드포인트의 DB 쿼리는 db_executor(DB 스레드)에서 실행하여 스크래퍼가 함께 쓰는 이벤트 루프를 막지 않습니다.
 router = APIRouter()
 
 
@@ -64,6 +67,7 @@ def create_scrap_manager(
         db.add(new_scrap_manager)
         db.commit()
         db.refresh(new_scrap_manager)
+        parsing_rule_cache.invalidate(new_scrap_manager.portal)
         logger.info(f"[SUCCESS] Insert new data into scrap_manager: {scrap_manager_data.dict()}")
         return new_scrap_manager
 
@@ -72,7 +76,7 @@ def create_scrap_manager(
         raise HTTPException(status_code=500, detail="Internal Server Error")
 
 
-async def get_scrap_managers_by_portal(portal: str, db: Session):
+def get_scrap_managers_by_portal(portal: str, db: Session):
     """스크래핑 매니저 테이블에서 포털별 스크래핑 매니저를 가져오는 함수
     args:
         portal (str): 포털 이름
@@ -111,10 +115,10 @@ async def get_scrap_managers_by_portal_endpoint(
         logger.error(f"[Fail] Portal not specified")
         raise HTTPException(status_code=400, detail="Portal not specified")
 
-    return await get_scrap_managers_by_portal(portal, db) 
+    return await db_executor.run(get_scrap_managers_by_portal, portal, db)
 
 
-async def get_scrap_manager(id: int, db: Session):
+def get_scrap_manager(id: int, db: Session):
     """스크래핑 매니저 테이블에서 스크래핑 매니저를 가져오는 함수
     args:
         id (int): 스크래핑 매니저 ID
@@ -158,10 +162,10 @@ async def get_scrap_manager_endpoint(
         logger.error(f"[Fail] ID not specified")
         raise HTTPException(status_code=400, detail="ID not specified")
 
-    return await get_scrap_manager(id, db)
+    return await db_executor.run(get_scrap_manager, id, db)
 
 
-async def update_scrap_manager(
+def update_scrap_manager(
         id: int,
         scrap_manager_data: ScrapManagerPydantic,
         db: Session
@@ -180,10 +184,14 @@ async def update_scrap_manager(
         if not scrap_manager:
             raise HTTPException(status_code=404, detail="ScrapManager not found")
 
+        previous_portal = scrap_manager.portal
         for var, value in scrap_manager_data.dict().items():
             setattr(scrap_manager, var, value) if value is not None else None
 
         db.commit()
+        # 실행 중인 스크래퍼가 수정된 파싱 규칙을 바로 사용하도록 캐시를 무효화합니다.
+        parsing_rule_cache.invalidate(previous_portal)
+        parsing_rule_cache.invalidate(scrap_manager.portal)
         return ScrapManagerPydantic.from_orm(scrap_manager)
 
     except Exception as e:
@@ -229,10 +237,10 @@ async def update_scrap_manager_endpoint(
         logger.error(f"[Fail] ScrapManager data is empty")
         raise HTTPException(status_code=400, detail="ScrapManager data is empty")
 
-    return await update_scrap_manager(id, scrap_manager_data, db)
+    return await db_executor.run(update_scrap_manager, id, scrap_manager_data, db)
 
 
-async def delete_scrap_manager(id: int, db: Session):
+def delete_scrap_manager(id: int, db: Session):
     """스크래핑 매니저 테이블에서 스크래핑 매니저를 삭제하는 함수
     args:
         id (int): 스크래핑 매니저 ID
@@ -246,6 +254,7 @@ async def delete_scrap_manager(id: int, db: Session):
 
         db.delete(scrap_manager)
         db.commit()
+        parsing_rule_cache.invalidate(scrap_manager.portal)
 
     except Exception as e:
         logger.error(f"Error: {e}")
@@ -271,7 +280,7 @@ async def delete_scrap_manager_endpoint(
         logger.error(f"[Fail] ID not specified")
         raise HTTPException(status_code=400, detail="ID not specified")
 
-    await delete_scrap_manager(id, db)
+    await db_executor.run(delete_scrap_manager, id, db)
 
 
 def get_scrap_session_logs_by_date(db: Session):
@@ -336,9 +345,9 @@ async def get_scrap_manager_monitoring(
 
     try:
         # scrap_session_log 테이블에서 최근 1일 데이터를 조회
-        scrap_session_logs = get_scrap_session_logs_by_date(db)
+        scrap_session_logs = await db_executor.run(get_scrap_session_logs_by_date, db)
         # scrap_error_log 테이블에서 최근 1일 데이터를 조회
-        scrap_error_logs = get_scrap_error_logs_by_date(db)
+        scrap_error_logs = await db_executor.run(get_scrap_error_logs_by_date, db)
 
         # 모니터링 데이터
         monitoring_data = {
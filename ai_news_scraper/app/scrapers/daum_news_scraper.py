@@ -1,16 +1,13 @@
 import asyncio
-import random
 import hashlib
 import traceback
-import types
 
-import requests
 from bs4 import BeautifulSoup
 
 from app.common.core.base_news_scraper import NewsScraper
 from app.models_init import DaumNews
 from app.scrapers.urls import URLs
-from app.common.core.utils import preprocess_datetime_compact, normal_text, truncate_content, process_content
+from app.common.core.utils import preprocess_datetime_compact
 
 
 class DaumNewsScraper(NewsScraper):
@@ -42,15 +39,17 @@ class DaumNewsScraper(NewsScraper):
             self.process_err_log_msg(err_message, "preprocess_datetime", stack_trace, e)
             return None
 
-    def get_news_urls(self, category):
+    async def get_news_urls(self, category):
         try:
             url = self.news_board_url.format(category)
 
             info_message = f"GETTING NEWS URLS FROM {url}"
             self.process_info_log_msg(info_message, type="info")
 
-            response = requests.get(url)
-            soup = BeautifulSoup(response.text, 'html.parser')
+            html = await self.fetch_listing(url)
+            if html is None:
+                return None
+            soup = BeautifulSoup(html, 'html.parser')
 
             # 뉴스 목록을 가져옵니다.
             news_list = soup.select('.link_thumb')
@@ -61,8 +60,7 @@ class DaumNewsScraper(NewsScraper):
                 return None
 
             else:
-                for news in news_list:
-                    yield news['href']
+                return [news['href'] for news in news_list]
 
         except Exception as e:
             stack_trace = traceback.format_exc()
@@ -71,26 +69,8 @@ class DaumNewsScraper(NewsScraper):
             return None
 
     async def scrape_each_news(self, news_url, category):
-        total_extracted_data = {}
-        elements = self.parsing_rules_dict.keys()
-        elements_for_bs = []
-        elements_for_trafilatura = []
-
-        for element in elements:
-            method = self.parsing_rules_dict.get(element)[0]
-            if method == "bs":
-                elements_for_bs.append(element)
-            elif method == "trafilatura":
-                elements_for_trafilatura.append(element)
-
-        if elements_for_bs:
-            extracted_data_with_bs = await self.scrape_each_news_with_bs(news_url, elements_for_bs)
-            if extracted_data_with_bs:
-                total_extracted_data.update(extracted_data_with_bs)
-        if elements_for_trafilatura:
-            extracted_data_with_trafilatura = await self.scrape_each_news_with_trafilatura(news_url, elements_for_trafilatura)
-            if extracted_data_with_trafilatura:
-                total_extracted_data.update(extracted_data_with_trafilatura)
+        # 기사를 한 번만 내려받아 bs, trafilatura 파싱 규칙을 모두 적용합니다.
+        total_extracted_data = await self.scrape_each_news_with_document(news_url) or {}
 
         title = total_extracted_data.get('title')
         content = total_extracted_data.get('content')
@@ -111,9 +91,10 @@ class DaumNewsScraper(NewsScraper):
             kind_id = self.category_dict.get(self.scraper_name).get(category)
         else:
             kind_id = self.category_dict.get(self.scraper_name).get("etc")
-        norm_title = normal_text(title)
-        content = truncate_content(content)
-        content = process_content(content)
+        # 제목 정규화와 본문 정제는 추출 프로세스 풀에서 실행합니다.
+        normalized = await self.normalize_news_text(title, content)
+        norm_title = normalized['norm_title']
+        content = normalized['content']
 
         news_data = DaumNews(
             url=news_url,
@@ -136,47 +117,31 @@ class DaumNewsScraper(NewsScraper):
                 # 세션 로그 초기화
                 self.initialize_session_log()
 
-                # 뉴스 데이터 리스트 초기화
-                self.news_data_list = []
-
-                # 카테고리별 뉴스 URL을 가져옵니다.
-                for category in self.categories:
-                    news_urls = self.get_news_urls(category)
-                    if not isinstance(news_urls, types.GeneratorType):
-                        err_message = "GET_NEWS_URLS DOES NOT RETURN A GENERATOR. CHECK THE 'news_board_url' OR THE RETURN VALUE OF FUNCTION 'get_news_urls'"
-                        self.process_err_log_msg(err_message, "scrape_news", "", "")
-                        continue
-
-                    for news_url in news_urls:
-                        news_data = None
-                        # 에러 로그 개별 초기화
-                        self.initialize_error_log(news_url)
-
-                        self.session_log['total_records_processed'] += 1
-                        if not self.is_already_scraped(news_url):
-                            await asyncio.sleep(random.randint(1, 2))
-
-                            # 각 뉴스 URL에 대해 세부 정보 스크랩
-                            news_data = await self.scrape_each_news(
-                                news_url,
-                                category,
-                                )
-                        else:
-                            self.is_duplicated = True
-                            err_message = f"NEWS ALREADY EXISTS IN DATABASE: {news_url}"
-                            self.process_err_log_msg(err_message, "scrape_news", "", "")
-
-                        # 뉴스 데이터에 에러가 있으면, 에러 로그를 append하고, 그렇지 않으면 뉴스 데이터를 리스트에 추가
-                        self.check_error(news_data, news_url)
-
-                # 뉴스 데이터베이스에 한 번에 저장
-                self.save_news_data_bulk(self.news_data_list)
+                # 확인할 때가 된 카테고리의 뉴스 URL을 동시에 가져옵니다.
+                category_news_urls = await self.get_news_urls_by_category(self.get_due_categories())
+                # 워터마크(이미 확인한 구간) 전까지만 모으고, 여러 카테고리에 올라온 URL은 한 번만 스크랩합니다.
+                news_items = await self.collect_news_items(category_news_urls)
+
+                # 각 뉴스 URL에 대해 세부 정보를 동시에 스크랩
+                new_md5s = await self.scrape_articles(
+                    news_items,
+                    lambda item: self.scrape_each_news(*item),
+                    get_url=lambda item: item[0],
+                    )
+
+                # 카테고리별 새 기사 비율로 다음 게시판 확인 주기를 정하고 워터마크를 갱신합니다.
+                for category, news_urls in category_news_urls.items():
+                    self.record_poll(category, news_urls, new_md5s)
+                    self.update_watermark(category, news_urls)
+
+                # 쓰기 큐에 남은 뉴스 데이터를 모두 저장
+                await self.flush_news_data()
 
                 # 최종 세션 로그 저장
-                self.finalize_session_log()
+                await self.finalize_session_log()
 
-                # 모든 카테고리에 대한 스크래핑이 끝나면 일정 시간 대기
-                await asyncio.sleep(self.interval_time_sleep)
+                # 가장 먼저 확인할 카테고리의 확인 시각까지 대기
+                await self.wait_for_next_poll()
 
             except Exception as e:
                 stack_trace = traceback.format_exc()
@@ -184,12 +149,6 @@ class DaumNewsScraper(NewsScraper):
                 self.process_err_log_msg(err_message, "scrape_news", stack_trace, e)
                 await asyncio.sleep(self.retry_delay)
 
-    def get_feed_entries(self):
-        pass
-
-    async def scrape_each_feed_entry(self, entry):
-        pass
-
 
 # Daum 뉴스 스크래핑 함수
 async def scrape_daum_news():
@@ -1,8 +1,6 @@
 import asyncio
-import random
 import hashlib
 import traceback
-import types
 import glob
 import os
 
@@ -14,7 +12,8 @@ from app.scrapers.urls import URLs
 from app.scrapers.esg_finance_hub_scraper import EsgFinanceHubScraper
 from app.common.core.utils import *
 from app.config.settings import FILE_PATHS
-from app.common.core.utils import load_yaml, normal_text, truncate_content
+from app.common.core.media_resolver import media_resolver, MediaContext
+from app.common.core.date_parser import esg_media_date_parser
 
 
 class EsgfinanceNewsScraper(NewsScraper):
@@ -27,12 +26,9 @@ class EsgfinanceNewsScraper(NewsScraper):
         urls = esgfinance_urls.urls
         self.news_board_url = urls['news_board_url']
         self.esg_finance_hub_scraper = EsgFinanceHubScraper(scraper_name=self.scraper_name)
-        self.media_name = None
-        self.type1 = load_yaml(FILE_PATHS.get('esg_finance_media')).get('type1')
-        self.type2 = load_yaml(FILE_PATHS.get('esg_finance_media')).get('type2')
-        self.type3 = load_yaml(FILE_PATHS.get('esg_finance_media')).get('type3')
-        self.type4 = load_yaml(FILE_PATHS.get('esg_finance_media')).get('type4')
-        self.media = load_yaml(FILE_PATHS.get('esg_finance_media')).get('media')
+        # 매체 이름과 파싱 규칙은 기사 URL마다 media_resolver가 반환하는 MediaContext로 결정합니다.
+        self.parsing_rules_portal = None
+        self.date_parser = esg_media_date_parser
 
     def get_all_links_and_save_to_csv(self):
         """모든 링크를 가져와서 CSV 파일에 저장하는 함수"""
@@ -43,134 +39,63 @@ class EsgfinanceNewsScraper(NewsScraper):
             err_message = "THERE WAS AN ERROR WHILE GETTING ALL LINKS AND SAVING TO CSV.\nCHECK THE ESG FINANCE HUB SCRAPER LOGS FOR MORE DETAILS"
             self.process_err_log_msg(err_message, "get_all_links_and_save_to_csv", stack_trace, e)
 
-    def preprocess_datetime(self, unprocessed_date):
+    def preprocess_datetime(self, unprocessed_date, media_name=None):
         """날짜 전처리 함수
+        매체별로 마지막에 성공한 날짜 형식을 먼저 시도합니다. (esg_media_date_parser)
         Args:
             unprocessed_date (str): 전처리되지 않은 날짜
+            media_name (str, optional): 날짜 형식을 학습할 매체 이름
         Returns:
             str: 전처리된 날짜
         """
-        processed_date = preprocess_datetime_iso(unprocessed_date)
+        processed_date = self.date_parser.parse(unprocessed_date, key=media_name)
         if processed_date:
             return processed_date
 
-        processed_date = preprocess_datetime_compact(unprocessed_date)
-        if processed_date:
-            return processed_date
-
-        processed_date = preprocess_datetime_compact_with_seperator(unprocessed_date)
-        if processed_date:
-            return processed_date
-
-        processed_date = preprocess_datetime_rfc2822(unprocessed_date)
-        if processed_date:
-            return processed_date
-
-        processed_date = preprocess_datetime_rfc3339(unprocessed_date)
-        if processed_date:
-            return processed_date
-
-        processed_date = preprocess_datetime_standard(unprocessed_date)
-        if processed_date:
-            return processed_date
-
-        processed_date = preprocess_datetime_standard_without_seconds(unprocessed_date)
-        if processed_date:
-            return processed_date
-
-        processed_date = preprocess_datetime_korean_without_seconds(unprocessed_date)
-        if processed_date:
-            return processed_date
-
-        processed_date = preprocess_datetime_period_without_seconds(unprocessed_date)
-        if processed_date:
-            return processed_date
-
-        processed_date = preprocess_date_period(unprocessed_date)
-        if processed_date:
-            return processed_date
-
-        processed_date = preprocess_datetime_eng_without_seconds(unprocessed_date)
-        if processed_date:
-            return processed_date
+        err_message = f"THERE WAS AN ERROR WHILE PROCESSING DATE: {unprocessed_date}"
+        self.process_err_log_msg(err_message, "preprocess_datetime", "", ValueError(f"Invalid date format: {unprocessed_date}"))
+        return None
 
+    async def get_news_urls(self):
         try:
-            raise ValueError(f"Invalid date format: {unprocessed_date}")
-        except Exception as e:
-            stack_trace = traceback.format_exc()
-            err_message = f"THERE WAS AN ERROR WHILE PROCESSING DATE: {unprocessed_date}"
-            self.process_err_log_msg(err_message, "preprocess_datetime", stack_trace, e)
-            return None
-
-    def get_news_urls(self):
-        try:
-            for link in self.esg_finance_hub_scraper.get_first_page_links():
-                domain = link.split('/')[2]
-                if domain in self.type1:
-                    self.media_name = self.type1.get(domain)
-                    self.parsing_rules_dict = self.get_parsing_rules_dict(scraper_name='esg_finance_hub1')
-                elif domain in self.type2:
-                    self.media_name = self.type2.get(domain)
-                    self.parsing_rules_dict = self.get_parsing_rules_dict(scraper_name='esg_finance_hub2')
-                elif domain in self.type3:
-                    self.media_name = self.type3.get(domain)
-                    self.parsing_rules_dict = self.get_parsing_rules_dict(scraper_name='esg_finance_hub3')
-                elif domain in self.type4:
-                    self.media_name = self.type4.get(domain)
-                    self.parsing_rules_dict = self.get_parsing_rules_dict(scraper_name='esg_finance_hub4')
-                elif domain in self.media:
-                    self.media_name = self.media.get(domain)
-                    self.parsing_rules_dict = self.get_parsing_rules_dict(scraper_name=self.media_name)
-                else:
-                    self.media_name = 'Not Registered'
-                    self.parsing_rules_dict = {}
-                yield link
+            # 셀레니움 드라이버는 블로킹 호출이므로 별도 스레드에서 실행합니다.
+            return await asyncio.to_thread(lambda: list(self.esg_finance_hub_scraper.get_first_page_links() or []))
         except Exception as e:
             stack_trace = traceback.format_exc()
             err_message = f"THERE WAS AN ERROR WHILE GETTING NEWS URLS FROM {self.news_board_url}\nCHECK THE ESG FINANCE HUB SCRAPER LOGS FOR MORE DETAILS"
             self.process_err_log_msg(err_message, "get_news_urls", stack_trace, e)
             return None
 
-    def get_all_news_urls(self):
+    def read_latest_links_csv(self):
+        """가장 최근의 링크 CSV 파일을 읽어 중복을 제거한 URL 리스트를 반환하는 함수
+        Returns:
+            list: URL 리스트 (CSV 파일이 없으면 None)
+        """
+        # CSV 파일 경로
+        file_path = FILE_PATHS.get(f'{self.scraper_name}_links_csv')
+        file_list = glob.glob(file_path)
+        if not file_list:
+            return None
+
+        file_list.sort(key=lambda x: os.path.splitext(os.path.basename(x))[0][-14:])
+        latest_file = file_list[-1]
+        df = pd.read_csv(latest_file)
+        df.columns = ['page', 'url']
+        df = df.drop_duplicates(subset=['url'], keep='first')
+        return df['url'].tolist()
+
+    async def get_all_news_urls(self):
         try:
-            # CSV 파일 경로
-            file_path = FILE_PATHS.get(f'{self.scraper_name}_links_csv')
-            file_list = glob.glob(file_path)
+            news_urls = await asyncio.to_thread(self.read_latest_links_csv)
 
             # CSV 파일이 존재하는 경우
-            if file_list:
-                file_list.sort(key=lambda x: os.path.splitext(os.path.basename(x))[0][-14:])
-                latest_file = file_list[-1]
-                df = pd.read_csv(latest_file)
-                df.columns = ['page', 'url']
-                df = df.drop_duplicates(subset=['url'], keep='first')
-                for url in df['url'].tolist():
-                    domain = url.split('/')[2]
-                    if domain in self.type1:
-                        self.media_name = self.type1.get(domain)
-                        self.parsing_rules_dict = self.get_parsing_rules_dict(scraper_name='esg_finance_hub1')
-                    elif domain in self.type2:
-                        self.media_name = self.type2.get(domain)
-                        self.parsing_rules_dict = self.get_parsing_rules_dict(scraper_name='esg_finance_hub2')
-                    elif domain in self.type3:
-                        self.media_name = self.type3.get(domain)
-                        self.parsing_rules_dict = self.get_parsing_rules_dict(scraper_name='esg_finance_hub3')
-                    elif domain in self.type4:
-                        self.media_name = self.type4.get(domain)
-                        self.parsing_rules_dict = self.get_parsing_rules_dict(scraper_name='esg_finance_hub4')
-                    elif domain in self.media:
-                        self.media_name = self.media.get(domain)
-                        self.parsing_rules_dict = self.get_parsing_rules_dict(scraper_name=self.media_name)
-                    else:
-                        self.media_name = 'Not Registered'
-                        self.parsing_rules_dict = {}
-                    print(f'{self.media_name}: {url}\n')
-                    yield url
+            if news_urls is not None:
+                return news_urls
             # CSV 파일이 존재하지 않는 경우
             else:
                 info_message = f"CSV FILE DOES NOT EXIST FOR {self.scraper_name}"
                 self.process_info_log_msg(info_message, type="info")
-                self.get_all_links_and_save_to_csv()
+                await asyncio.to_thread(self.get_all_links_and_save_to_csv)
                 return None
 
         except Exception as e:
@@ -179,30 +104,26 @@ class EsgfinanceNewsScraper(NewsScraper):
             self.process_err_log_msg(err_message, "get_all_news_urls", stack_trace, e)
             return None
 
-    async def scrape_each_news(self, news_url):
-        total_extracted_data = {}
-        elements = self.parsing_rules_dict.keys()
-        elements_for_bs = []
-        elements_for_trafilatura = []
-
-        for element in elements:
-            method = self.parsing_rules_dict.get(element)[0]
-            if method == "bs":
-                elements_for_bs.append(element)
-            elif method == "trafilatura":
-                elements_for_trafilatura.append(element)
-
-        with_metadata = True
-        if self.media_name in ["kidd"]:
-            with_metadata = False
-        if elements_for_bs:
-            extracted_data_with_bs = await self.scrape_each_news_with_bs(news_url, elements_for_bs)
-            if extracted_data_with_bs:
-                total_extracted_data.update(extracted_data_with_bs)
-        if elements_for_trafilatura:
-            extracted_data_with_trafilatura = await self.scrape_each_news_with_trafilatura(news_url, elements_for_trafilatura, with_metadata=with_metadata)
-            if extracted_data_with_trafilatura:
-                total_extracted_data.update(extracted_data_with_trafilatura)
+    async def scrape_each_media_news(self, news_url):
+        """기사 URL의 매체 정보(MediaContext)를 찾아 매체에 맞는 파싱 규칙으로 스크랩하는 함수"""
+        return await self.scrape_each_news(news_url, media_resolver.resolve(news_url))
+
+    async def scrape_each_news(self, news_url, media_context: MediaContext):
+        media_name = media_context.media_name
+        if not media_context.is_registered:
+            err_message = f"MEDIA IS NOT REGISTERED FOR URL: {news_url}"
+            self.process_err_log_msg(err_message, "scrape_each_news", "", "")
+            return None
+
+        # 매체별 파싱 규칙은 처음 사용할 때 DB 스레드에서 불러옵니다.
+        await self.warm_parsing_rules(media_context.rules_portal)
+        # 기사를 한 번만 내려받아 bs, trafilatura 파싱 규칙을 모두 적용합니다.
+        total_extracted_data = await self.scrape_each_news_with_document(
+            news_url,
+            parsing_rules_dict=self.get_parsing_rules_dict(media_context.rules_portal) or {},
+            with_metadata=media_context.profile.with_metadata,
+            media_name=media_name,
+            ) or {}
 
         title = total_extracted_data.get('title')
         content = total_extracted_data.get('content')
@@ -217,86 +138,17 @@ class EsgfinanceNewsScraper(NewsScraper):
             self.process_err_log_msg(err_message, "scrape_each_news", "", "")
             return None
 
-        if self.media_name in ["dt", "metroseoul"]:
-            image_url = f"https:{image_url}"
-
-        if self.media_name in ["paxetv"]:
-            create_date = create_date.split('승인')[-1].strip()
-
-        if self.media_name in ["digitalchosun_dizzo", "dnews", "thevaluenews", "kidd"]:
-            create_date = create_date[5:]
-
-        if self.media_name == "metroseoul":
-            create_date = create_date.split('ㅣ')[-1].strip()
-
-        if self.media_name == "mediapen":
-            create_date = create_date.split('|')[0].strip()
-
-        if self.media_name == "ceoscoredaily":
-            image_url = f"https://www.ceoscoredaily.com{image_url}"
-
-        if self.media_name in ["theguardian", "news_yahoo", "uk_news_yahoo", "sg_news_yahoo", "bbc", "ca_news_yahoo", "au_news_yahoo", "nz_news_yahoo"]:
-            create_date = create_date.split('.')[0]
-
-        if self.media_name == "the bell":
-            create_date = create_date.replace('공개 ', '').strip()
-
-        if self.media_name == "kjdaily":
-            create_date = create_date[:11].replace(' ', '') + create_date[14:]
-
-        if self.media_name == "jnilbo":
-            create_date = create_date.split(' : ')[-1][:11].replace(' ', '') + create_date.split(' : ')[-1][14:]
-
-        if self.media_name in ["news_mtn", "wowtv", "cnn"]:
-            create_date = create_date[:-1]
-
-        if self.media_name in ["busan", "news2day", "nongmin", "dt"]:
-            create_date = create_date.split(': ')[-1].strip()
-
-        if self.media_name in ["businessnews_chosun", "taxtimes", "youthdaily", "hellot"]:
-            create_date = create_date.split('등록 ')[-1].strip()
-
-        if self.media_name == "weekly_cnbnews":
-            create_date = create_date.split('⁄ ')[-1].strip()
-
-        if self.media_name == "kwnews":
-            image_url = f"https://www.kwnews.co.kr{image_url}"
-
-        if self.media_name == "busan":
-            image_url = f"https://www.busan.com{image_url}"
-
-        if self.media_name in ["kwnews"]:
-            create_date = create_date.replace('[', '').replace(']', '')
-
-        if self.media_name in ["newstong"]:
-            create_date = create_date.split('\t')[-1].strip()
-
-        if self.media_name == "naeil":
-            create_date = create_date.replace(' 게재', '').strip()
-
-        if self.media_name in ["munhwa", "lak", "boannews", "kyeongin"]:
-            create_date = create_date.replace('입력 ', '').strip()
-
-        if self.media_name == "cnbnews":
-            create_date = create_date.split('\xa0')[-1].strip()
-
-        if self.media_name == "asiatime":
-            create_date = create_date.split('입력 ')[-1].split(' 수정')[0].strip()
-
-        # if self.media_name == "biz_chosun":
-        #     create_date = create_date.split('.')[0]
-
-        # if self.media_name == "news_kbs":
-        #     create_date = create_date.replace('입력 ', '').replace('(', '').replace(')', '').strip()
-
-        # if self.media_name == "economist":
-        #     create_date = create_date.replace('[이코노미스트] 입력 ', '')
+        # 매체별 후처리 프로파일(미디어 YAML의 profiles)로 날짜와 이미지 URL을 보정합니다.
+        create_date = media_context.profile.process('create_date', create_date)
+        image_url = media_context.profile.process('image_url', image_url)
 
         url_md5 = hashlib.md5(news_url.encode()).hexdigest()
-        preprocessed_create_date = self.preprocess_datetime(create_date)
+        preprocessed_create_date = self.preprocess_datetime(create_date, media_name)
         kind_id = self.category_dict.get(self.scraper_name).get("etc")
-        norm_title = normal_text(title)
-        content = truncate_content(content)
+        # 제목 정규화와 본문 정제는 추출 프로세스 풀에서 실행합니다.
+        normalized = await self.normalize_news_text(title, content, process=False)
+        norm_title = normalized['norm_title']
+        content = normalized['content']
 
         news_data = EsgNews(
             url=news_url,
@@ -322,45 +174,32 @@ class EsgfinanceNewsScraper(NewsScraper):
                 # 세션 로그 초기화
                 self.initialize_session_log()
 
-                # 뉴스 데이터 리스트 초기화
-                self.news_data_list = []
-
                 if get_all_news_urls:
-                    news_urls = self.get_all_news_urls()
+                    news_urls = await self.get_all_news_urls()
                 else:
-                    news_urls = self.get_news_urls()
+                    news_urls = await self.get_news_urls()
 
-                if not isinstance(news_urls, types.GeneratorType):
-                    err_message = "GET_NEWS_URLS DOES NOT RETURN A GENERATOR. CHECK THE 'news_board_url' OR THE RETURN VALUE OF FUNCTION 'get_news_urls'"
+                if not isinstance(news_urls, list):
+                    err_message = "GET_NEWS_URLS DOES NOT RETURN A LIST. CHECK THE 'news_board_url' OR THE RETURN VALUE OF FUNCTION 'get_news_urls'"
                     self.process_err_log_msg(err_message, "scrape_news", "", "")
                     return None
 
-                for news_url in news_urls:
-                    news_data = None
-                    # 에러 로그 개별 초기화
-                    self.initialize_error_log(news_url)
-                    self.session_log['total_records_processed'] += 1
-                    if not self.is_already_scraped(news_url):
-                        await asyncio.sleep(random.randint(1, 5))
-                        news_data = await self.scrape_each_news(news_url)
-                    else:
-                        self.is_duplicated = True
-                        err_message = f"NEWS ALREADY EXISTS IN DATABASE: {news_url}"
-                        self.process_err_log_msg(err_message, "scrape_news", "", "")
-
-                    # 뉴스 데이터에 에러가 있으면, 에러 로그를 append하고, 그렇지 않으면 뉴스 데이터를 리스트에 추가
-                    self.check_error(news_data, news_url)
-                    if get_all_news_urls:
-                        # 매 100개의 뉴스마다 데이터 베이스에 저장
-                        if len(self.news_data_list) == 100:
-                            self.save_news_data_bulk(self.news_data_list)
-                            self.news_data_list = []
-
-                # 뉴스 데이터베이스에 한 번에 저장
-                self.save_news_data_bulk(self.news_data_list)
+                if get_all_news_urls:
+                    # 100개의 뉴스마다 데이터 베이스에 저장
+                    for start in range(0, len(news_urls), 100):
+                        await self.scrape_articles(news_urls[start:start + 100], self.scrape_each_media_news)
+                        await self.flush_news_data()
+                else:
+                    new_md5s = await self.scrape_articles(await self.cut_at_watermark(None, news_urls), self.scrape_each_media_news)
+                    # 새 기사 비율로 다음 게시판 확인 주기를 정하고 워터마크를 갱신합니다.
+                    self.record_poll(None, news_urls, new_md5s)
+                    self.update_watermark(None, news_urls)
+
+                # 쓰기 큐에 남은 뉴스 데이터를 모두 저장
+                await self.flush_news_data()
 
                 # 최종 세션 로그 저장
-                self.finalize_session_log()
+                await self.finalize_session_log()
                 success_message = f"SCRAPING COMPLETED FOR {self.scraper_name} WITH {self.session_log['total_records_processed']} RECORDS"
                 self.process_info_log_msg(success_message, "scrape_news")
             except Exception as e:
@@ -372,14 +211,8 @@ class EsgfinanceNewsScraper(NewsScraper):
                 if get_all_news_urls:
                     is_loop = False
                 else:
-                    # 모든 스크래핑이 끝나면 일정 시간 대기
-                    await asyncio.sleep(self.interval_time_sleep)
-
-    def get_feed_entries(self):
-        pass
-
-    async def scrape_each_feed_entry(self, entry):
-        pass
+                    # 다음 게시판 확인 시각까지 대기
+                    await self.wait_for_next_poll()
 
 
 # ESG FINANCE 뉴스 스크래핑
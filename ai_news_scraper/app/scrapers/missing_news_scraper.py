@@ -1,13 +1,8 @@
 import asyncio
-import random
 import hashlib
 import traceback
-import types
-import time
 import datetime
 
-import requests
-import aiohttp
 import pandas as pd
 import numpy as np
 from bs4 import BeautifulSoup
@@ -16,6 +11,8 @@ from app.common.core.base_news_scraper import NewsScraper
 from app.models_init import EsgNews
 from app.common.core.utils import *
 from app.config.settings import FILE_PATHS
+from app.common.core.media_resolver import media_resolver, MediaContext
+from app.common.core.date_parser import esg_media_date_parser
 
 
 class MissingNewsScraper(NewsScraper):
@@ -31,71 +28,26 @@ class MissingNewsScraper(NewsScraper):
         super().__init__(scraper_name)
         self._df = df
         self._file_path = FILE_PATHS.get('data')+'/'+file_name
-        self.media_name = None
-        self.type1 = load_yaml(FILE_PATHS.get('esg_finance_media')).get('type1')
-        self.type2 = load_yaml(FILE_PATHS.get('esg_finance_media')).get('type2')
-        self.type3 = load_yaml(FILE_PATHS.get('esg_finance_media')).get('type3')
-        self.type4 = load_yaml(FILE_PATHS.get('esg_finance_media')).get('type4')
-        self.media = load_yaml(FILE_PATHS.get('esg_finance_media')).get('media')
+        # 매체 이름과 파싱 규칙은 기사 URL마다 media_resolver가 반환하는 MediaContext로 결정합니다.
+        self.parsing_rules_portal = None
+        self.date_parser = esg_media_date_parser
 
-    def preprocess_datetime(self, unprocessed_date: str) -> str:
+    def preprocess_datetime(self, unprocessed_date: str, media_name: str = None) -> str:
         """날짜 전처리 함수
+        매체별로 마지막에 성공한 날짜 형식을 먼저 시도합니다. (esg_media_date_parser)
         Args:
             unprocessed_date (str): 전처리되지 않은 날짜
+            media_name (str, optional): 날짜 형식을 학습할 매체 이름
         Returns:
             str: 전처리된 날짜
         """
-        processed_date = preprocess_datetime_iso(unprocessed_date)
+        processed_date = self.date_parser.parse(unprocessed_date, key=media_name)
         if processed_date:
             return processed_date
 
-        processed_date = preprocess_datetime_compact(unprocessed_date)
-        if processed_date:
-            return processed_date
-
-        processed_date = preprocess_datetime_compact_with_seperator(unprocessed_date)
-        if processed_date:
-            return processed_date
-
-        processed_date = preprocess_datetime_rfc2822(unprocessed_date)
-        if processed_date:
-            return processed_date
-
-        processed_date = preprocess_datetime_rfc3339(unprocessed_date)
-        if processed_date:
-            return processed_date
-
-        processed_date = preprocess_datetime_standard(unprocessed_date)
-        if processed_date:
-            return processed_date
-
-        processed_date = preprocess_datetime_standard_without_seconds(unprocessed_date)
-        if processed_date:
-            return processed_date
-
-        processed_date = preprocess_datetime_korean_without_seconds(unprocessed_date)
-        if processed_date:
-            return processed_date
-
-        processed_date = preprocess_datetime_period_without_seconds(unprocessed_date)
-        if processed_date:
-            return processed_date
-
-        processed_date = preprocess_date_period(unprocessed_date)
-        if processed_date:
-            return processed_date
-
-        processed_date = preprocess_datetime_eng_without_seconds(unprocessed_date)
-        if processed_date:
-            return processed_date
-
-        try:
-            raise ValueError(f"Invalid date format: {unprocessed_date}")
-        except Exception as e:
-            stack_trace = traceback.format_exc()
-            err_message = f"THERE WAS AN ERROR WHILE PROCESSING DATE: {unprocessed_date}"
-            self.process_err_log_msg(err_message, "preprocess_datetime", stack_trace, e)
-            return None
+        err_message = f"THERE WAS AN ERROR WHILE PROCESSING DATE: {unprocessed_date}"
+        self.process_err_log_msg(err_message, "preprocess_datetime", "", ValueError(f"Invalid date format: {unprocessed_date}"))
+        return None
 
     def _cal_date_range(self, dt_str: str) -> tuple:
         """기준 날짜의 한달 전과 한달 후를 구하는 함수
@@ -111,14 +63,14 @@ class MissingNewsScraper(NewsScraper):
         next = dt + datetime.timedelta(days=30)
         return prev.strftime('%Y.%m.%d'), next.strftime('%Y.%m.%d')
 
-    def get_news_urls(self, word: str, ds: str, de: str) -> str:
+    async def get_news_urls(self, word: str, ds: str, de: str) -> list:
         """네이버 뉴스를 검색하는 함수
         Args:
             word (str): 검색어
             ds (str): 검색 시작 날짜
             de (str): 검색 종료 날짜
         Returns:
-            str: 검색 결과의 뉴스 링크
+            list: 검색 결과의 뉴스 링크 리스트
         """
         try:
             url = "https://search.naver.com/search.naver"
@@ -134,76 +86,50 @@ class MissingNewsScraper(NewsScraper):
                 'ds': ds,
                 'de': de,
             }
+            # 요청 간격과 차단(403) 후 대기 시간은 호스트별 속도 조절기(host_rate_limiter)가 조절합니다.
             while True:
-                time.sleep(random.randint(1, 5))
-                resp = requests.get(url, headers=headers, params=params)
-                if resp.status_code == 200:
-                    html = resp.text
+                resp = await self.fetch_listing_response(url, headers=headers, params=params, conditional=False)
+                if resp is None:
+                    return []
+                if resp.status == 200:
+                    html = resp.content.decode(resp.charset or 'utf-8', 'ignore')
                     soup = BeautifulSoup(html, 'html.parser')
                     news_items = soup.select('.list_news > li')
-                    for item in news_items:
-                        link = item.select_one('.news_tit')['href']
-
-                        domain = link.split('/')[2]
-                        if domain in self.type1:
-                            self.media_name = self.type1.get(domain)
-                            self.parsing_rules_dict = self.get_parsing_rules_dict(scraper_name='esg_finance_hub1')
-                        elif domain in self.type2:
-                            self.media_name = self.type2.get(domain)
-                            self.parsing_rules_dict = self.get_parsing_rules_dict(scraper_name='esg_finance_hub2')
-                        elif domain in self.type3:
-                            self.media_name = self.type3.get(domain)
-                            self.parsing_rules_dict = self.get_parsing_rules_dict(scraper_name='esg_finance_hub3')
-                        elif domain in self.type4:
-                            self.media_name = self.type4.get(domain)
-                            self.parsing_rules_dict = self.get_parsing_rules_dict(scraper_name='esg_finance_hub4')
-                        elif domain in self.media:
-                            self.media_name = self.media.get(domain)
-                            self.parsing_rules_dict = self.get_parsing_rules_dict(scraper_name=self.media_name)
-                        else:
-                            self.media_name = 'Not Registered'
-                            self.parsing_rules_dict = {}
-                        yield link
-                    break
-                elif resp.status_code == 403:
-                    err_message = f"status code: {resp.status_code} / Blocked by Naver. Retrying in 10 minutes..."
+                    return [item.select_one('.news_tit')['href'] for item in news_items]
+                elif resp.status == 403:
+                    err_message = f"status code: {resp.status} / Blocked by Naver. Retrying after host cooldown..."
                     self.process_err_log_msg(err_message=err_message, function_name='get_news_urls')
-                    time.sleep(600)
                     continue
                 else:
-                    err_message = f"status code: {resp.status_code}"
+                    err_message = f"status code: {resp.status}"
                     self.process_err_log_msg(err_message=err_message, function_name='get_news_urls')
-                    return
+                    return []
         except Exception as e:
             stack_trace = traceback.format_exc()
             err_message = "THERE WAS AN ERROR WHILE GETTING LINKS FROM NAVER"
             self.process_err_log_msg(err_message, "get_news_urls", stack_trace, e)
-            return
+            return []
 
-    async def scrape_each_news(self, news_url):
-        total_extracted_data = {}
-        elements = self.parsing_rules_dict.keys()
-        elements_for_bs = []
-        elements_for_trafilatura = []
+    async def scrape_each_media_news(self, news_url: str):
+        """기사 URL의 매체 정보(MediaContext)를 찾아 매체에 맞는 파싱 규칙으로 스크랩하는 함수"""
+        return await self.scrape_each_news(news_url, media_resolver.resolve(news_url))
 
-        for element in elements:
-            method = self.parsing_rules_dict.get(element)[0]
-            if method == "bs":
-                elements_for_bs.append(element)
-            elif method == "trafilatura":
-                elements_for_trafilatura.append(element)
+    async def scrape_each_news(self, news_url, media_context: MediaContext):
+        media_name = media_context.media_name
+        if not media_context.is_registered:
+            err_message = f"MEDIA IS NOT REGISTERED FOR URL: {news_url}"
+            self.process_err_log_msg(err_message, "scrape_each_news", "", "")
+            return None
 
-        with_metadata = True
-        if self.media_name in ["kidd"]:
-            with_metadata = False
-        if elements_for_bs:
-            extracted_data_with_bs = await self.scrape_each_news_with_bs(news_url, elements_for_bs)
-            if extracted_data_with_bs:
-                total_extracted_data.update(extracted_data_with_bs)
-        if elements_for_trafilatura:
-            extracted_data_with_trafilatura = await self.scrape_each_news_with_trafilatura(news_url, elements_for_trafilatura, with_metadata=with_metadata)
-            if extracted_data_with_trafilatura:
-                total_extracted_data.update(extracted_data_with_trafilatura)
+        # 매체별 파싱 규칙은 처음 사용할 때 DB 스레드에서 불러옵니다.
+        await self.warm_parsing_rules(media_context.rules_portal)
+        # 기사를 한 번만 내려받아 bs, trafilatura 파싱 규칙을 모두 적용합니다.
+        total_extracted_data = await self.scrape_each_news_with_document(
+            news_url,
+            parsing_rules_dict=self.get_parsing_rules_dict(media_context.rules_portal) or {},
+            with_metadata=media_context.profile.with_metadata,
+            media_name=media_name,
+            ) or {}
 
         title = total_extracted_data.get('title')
         content = total_extracted_data.get('content')
@@ -218,86 +144,16 @@ class MissingNewsScraper(NewsScraper):
             self.process_err_log_msg(err_message, "scrape_each_news", "", "")
             return None
 
-        if self.media_name in ["dt", "metroseoul"]:
-            image_url = f"https:{image_url}"
-
-        if self.media_name in ["paxetv"]:
-            create_date = create_date.split('승인')[-1].strip()
-
-        if self.media_name in ["digitalchosun_dizzo", "dnews", "thevaluenews", "kidd"]:
-            create_date = create_date[5:]
-
-        if self.media_name == "metroseoul":
-            create_date = create_date.split('ㅣ')[-1].strip()
-
-        if self.media_name == "mediapen":
-            create_date = create_date.split('|')[0].strip()
-
-        if self.media_name == "ceoscoredaily":
-            image_url = f"https://www.ceoscoredaily.com{image_url}"
-
-        if self.media_name in ["theguardian", "news_yahoo", "uk_news_yahoo", "sg_news_yahoo", "bbc", "ca_news_yahoo", "au_news_yahoo", "nz_news_yahoo"]:
-            create_date = create_date.split('.')[0]
-
-        if self.media_name == "the bell":
-            create_date = create_date.replace('공개 ', '').strip()
-
-        if self.media_name == "kjdaily":
-            create_date = create_date[:11].replace(' ', '') + create_date[14:]
-
-        if self.media_name == "jnilbo":
-            create_date = create_date.split(' : ')[-1][:11].replace(' ', '') + create_date.split(' : ')[-1][14:]
-
-        if self.media_name in ["news_mtn", "wowtv", "cnn"]:
-            create_date = create_date[:-1]
-
-        if self.media_name in ["busan", "news2day", "nongmin", "dt"]:
-            create_date = create_date.split(': ')[-1].strip()
-
-        if self.media_name in ["businessnews_chosun", "taxtimes", "youthdaily", "hellot"]:
-            create_date = create_date.split('등록 ')[-1].strip()
-
-        if self.media_name == "weekly_cnbnews":
-            create_date = create_date.split('⁄ ')[-1].strip()
-
-        if self.media_name == "kwnews":
-            image_url = f"https://www.kwnews.co.kr{image_url}"
-
-        if self.media_name == "busan":
-            image_url = f"https://www.busan.com{image_url}"
-
-        if self.media_name in ["kwnews"]:
-            create_date = create_date.replace('[', '').replace(']', '')
-
-        if self.media_name in ["newstong"]:
-            create_date = create_date.split('\t')[-1].strip()
-
-        if self.media_name == "naeil":
-            create_date = create_date.replace(' 게재', '').strip()
-
-        if self.media_name in ["munhwa", "lak", "boannews", "kyeongin"]:
-            create_date = create_date.replace('입력 ', '').strip()
-
-        if self.media_name == "cnbnews":
-            create_date = create_date.split('\xa0')[-1].strip()
-
-        if self.media_name == "asiatime":
-            create_date = create_date.split('입력 ')[-1].split(' 수정')[0].strip()
-
-        # if self.media_name == "biz_chosun":
-        #     create_date = create_date.split('.')[0]
-
-        # if self.media_name == "news_kbs":
-        #     create_date = create_date.replace('입력 ', '').replace('(', '').replace(')', '').strip()
-
-        # if self.media_name == "economist":
-        #     create_date = create_date.replace('[이코노미스트] 입력 ', '')
+        # 매체별 후처리 프로파일(미디어 YAML의 profiles)로 날짜와 이미지 URL을 보정합니다.
+        create_date = media_context.profile.process('create_date', create_date)
+        image_url = media_context.profile.process('image_url', image_url)
 
         url_md5 = hashlib.md5(news_url.encode()).hexdigest()
-        preprocessed_create_date = self.preprocess_datetime(create_date)
-        norm_title = normal_text(title)
-        content = truncate_content(content)
-        content = process_content(content)
+        preprocessed_create_date = self.preprocess_datetime(create_date, media_name)
+        # 제목 정규화와 본문 정제는 추출 프로세스 풀에서 실행합니다.
+        normalized = await self.normalize_news_text(title, content)
+        norm_title = normalized['norm_title']
+        content = normalized['content']
 
         news_data = EsgNews(
             url=news_url,
@@ -327,42 +183,16 @@ class MissingNewsScraper(NewsScraper):
                     investors = investor.split(',')
                     for inv in investors:
                         word = f'{corp} + {inv.strip()}'
-                        for news_url in self.get_news_urls(word, ds, de):
-                            news_data = None
-                            self.initialize_error_log(news_url)
-                            self.session_log['total_records_processed'] += 1
-                            if not self.is_already_scraped(news_url):
-                                await asyncio.sleep(random.randint(1, 5))
-                                news_data = await self.scrape_each_news(news_url)
-                            else:
-                                self.is_duplicated = True
-                                err_message = f"NEWS ALREADY EXISTS IN DATABASE: {news_url}"
-                                self.process_err_log_msg(err_message, "scrape_news", "", "")
+                        news_urls = await self.get_news_urls(word, ds, de)
+                        await self.scrape_articles(news_urls, self.scrape_each_media_news)
 
-                            # 뉴스 데이터에 에러가 있으면, 에러 로그를 append하고, 그렇지 않으면 뉴스 데이터를 리스트에 추가
-                            self.check_error(news_data, news_url)
+                news_urls = await self.get_news_urls(corp, ds, de)
+                await self.scrape_articles(news_urls, self.scrape_each_media_news)
 
-                for news_url in self.get_news_urls(corp, ds, de):
-                    news_data = None
-                    self.initialize_error_log(news_url)
-                    self.session_log['total_records_processed'] += 1
-                    if not self.is_already_scraped(news_url):
-                        await asyncio.sleep(random.randint(1, 5))
-                        news_data = await self.scrape_each_news(news_url)
-                    else:
-                        self.is_duplicated = True
-                        err_message = f"NEWS ALREADY EXISTS IN DATABASE: {news_url}"
-                        self.process_err_log_msg(err_message, "scrape_news", "", "")
-
-                    # 뉴스 데이터에 에러가 있으면, 에러 로그를 append하고, 그렇지 않으면 뉴스 데이터를 리스트에 추가
-                    self.check_error(news_data, news_url)
-
-                if self.news_data_list:
-                    self.save_news_data_bulk(self.news_data_list)
-                    self.news_data_list = []
+                await self.flush_news_data()
 
                 # 최종 세션 로그 저장
-                self.finalize_session_log()
+                await self.finalize_session_log()
                 success_message = f"SCRAPING COMPLETED FOR {self.scraper_name} WITH {self.session_log['total_records_processed']} RECORDS"
                 self.process_info_log_msg(success_message, "scrape_news")
         except Exception as e:
@@ -370,12 +200,6 @@ class MissingNewsScraper(NewsScraper):
             err_message = "THERE WAS AN ERROR WHILE SCRAPING NEWS\nCHECK THE LOGS FOR MORE DETAILS"
             self.process_err_log_msg(err_message, "scrape_news", stack_trace, e)
 
-    def get_feed_entries(self):
-        pass
-
-    async def scrape_each_feed_entry(self, entry):
-        pass
-
 
 async def scrape_missing_news(df: pd.DataFrame, file_name: str):
     """Missing 뉴스 스크래퍼를 실행하는 함수"""
@@ -1,17 +1,15 @@
 import asyncio
 import datetime
-import random
 import traceback
-import types
 import re
 
-import requests
 from bs4 import BeautifulSoup
 
 from app.common.core.base_news_scraper import NewsScraper
 from app.models_init import NaverNews
 from app.scrapers.urls import URLs
 from app.common.core.utils import *
+from app.common.core.date_parser import DateParser, DateFormat
 
 
 class NaverNewsScraper(NewsScraper):
@@ -23,12 +21,27 @@ class NaverNewsScraper(NewsScraper):
         naver_urls = URLs(scraper_name)
         urls = naver_urls.urls
         self.news_board_url = urls['news_board_url']
-
-        # naver는 naver 일반 뉴스 외에 sports.naver.com도 있습니다.
-        # naver_sports 파싱 규칙 추가
-        # 한 개 이상의 파싱 규칙을 사용할 경우, self.parsing_rules_dict2에 추가합니다.
-        self.parsing_rules_dict2 = self.get_parsing_rules_dict(f"{self.scraper_name}_sports")
-        self.all_parsing_rules_dicts = [self.parsing_rules_dict, self.parsing_rules_dict2]
+        # 표준 > 압축 > 네이버 '기사입력' 형식 순서로 시도합니다.
+        self.date_parser = DateParser([
+            'standard',
+            'compact',
+            DateFormat('naver_custom', self.preprocess_datetime_custom, gate=re.compile('기사입력')),
+            ])
+
+    @property
+    def parsing_rules_dict2(self) -> dict:
+        """naver는 naver 일반 뉴스 외에 sports.naver.com도 있습니다. (naver_sports 파싱 규칙)"""
+        return self.get_parsing_rules_dict(f"{self.scraper_name}_sports")
+
+    @property
+    def parsing_rules_portals(self) -> list:
+        """naver 일반 뉴스와 naver_sports 파싱 규칙을 미리 불러옵니다."""
+        return [self.scraper_name, f"{self.scraper_name}_sports"]
+
+    @property
+    def all_parsing_rules_dicts(self) -> list:
+        """한 개 이상의 파싱 규칙을 사용할 경우, 차례로 적용할 파싱 규칙 리스트 (parsing_rule_cache의 최신 규칙)"""
+        return [self.parsing_rules_dict, self.parsing_rules_dict2]
 
     def preprocess_datetime_custom(self, date_str):
         """사용자 정의 날짜 형식 처리"""
@@ -50,42 +63,27 @@ class NaverNewsScraper(NewsScraper):
             return None
 
     def preprocess_datetime(self, unprocessed_date):
-        """날짜 전처리 함수"""
-        # 각 형식에 대해 순차적으로 시도
-        processed_date = preprocess_datetime_standard(unprocessed_date)
-        if processed_date:
-            return processed_date
-
-        processed_date = preprocess_datetime_compact(unprocessed_date)
-        if processed_date:
-            return processed_date
-
-        processed_date = preprocess_datetime_compact(unprocessed_date)
-        if processed_date:
-            return processed_date
-
-        processed_date = self.preprocess_datetime_custom(unprocessed_date)
+        """날짜 전처리 함수 (마지막에 성공한 형식을 먼저 시도합니다)"""
+        processed_date = self.date_parser.parse(unprocessed_date, key=self.scraper_name)
         if processed_date:
             return processed_date
 
         # 모든 형식이 실패한 경우, 로그 처리
-        try:
-            raise ValueError(f"Invalid date format: {unprocessed_date}")
-        except Exception as e:
-            stack_trace = traceback.format_exc()
-            err_message = f"THERE WAS AN ERROR WHILE PROCESSING DATE: {unprocessed_date}"
-            self.process_err_log_msg(err_message, "preprocess_datetime", stack_trace, e)
-            return None
+        err_message = f"THERE WAS AN ERROR WHILE PROCESSING DATE: {unprocessed_date}"
+        self.process_err_log_msg(err_message, "preprocess_datetime", "", ValueError(f"Invalid date format: {unprocessed_date}"))
+        return None
 
-    def get_news_urls(self, category):
+    async def get_news_urls(self, category):
         try:
             url = self.news_board_url.format(category)
 
             info_message = f"GETTING NEWS URLS FROM {url}"
             self.process_info_log_msg(info_message, type="info")
 
-            response = requests.get(url)
-            soup = BeautifulSoup(response.text, 'html.parser')
+            html = await self.fetch_listing(url)
+            if html is None:
+                return None
+            soup = BeautifulSoup(html, 'html.parser')
 
             # 뉴스 기사 URL을 가져옵니다.
             links = soup.find_all('a', class_='nclicks(fls.list)', href=True)
@@ -96,8 +94,7 @@ class NaverNewsScraper(NewsScraper):
                 self.process_err_log_msg(err_message, "get_news_urls", None, None)
                 return None
             else:
-                for news_url in news_urls:
-                    yield news_url
+                return news_urls
 
         except Exception as e:
             stack_trace = traceback.format_exc()
@@ -105,27 +102,9 @@ class NaverNewsScraper(NewsScraper):
             self.process_err_log_msg(err_message, "get_news_urls", stack_trace, e)
             return None
 
-    async def scrape_each_news(self, news_url, category, parsing_rules_dict=None):
-        total_extracted_data = {}
-        elements = self.parsing_rules_dict.keys()
-        elements_for_bs = []
-        elements_for_trafilatura = []
-
-        for element in elements:
-            method = self.parsing_rules_dict.get(element)[0]
-            if method == "bs":
-                elements_for_bs.append(element)
-            elif method == "trafilatura":
-                elements_for_trafilatura.append(element)
-
-        if elements_for_bs:
-            extracted_data_with_bs = await self.scrape_each_news_with_bs(news_url, elements_for_bs, parsing_rules_dict=parsing_rules_dict)
-            if extracted_data_with_bs:
-                total_extracted_data.update(extracted_data_with_bs)
-        if elements_for_trafilatura:
-            extracted_data_with_trafilatura = await self.scrape_each_news_with_trafilatura(news_url, elements_for_trafilatura)
-            if extracted_data_with_trafilatura:
-                total_extracted_data.update(extracted_data_with_trafilatura)
+    async def scrape_each_news(self, news_url, category, parsing_rules_dict=None, document=None):
+        # 기사를 한 번만 내려받아 bs, trafilatura 파싱 규칙을 모두 적용합니다.
+        total_extracted_data = await self.scrape_each_news_with_document(news_url, parsing_rules_dict=parsing_rules_dict, document=document) or {}
 
         title = total_extracted_data.get('title')
         content = total_extracted_data.get('content')
@@ -148,9 +127,10 @@ class NaverNewsScraper(NewsScraper):
             kind_id = self.category_dict.get(self.scraper_name).get(category)
         else:
             kind_id = self.category_dict.get(self.scraper_name).get("etc")
-        norm_title = normal_text(title)
-        content = truncate_content(content)
-        content = process_content(content)
+        # 제목 정규화와 본문 정제는 추출 프로세스 풀에서 실행합니다.
+        normalized = await self.normalize_news_text(title, content)
+        norm_title = normalized['norm_title']
+        content = normalized['content']
 
         news_data = NaverNews(
             url=news_url,
@@ -167,62 +147,68 @@ class NaverNewsScraper(NewsScraper):
             )
         return news_data
 
+    async def scrape_news_with_all_rules(self, news_url, category):
+        """기사를 한 번만 내려받고, 파싱 규칙(일반/스포츠)을 차례로 적용하여 스크랩하는 함수
+        Args:
+            news_url (str): 뉴스 기사 URL
+            category (str): 카테고리
+        Returns:
+            NaverNews: 뉴스 데이터 (모든 파싱 규칙이 실패하면 None)
+        """
+        news_data = None
+        scraper_cursor = 0
+        # 일반/스포츠 규칙 중 캐시에 없는 규칙을 먼저 불러옵니다. (이미 불러왔으면 메모리에서 끝남)
+        await self.warm_parsing_rules()
+        all_parsing_rules_dicts = self.all_parsing_rules_dicts
+        document = await self.fetch_news_document(news_url)
+        if document is None:
+            scraper_cursor = len(all_parsing_rules_dicts)
+        while not news_data and scraper_cursor < len(all_parsing_rules_dicts):
+            current_parsing_rule = all_parsing_rules_dicts[scraper_cursor]
+            news_data = await self.scrape_each_news(
+                news_url,
+                category,
+                current_parsing_rule,
+                document=document,
+                )
+
+            # 스크랩한 데이터가 없고, 마지막 스크래퍼인 경우 > 에러
+            scraper_cursor += 1
+            if not news_data and scraper_cursor == len(all_parsing_rules_dicts):
+                err_message = f"NEWS DATA IS EMPTY FOR URL: {news_url}"
+                self.process_err_log_msg(err_message, "scrape_news", "", "")
+        return news_data
+
     async def scrape_news(self):
         while True:
             try:
                 # 세션 로그 초기화
                 self.initialize_session_log()
 
-                # 뉴스 데이터 리스트 초기화
-                self.news_data_list = []
-
-                # 카테고리별 뉴스 URL을 가져옵니다.
-                for category in self.categories:
-                    news_urls = self.get_news_urls(category)
-                    if not isinstance(news_urls, types.GeneratorType):
-                        err_message = "GET_NEWS_URLS DOES NOT RETURN A GENERATOR. CHECK THE 'news_board_url' OR THE RETURN VALUE OF FUNCTION 'get_news_urls'"
-                        self.process_err_log_msg(err_message, "scrape_news", "", "")
-                        continue
-
-                    for news_url in news_urls:
-                        # 마지막 스크래퍼 여부 초기화
-                        scraper_cursor = 0
-                        news_data = None
-
-                        # 에러 로그 개별 초기화
-                        self.initialize_error_log(news_url)
-
-                        self.session_log['total_records_processed'] += 1
-                        if not self.is_already_scraped(news_url):
-                            await asyncio.sleep(random.randint(1, 2))
-                            while not news_data and scraper_cursor < len(self.all_parsing_rules_dicts):
-                                current_parsing_rule = self.all_parsing_rules_dicts[scraper_cursor]
-                                news_data = await self.scrape_each_news(
-                                    news_url,
-                                    category,
-                                    current_parsing_rule
-                                    )
-
-                                # 스크랩한 데이터가 없고, 마지막 스크래퍼인 경우 > 에러
-                                scraper_cursor += 1
-                                if not news_data and scraper_cursor == len(self.all_parsing_rules_dicts):
-                                    err_message = f"NEWS DATA IS EMPTY FOR URL: {news_url}"
-                                    self.process_err_log_msg(err_message, "scrape_news", "", "")
-                        else:
-                            self.is_duplicated = True
-                            err_message = f"NEWS ALREADY EXISTS IN DATABASE: {news_url}"
-                            self.process_err_log_msg(err_message, "scrape_news", "", "")
-
-                        # 뉴스 데이터에 에러가 있으면, 에러 로그를 append하고, 그렇지 않으면 뉴스 데이터를 리스트에 추가
-                        self.check_error(news_data, news_url)
-
-                # 뉴스 데이터베이스에 한 번에 저장
-                self.save_news_data_bulk(self.news_data_list)
+                # 확인할 때가 된 카테고리의 뉴스 URL을 동시에 가져옵니다.
+                category_news_urls = await self.get_news_urls_by_category(self.get_due_categories())
+                # 워터마크(이미 확인한 구간) 전까지만 모으고, 여러 카테고리에 올라온 URL은 한 번만 스크랩합니다.
+                news_items = await self.collect_news_items(category_news_urls)
+
+                # 각 뉴스 URL에 대해 세부 정보를 동시에 스크랩
+                new_md5s = await self.scrape_articles(
+                    news_items,
+                    lambda item: self.scrape_news_with_all_rules(*item),
+                    get_url=lambda item: item[0],
+                    )
+
+                # 카테고리별 새 기사 비율로 다음 게시판 확인 주기를 정하고 워터마크를 갱신합니다.
+                for category, news_urls in category_news_urls.items():
+                    self.record_poll(category, news_urls, new_md5s)
+                    self.update_watermark(category, news_urls)
+
+                # 쓰기 큐에 남은 뉴스 데이터를 모두 저장
+                await self.flush_news_data()
 
                 # 최종 세션 로그 저장
-                self.finalize_session_log()
+                await self.finalize_session_log()
 
-                await asyncio.sleep(self.interval_time_sleep)
+                await self.wait_for_next_poll()
 
             except Exception as e:
                 stack_trace = traceback.format_exc()
@@ -230,12 +216,6 @@ class NaverNewsScraper(NewsScraper):
                 self.process_err_log_msg(err_message, "scrape_news", stack_trace, e)
                 await asyncio.sleep(self.retry_delay)
 
-    def get_feed_entries(self):
-        pass
-
-    async def scrape_each_feed_entry(self, entry):
-        pass
-
 
 # 네이버 뉴스 스크래핑 함수
 async def scrape_naver_news():
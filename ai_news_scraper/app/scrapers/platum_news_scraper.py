@@ -1,16 +1,9 @@
 import asyncio
-import random
-import hashlib
 import traceback
-import types
-
-import feedparser
-from bs4 import BeautifulSoup
 
 from app.common.core.base_news_scraper import NewsScraper
-from app.models_init import EtcNews
 from app.scrapers.urls import URLs
-from app.common.core.utils import preprocess_datetime_rfc2822, normal_text, truncate_content, process_content
+from app.common.core.utils import preprocess_datetime_rfc2822
 
 
 class PlatumNewsScraper(NewsScraper):
@@ -22,6 +15,8 @@ class PlatumNewsScraper(NewsScraper):
         platum_urls = URLs(scraper_name)
         urls = platum_urls.urls
         self.news_board_url = urls['news_board_url']
+        self.feed_urls = urls.get('feed_urls', [])    # 피드가 있으면 피드 우선 수집
+        self.feed_media = "platum"
 
     def preprocess_datetime(self, unprocessed_date):
         """날짜 전처리 함수
@@ -43,130 +38,31 @@ class PlatumNewsScraper(NewsScraper):
                 self.process_err_log_msg(err_message, "preprocess_datetime", stack_trace, e)
                 return None
 
-    def get_feed_entries(self):
-        try:
-            info_message = f"GETTING NEWS URLS FROM {self.news_board_url}"
-            self.process_info_log_msg(info_message, type="info")
-
-            # 피드파서를 이용해서 RSS 피드를 가져옵니다.
-            feed = feedparser.parse(self.news_board_url)
-            entries = feed.entries
-
-            if len(entries) == 0:
-                err_message = f"NO FEED ENTRIES WERE FOUND FROM {self.news_board_url}"
-                self.process_err_log_msg(err_message, "get_feed_entries", None, None)
-                return None
-            else:
-                for entry in entries:
-                    yield entry
-        except Exception as e:
-            stack_trace = traceback.format_exc()
-            err_message = "THERE WAS AN ERROR WHILE GETTING FEED ENTRIES"
-            self.process_err_log_msg(err_message, "get_feed_entries", stack_trace, e)
-            return None
-
-    async def scrape_each_feed_entry(self, entry):
-        try:
-            # 기사 URL을 가져옵니다.
-            url = entry.link
-            info_message = f"SCRAPING STARTED FOR {url}"
-            self.process_info_log_msg(info_message, type="info")
-
-            title = entry.title
-            create_date = entry.published
-            content_html = entry.content[0].value
-            kind = entry.tags[0].term
-            media = "platum"
-
-            # 기사 HTML을 가져옵니다.
-            soup = BeautifulSoup(content_html, 'html.parser')
-            content = soup.get_text()
-            extracted_data = self.extract_news_details(soup, ['image_url'])
-            image_url = extracted_data.get('image_url')
-
-            # title이나 content가 없으면 다음 데이터로 넘어갑니다.
-            if not title or not content:
-                err_message = f"TITLE OR CONTENT IS EMPTY FOR URL: {url}"
-                self.process_err_log_msg(err_message, "scrape_each_feed_entry", "", "")
-                return None
-
-            url_md5 = hashlib.md5(url.encode()).hexdigest()
-            preprocessed_create_date = self.preprocess_datetime(create_date)
-            if self.category_dict.get(self.scraper_name).get(kind):
-                kind_id = self.category_dict.get(self.scraper_name).get(kind)
-            else:
-                kind_id = self.category_dict.get(self.scraper_name).get("etc")
-            norm_title = normal_text(title)
-            content = truncate_content(content)
-            content = process_content(content)
-
-            news_data = EtcNews(
-                url=url,
-                url_md5=url_md5,
-                title=title,
-                content=content,
-                create_date=preprocessed_create_date,
-                image_url=image_url,
-                portal=self.scraper_name,
-                media=media,
-                kind=kind_id,
-                # category="",
-                norm_title=norm_title,
-                )
-            return news_data
-
-        except Exception as e:
-            stack_trace = traceback.format_exc()
-            err_message = f"THERE WAS AN ERROR WHILE SCRAPING: {url}"
-            self.process_err_log_msg(err_message, "scrape_each_feed_entry", stack_trace, e)
-            return None
-
     async def scrape_news(self):
         while True:
             try:
                 # 세션 로그 초기화
                 self.initialize_session_log()
 
-                # 뉴스 데이터 리스트 초기화
-                self.news_data_list = []
-
-                # 피드 엔트리를 가져옵니다.
-                feed_entries = self.get_feed_entries()
-                if not isinstance(feed_entries, types.GeneratorType):
-                    err_message = "FEED ENTRIES IS NOT A GENERATOR"
+                # 피드 필드로 뉴스 데이터를 바로 만들고, 피드에 없는 필드만 기사 페이지에서 가져옵니다.
+                feed_urls, new_md5s = await self.scrape_feed_or_board()
+                if not isinstance(feed_urls, list):
+                    err_message = "FEED ENTRIES IS NOT A LIST"
                     self.process_err_log_msg(err_message, "scrape_news", None, None)
                     return None
 
-                # 피드 엔트리를 순회하며 기사를 스크랩합니다.
-                for entry in feed_entries:
-                    news_data = None
-                    news_url = entry.link
-
-                    # 에러 로그 개별 초기화
-                    self.initialize_error_log(news_url)
-
-                    self.session_log['total_records_processed'] += 1
-                    if not self.is_already_scraped(news_url):
-                        await asyncio.sleep(random.randint(1, 5))
-
-                        # 각 뉴스 URL에 대해 세부 정보 스크랩
-                        news_data = await self.scrape_each_feed_entry(entry)
-                    else:
-                        self.is_duplicated = True
-                        err_message = f"NEWS ALREADY EXISTS IN DATABASE: {news_url}"
-                        self.process_err_log_msg(err_message, "scrape_news", "", "")
-
-                    # 뉴스 데이터에 에러가 있으면, 에러 로그를 append하고, 그렇지 않으면 뉴스 데이터를 리스트에 추가
-                    self.check_error(news_data, news_url)
+                # 새 기사 비율로 다음 피드 확인 주기를 정하고 워터마크를 갱신합니다.
+                self.record_poll(None, feed_urls, new_md5s)
+                self.update_watermark(None, feed_urls)
 
-                # 뉴스 데이터베이스에 한 번에 저장
-                self.save_news_data_bulk(self.news_data_list)
+                # 쓰기 큐에 남은 뉴스 데이터를 모두 저장
+                await self.flush_news_data()
 
                 # 최종 세션 로그 저장
-                self.finalize_session_log()
+                await self.finalize_session_log()
 
-                # 모든 스크래핑이 끝나면 일정 시간 대기
-                await asyncio.sleep(self.interval_time_sleep)
+                # 다음 피드 확인 시각까지 대기
+                await self.wait_for_next_poll()
 
             except Exception as e:
                 stack_trace = traceback.format_exc()
@@ -174,7 +70,7 @@ class PlatumNewsScraper(NewsScraper):
                 self.process_err_log_msg(err_message, "scrape_news", stack_trace, e)
                 await asyncio.sleep(self.retry_delay)
 
-    def get_news_urls(self):
+    async def get_news_urls(self):
         pass
 
     async def scrape_each_news(self, news_url):
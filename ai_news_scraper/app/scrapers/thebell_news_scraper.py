@@ -1,17 +1,13 @@
 import asyncio
 import datetime
-import random
 import hashlib
 import traceback
-import types
 
-import requests
 from bs4 import BeautifulSoup
 
 from app.common.core.base_news_scraper import NewsScraper
 from app.models_init import EtcNews
 from app.scrapers.urls import URLs
-from app.common.core.utils import normal_text, truncate_content, process_content
 
 
 class TheBellNewsScraper(NewsScraper):
@@ -23,6 +19,8 @@ class TheBellNewsScraper(NewsScraper):
         thebell_urls = URLs(scraper_name)
         urls = thebell_urls.urls
         self.news_board_url = urls['news_board_url']
+        self.feed_urls = urls.get('feed_urls', [])    # 피드가 있으면 피드 우선 수집
+        self.sitemap_urls = urls.get('sitemap_urls', [])  # 사이트맵이 있으면 게시판 대신 사용
         self.base_url = urls['base_url']
 
     def preprocess_datetime(self, unprocessed_date):
@@ -50,14 +48,16 @@ class TheBellNewsScraper(NewsScraper):
             self.process_err_log_msg(err_message, "preprocess_datetime", stack_trace, e)
             return None
 
-    def get_news_urls(self):
+    async def get_news_urls(self):
         try:
             info_message = f"GETTING NEWS URLS FROM {self.news_board_url}"
             self.process_info_log_msg(info_message, type="info")
 
             # 뉴스 기사 URL을 가져옵니다.
-            response = requests.get(self.news_board_url)
-            soup = BeautifulSoup(response.text, 'html.parser')
+            html = await self.fetch_listing(self.news_board_url)
+            if html is None:
+                return None
+            soup = BeautifulSoup(html, 'html.parser')
             links = soup.select_one(".newsList > .listBox").find_all('a', href=True)
 
             if len(links) == 0:
@@ -65,9 +65,7 @@ class TheBellNewsScraper(NewsScraper):
                 self.process_err_log_msg(err_message, "get_news_urls", None, None)
                 return None
             else:
-                for link in links:
-                    if 'ArticleView.asp' in link['href']:
-                        yield self.base_url.format(link['href'])
+                return [self.base_url.format(link['href']) for link in links if 'ArticleView.asp' in link['href']]
         except Exception as e:
             stack_trace = traceback.format_exc()
             err_message = "THERE WAS AN ERROR WHILE GETTING NEWS URLS"
@@ -75,26 +73,8 @@ class TheBellNewsScraper(NewsScraper):
             return None
 
     async def scrape_each_news(self, news_url):
-        total_extracted_data = {}
-        elements = self.parsing_rules_dict.keys()
-        elements_for_bs = []
-        elements_for_trafilatura = []
-
-        for element in elements:
-            method = self.parsing_rules_dict.get(element)[0]
-            if method == "bs":
-                elements_for_bs.append(element)
-            elif method == "trafilatura":
-                elements_for_trafilatura.append(element)
-
-        if elements_for_bs:
-            extracted_data_with_bs = await self.scrape_each_news_with_bs(news_url, elements_for_bs)
-            if extracted_data_with_bs:
-                total_extracted_data.update(extracted_data_with_bs)
-        if elements_for_trafilatura:
-            extracted_data_with_trafilatura = await self.scrape_each_news_with_trafilatura(news_url, elements_for_trafilatura)
-            if extracted_data_with_trafilatura:
-                total_extracted_data.update(extracted_data_with_trafilatura)
+        # 기사를 한 번만 내려받아 bs, trafilatura 파싱 규칙을 모두 적용합니다.
+        total_extracted_data = await self.scrape_each_news_with_document(news_url) or {}
 
         title = total_extracted_data.get('title')
         content = total_extracted_data.get('content')
@@ -112,9 +92,10 @@ class TheBellNewsScraper(NewsScraper):
         url_md5 = hashlib.md5(news_url.encode()).hexdigest()
         preprocessed_create_date = self.preprocess_datetime(create_date)
         kind_id = self.category_dict.get(self.scraper_name).get("etc")
-        norm_title = normal_text(title)
-        content = truncate_content(content)
-        content = process_content(content)
+        # 제목 정규화와 본문 정제는 추출 프로세스 풀에서 실행합니다.
+        normalized = await self.normalize_news_text(title, content)
+        norm_title = normalized['norm_title']
+        content = normalized['content']
 
         news_data = EtcNews(
             url=news_url,
@@ -137,42 +118,25 @@ class TheBellNewsScraper(NewsScraper):
                 # 세션 로그 초기화
                 self.initialize_session_log()
 
-                # 뉴스 데이터 리스트 초기화
-                self.news_data_list = []
-
-                news_urls = self.get_news_urls()
-                if not isinstance(news_urls, types.GeneratorType):
-                    err_message = "GET_NEWS_URLS DOES NOT RETURN A GENERATOR. CHECK THE 'news_board_url' OR THE RETURN VALUE OF FUNCTION 'get_news_urls'"
+                # 피드가 있으면 피드 필드로, 없으면 게시판의 기사를 워터마크(이미 확인한 구간) 전까지 동시에 스크랩
+                news_urls, new_md5s = await self.scrape_feed_or_board()
+                if not isinstance(news_urls, list):
+                    err_message = "GET_NEWS_URLS DOES NOT RETURN A LIST. CHECK THE 'news_board_url' OR THE RETURN VALUE OF FUNCTION 'get_news_urls'"
                     self.process_err_log_msg(err_message, "scrape_news", "", "")
                     return None
 
-                for news_url in news_urls:
-                    news_data = None
-                    # 에러 로그 개별 초기화
-                    self.initialize_error_log(news_url)
-
-                    self.session_log['total_records_processed'] += 1
-                    if not self.is_already_scraped(news_url):
-                        await asyncio.sleep(random.randint(1, 5))
-
-                        # 각 뉴스 URL에 대해 세부 정보 스크랩
-                        news_data = await self.scrape_each_news(news_url)
-                    else:
-                        self.is_duplicated = True
-                        err_message = f"NEWS ALREADY EXISTS IN DATABASE: {news_url}"
-                        self.process_err_log_msg(err_message, "scrape_news", "", "")
+                # 새 기사 비율로 다음 게시판 확인 주기를 정하고 워터마크를 갱신합니다.
+                self.record_poll(None, news_urls, new_md5s)
+                self.update_watermark(None, news_urls)
 
-                    # 뉴스 데이터에 에러가 있으면, 에러 로그를 append하고, 그렇지 않으면 뉴스 데이터를 리스트에 추가
-                    self.check_error(news_data, news_url)
-
-                # 뉴스 데이터베이스에 한 번에 저장
-                self.save_news_data_bulk(self.news_data_list)
+                # 쓰기 큐에 남은 뉴스 데이터를 모두 저장
+                await self.flush_news_data()
 
                 # 최종 세션 로그 저장
-                self.finalize_session_log()
+                await self.finalize_session_log()
 
-                # 모든 스크래핑이 끝나면 일정 시간 대기
-                await asyncio.sleep(self.interval_time_sleep)
+                # 다음 게시판 확인 시각까지 대기
+                await self.wait_for_next_poll()
 
             except Exception as e:
                 stack_trace = traceback.format_exc()
@@ -180,12 +144,6 @@ class TheBellNewsScraper(NewsScraper):
                 self.process_err_log_msg(err_message, "scrape_news", stack_trace, e)
                 await asyncio.sleep(self.retry_delay)
 
-    def get_feed_entries(self):
-        pass
-
-    async def scrape_each_feed_entry(self, entry):
-        pass
-
 
 # The Bell 뉴스 스크래핑 함수
 async def scrape_thebell_news():
@@ -31,9 +31,11 @@ class URLs:
 
         elif self.portal == 'venturesquare':
             self.urls['news_board_url'] = self.get_vs_newsboard_url()
+            self.urls['feed_urls'] = [self.get_vs_newsboard_url()]
 
         elif self.portal == 'platum':
             self.urls['news_board_url'] = self.get_platum_newsboard_url()
+            self.urls['feed_urls'] = [self.get_platum_newsboard_url()]
 
         elif self.portal == 'esg_economy':
             self.urls['news_board_url_economy'] = self.get_esgeconomy_newsboard_url1()
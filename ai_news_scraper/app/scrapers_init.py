@@ -12,3 +12,18 @@ from app.scrapers.esg_finance_news_scraper import scrape_esg_finance_news
 
 from app.scrapers.esg_finance_hub_scraper import  scrape_esg_finance_hub
 from app.scrapers.missing_news_scraper import scrape_missing_news
+
+# 포털 이름별 스크래퍼 실행 함수 (scraper_supervisor가 워커 프로세스에서 실행)
+PORTAL_SCRAPERS = {
+    'zdnet': scrape_zdnet_news,
+    'daum': scrape_daum_news,
+    'naver': scrape_naver_news,
+    'vs': scrape_vs_news,
+    'thebell': scrape_thebell_news,
+    'startupn': scrape_startupn_news,
+    'startuptoday': scrape_startuptoday_news,
+    'platum': scrape_platum_news,
+    'esg': scrape_esg_news,
+    'greenpost': scrape_greenpost_news,
+    'esg_finance': scrape_esg_finance_news,
+}
@@ -0,0 +1,97 @@
+from fastapi import APIRouter
+
+from app.common.core.http_client import http_client
+from app.common.core.extraction_executor import extraction_executor
+from app.common.core.concurrency_limiter import concurrency_limiter
+from app.common.core.host_rate_limiter import host_rate_limiter
+from app.common.core.url_index import url_index
+from app.common.core.listing_watermark import listing_watermarks
+from app.common.core.listing_cache import listing_cache
+from app.common.core.sitemap import sitemap_source
+from app.common.core.parsing_rule_cache import parsing_rule_cache
+from app.common.db.db_executor import db_executor
+from app.common.db.engine_registry import engine_registry
+from app.common.core.scraper_supervisor import scraper_supervisor
+from app.common.core.lease_manager import lease_manager
+
+
+# 공유 자원 통계 엔드포인트 (내부 구성이 드러나므로 main.py에서 verify_token 인증을 걸어 등록합니다)
+router = APIRouter()
+
+
+@router.get("/http_client")
+async def http_client_stats():
+    """공유 HTTP 클라이언트의 커넥션 재사용 통계를 반환하는 엔드포인트"""
+    return http_client.get_stats()
+
+
+@router.get("/extraction")
+async def extraction_stats():
+    """추출 프로세스 풀의 대기 작업 수와 작업별 CPU 사용 시간 통계를 반환하는 엔드포인트"""
+    return extraction_executor.get_stats()
+
+
+@router.get("/article_workers")
+async def article_worker_stats():
+    """기사 동시 스크래핑 수(전체/호스트별) 통계를 반환하는 엔드포인트"""
+    return concurrency_limiter.get_stats()
+
+
+@router.get("/hosts")
+async def host_rate_limiter_stats():
+    """호스트별 요청 속도 조절(AIMD) 통계와 속도를 줄인 호스트의 현재 속도/대기 시간을 반환하는 엔드포인트"""
+    return host_rate_limiter.get_stats()
+
+
+@router.get("/listings")
+async def listing_cache_stats():
+    """게시판/피드 조건부 요청의 304 응답 수와 바뀌지 않은 사이클당 내려받은 바이트 통계를 반환하는 엔드포인트"""
+    return listing_cache.get_stats()
+
+
+@router.get("/sitemap")
+async def sitemap_stats():
+    """사이트맵 URL 소스의 가져온 사이트맵 수, 내려받은 바이트, 새 기사 항목 수 통계를 반환하는 엔드포인트"""
+    return sitemap_source.get_stats()
+
+
+@router.get("/watermarks")
+async def listing_watermark_stats():
+    """게시판 워터마크에서 멈춘 횟수와 건너뛴 URL 비율 통계를 반환하는 엔드포인트"""
+    return listing_watermarks.get_stats()
+
+
+@router.get("/url_index")
+async def url_index_stats():
+    """URL 중복 확인 인덱스의 테이블별 크기와 적중/DB 조회 통계를 반환하는 엔드포인트"""
+    return url_index.get_stats()
+
+
+@router.get("/parsing_rules")
+async def parsing_rule_cache_stats():
+    """포털별 파싱 규칙 캐시의 적중/재로딩/버전 확인 통계를 반환하는 엔드포인트"""
+    return parsing_rule_cache.get_stats()
+
+
+@router.get("/db_executor")
+async def db_executor_stats():
+    """DB 스레드 풀의 대기 작업 수와 작업별 실행 시간 통계를 반환하는 엔드포인트"""
+    return db_executor.get_stats()
+
+
+@router.get("/db_pools")
+async def db_pool_stats():
+    """DB별 공유 커넥션 풀의 크기, 사용 중인 커넥션 수, 커넥션 대기 시간 통계를 반환하는 엔드포인트"""
+    return engine_registry.get_stats()
+
+
+@router.get("/scraper_workers")
+async def scraper_worker_stats():
+    """포털 그룹별 스크래퍼 워커 프로세스의 실행 상태, 재시작 수, 워커의 공유 자원 통계를 반환하는 엔드포인트"""
+    return scraper_supervisor.get_stats()
+
+
+@router.get("/leases")
+async def lease_stats():
+    """이 인스턴스가 점유한 포털 그룹, 살아 있는 인스턴스 수, 인스턴스별 몫 등 작업 점유 통계를 반환하는 엔드포인트"""
+    return lease_manager.get_stats()